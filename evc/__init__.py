@@ -0,0 +1,31 @@
+"""Elektrikli şarj istasyonu analiz paketi
+
+Ağır kütüphanelere (scipy, folium, plotly, pyarrow) bağlı alt sistemler ilk
+erişimde yüklenir (ör. `evc.maps`), böylece soğuk başlangıçta yalnızca ilk
+ekranın ihtiyaç duyduğu modüller içe aktarılır.
+"""
+import importlib
+import sys
+import time
+
+SUBSYSTEMS = (
+    "config", "data", "store", "spatial", "geography", "scoring", "filters", "aggregates", "hexgrid", "maps", "charts", "roi", "placement",
+    "segmentation", "reporting", "analytics", "render_cache", "timeseries", "forecasting"
+)
+
+# Alt sistem adı -> ilk yükleme süresi (saniye, bağımlılıkları dahil)
+IMPORT_TIMINGS = {}
+
+def load_subsystem(name):
+    """Alt sistemi ilk kullanımda içe aktar ve yükleme süresini kaydet"""
+    if name not in SUBSYSTEMS:
+        raise AttributeError(f"module 'evc' has no attribute {name!r}")
+    module = sys.modules.get(f"{__name__}.{name}")
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(f"{__name__}.{name}")
+        IMPORT_TIMINGS[name] = time.perf_counter() - start
+    return module
+
+def __getattr__(name):
+    return load_subsystem(name)
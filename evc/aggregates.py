@@ -0,0 +1,114 @@
+"""Operatör, şehir ve operatör x şehir düzeyinde somutlaştırılmış istasyon özetleri
+
+Özetler operatör x şehir hücrelerinde toplam ve sayım olarak tutulur
+(istasyon sayısı, soket toplamı, güç/kullanım/gelir toplamları ve dolu değer
+sayıları). Operatör ve şehir düzeyleri hücrelerin toplamıdır; ortalamalar
+toplam / sayım olarak hesaplanır. İstasyon eklenip silindiğinde yalnızca
+değişen satırların hücre toplamları eklenir veya çıkarılır, böylece
+panolar istasyon satırlarını taramadan O(grup) veriyle çalışır.
+"""
+import numpy as np
+import pandas as pd
+
+GROUP_COLUMNS = ["operatör", "sehir"]
+MEAN_COLUMNS = ["güç_kw", "kullanim_orani", "gunluk_gelir"]
+
+def cell_sums(stations_df):
+    """İstasyon satırlarının operatör x şehir hücre toplamları"""
+    frame = stations_df[GROUP_COLUMNS].astype(object)
+    frame['istasyon_sayisi'] = 1
+    frame['soket_sayisi'] = stations_df['soket_sayisi'].astype(np.float64).fillna(0).to_numpy()
+    for column in MEAN_COLUMNS:
+        values = stations_df[column].astype(np.float64)
+        frame[f"{column}_toplam"] = values.fillna(0).to_numpy()
+        frame[f"{column}_adet"] = values.notna().to_numpy(dtype=np.int64)
+    return frame.groupby(GROUP_COLUMNS, sort=False).sum()
+
+def _with_means(sums):
+    """Hücre toplamlarından operator_performance ile aynı sütunlar (sayılar + ortalamalar)"""
+    table = pd.DataFrame({
+        "istasyon_sayisi": sums['istasyon_sayisi'].astype(np.int64),
+        "soket_sayisi": sums['soket_sayisi'].round().astype(np.int64)
+    }, index=sums.index)
+    for column in MEAN_COLUMNS:
+        table[column] = sums[f"{column}_toplam"] / sums[f"{column}_adet"].where(sums[f"{column}_adet"] > 0)
+    return table
+
+class StationAggregates:
+    """Operatör x şehir hücre toplamları; değişikliklerde artımlı güncellenir"""
+
+    def __init__(self, stations_df):
+        self.cells = cell_sums(stations_df)
+
+    @classmethod
+    def _from_cells(cls, cells):
+        aggregates = cls.__new__(cls)
+        aggregates.cells = cells
+        return aggregates
+
+    def __len__(self):
+        return len(self.cells)
+
+    def apply_changes(self, removed_df=None, added_df=None):
+        """Silinen (veya güncellemeden önceki) satırları çıkar, eklenen (güncel) satırları ekle
+
+        Yeni bir nesne döndürür; eski nesneyi tutan okuyucular etkilenmez.
+        """
+        cells = self.cells
+        if removed_df is not None and len(removed_df):
+            cells = cells.sub(cell_sums(removed_df), fill_value=0)
+        if added_df is not None and len(added_df):
+            cells = cells.add(cell_sums(added_df), fill_value=0)
+        # Boşalan hücreler atılır (toplamlarda kalan kayan nokta artıkları anlamsızdır)
+        return self._from_cells(cells[cells['istasyon_sayisi'] > 0])
+
+    def _filtered(self, operators=None, cities=None):
+        cells = self.cells
+        if operators:
+            cells = cells[cells.index.get_level_values("operatör").isin(operators)]
+        if cities:
+            cells = cells[cells.index.get_level_values("sehir").isin(cities)]
+        return cells
+
+    def by(self, level, operators=None, cities=None):
+        """Operatör ("operatör") veya şehir ("sehir") başına sayılar ve ortalamalar"""
+        sums = self._filtered(operators, cities).groupby(level=level, sort=True).sum()
+        return _with_means(sums).rename_axis(level)
+
+    def by_operator_city(self, operators=None, cities=None):
+        """Operatör x şehir hücreleri başına sayılar ve ortalamalar"""
+        return _with_means(self._filtered(operators, cities).sort_index())
+
+    def counts(self, level, operators=None, cities=None):
+        """value_counts() ile aynı biçimde grup başına istasyon sayısı (azalan)"""
+        counts = self._filtered(operators, cities).groupby(level=level)['istasyon_sayisi'].sum().astype(np.int64)
+        return counts[counts > 0].sort_values(ascending=False, kind="stable").rename("count")
+
+    def operator_performance(self, cities=None):
+        """analytics.operator_performance ile aynı tablo, istasyon satırları taranmadan"""
+        return self.by("operatör", cities=cities).round(2)
+
+    def overview(self, cities=None):
+        """analytics.station_overview ile aynı özet"""
+        sums = self._filtered(cities=cities).sum()
+        count = int(sums.get('istasyon_sayisi', 0))
+        return {
+            "istasyon_sayisi": count,
+            "soket_sayisi": int(round(sums.get('soket_sayisi', 0))),
+            "ortalama_guc_kw": float(sums['güç_kw_toplam'] / sums['güç_kw_adet']) if count and sums['güç_kw_adet'] else np.nan,
+            "ortalama_kullanim": float(sums['kullanim_orani_toplam'] / sums['kullanim_orani_adet']) if count and sums['kullanim_orani_adet'] else np.nan
+        }
+
+    def city_summary(self, city):
+        """Şehir raporu özeti (bkz. reporting.city_summary)"""
+        table = self.by("sehir", cities=[city])
+        if not len(table):
+            return {"istasyon_sayisi": 0, "soket_sayisi": 0, **{column: np.nan for column in MEAN_COLUMNS},
+                    "operatorler": pd.Series(dtype=np.int64)}
+        row = table.iloc[0]
+        return {
+            "istasyon_sayisi": int(row['istasyon_sayisi']),
+            "soket_sayisi": int(row['soket_sayisi']),
+            **{column: float(row[column]) for column in MEAN_COLUMNS},
+            "operatorler": self.counts("operatör", cities=[city])
+        }
@@ -0,0 +1,241 @@
+"""Arayüzden bağımsız analiz motoru
+
+Lokasyon puanlama, ROI senaryoları, operatör özetleri ve şehir raporları
+Streamlit olmadan buradan çağrılır; arayüz ve yerel HTTP servisi (`evc.api`)
+aynı fonksiyonları kullanır.
+"""
+import numpy as np
+import pandas as pd
+
+from evc.aggregates import StationAggregates
+from evc.data import base_version, dataset_version
+from evc.roi import EXTRA_SOCKET_COST, INVESTMENT_COSTS, calculate_roi, estimate_monthly_revenue, station_power_kw
+from evc.scoring import analyze_location, score_locations
+from evc.spatial import GeoIndex
+
+OPERATOR_PERFORMANCE_LABELS = {
+    "istasyon_sayisi": "İstasyon Sayısı",
+    "soket_sayisi": "Toplam Soket",
+    "güç_kw": "Ort. Güç (kW)",
+    "kullanim_orani": "Ort. Kullanım",
+    "gunluk_gelir": "Ort. Günlük Gelir"
+}
+
+# ROI senaryosu parametreleri; `years` verilmezse 5 yıl
+ROI_SCENARIO_FIELDS = [
+    "station_type", "num_sockets", "daily_usage_hours", "price_per_kwh",
+    "monthly_electricity_cost", "monthly_maintenance", "monthly_rent"
+]
+# İsteğe bağlı kuyruk simülasyonu alanları; `arrivals_per_day` dolu satırlarda kullanım saati simülasyondan gelir
+QUEUE_SCENARIO_FIELDS = ["arrivals_per_day", "session_energy_kwh", "patience_minutes"]
+
+def station_overview(stations_df):
+    """İstasyon kümesinin özet metrikleri"""
+    empty = len(stations_df) == 0
+    return {
+        "istasyon_sayisi": len(stations_df),
+        "soket_sayisi": int(stations_df['soket_sayisi'].sum()),
+        "ortalama_guc_kw": np.nan if empty else float(stations_df['güç_kw'].mean()),
+        "ortalama_kullanim": np.nan if empty else float(stations_df['kullanim_orani'].mean())
+    }
+
+def operator_performance(stations_df):
+    """Operatör başına istasyon ve soket sayısı ile güç, kullanım ve gelir ortalamaları"""
+    return stations_df.groupby('operatör', observed=True).agg(**{
+        'istasyon_sayisi': ('istasyon_id', 'count'),
+        'soket_sayisi': ('soket_sayisi', 'sum'),
+        'güç_kw': ('güç_kw', 'mean'),
+        'kullanim_orani': ('kullanim_orani', 'mean'),
+        'gunluk_gelir': ('gunluk_gelir', 'mean')
+    }).round(2)
+
+def roi_scenarios(scenarios):
+    """Çok sayıda ROI senaryosunu tek seferde (vektörize) hesapla
+
+    `scenarios`: ROI_SCENARIO_FIELDS sütunlarını (ve isteğe bağlı `years`)
+    içeren DataFrame veya sözlük listesi. Maliyetler aylıktır. Satırda
+    `arrivals_per_day` (günlük araç talebi) verilirse gelir, kuyruk
+    simülasyonunda gerçekleşen enerjiden hesaplanır (bkz. evc.queueing) ve
+    `daily_usage_hours` gerekmez; simülasyonun doluluk ve geri çevirme oranı
+    sonuca eklenir.
+    """
+    scenarios = pd.DataFrame(scenarios)
+    simulated = (
+        scenarios['arrivals_per_day'].notna().to_numpy() if 'arrivals_per_day' in scenarios
+        else np.zeros(len(scenarios), dtype=bool)
+    )
+    if 'daily_usage_hours' not in scenarios and simulated.all():
+        scenarios['daily_usage_hours'] = np.nan
+    missing = [field for field in ROI_SCENARIO_FIELDS if field not in scenarios.columns]
+    if missing:
+        raise ValueError(f"Eksik senaryo alanları: {', '.join(missing)}")
+    unknown = sorted(set(scenarios['station_type']) - set(INVESTMENT_COSTS))
+    if unknown:
+        raise ValueError(f"Bilinmeyen istasyon tipi: {', '.join(map(str, unknown))}")
+
+    num_sockets = scenarios['num_sockets'].to_numpy(dtype=np.float64)
+    years = scenarios['years'].fillna(5).to_numpy(dtype=np.float64) if 'years' in scenarios else 5.0
+    investment = scenarios['station_type'].map(INVESTMENT_COSTS).to_numpy(dtype=np.float64) + (num_sockets - 2) * EXTRA_SOCKET_COST
+    power_kw = scenarios['station_type'].map({station_type: station_power_kw(station_type) for station_type in INVESTMENT_COSTS})
+    usage_hours = scenarios['daily_usage_hours'].to_numpy(dtype=np.float64)
+    queue = None
+    if simulated.any():
+        from evc.queueing import PATIENCE_MINUTES, SESSION_ENERGY_KWH, simulate_scenarios
+
+        rows = scenarios[simulated]
+        queue = pd.DataFrame(np.nan, index=scenarios.index, columns=["daily_energy_kwh", "utilization", "turn_away_rate"])
+        summaries = simulate_scenarios(
+            power_kw[simulated].to_numpy(dtype=np.float64), rows['num_sockets'].to_numpy(),
+            rows['arrivals_per_day'].to_numpy(dtype=np.float64),
+            rows['session_energy_kwh'].fillna(SESSION_ENERGY_KWH).to_numpy(dtype=np.float64) if 'session_energy_kwh' in rows else SESSION_ENERGY_KWH,
+            rows['patience_minutes'].fillna(PATIENCE_MINUTES).to_numpy(dtype=np.float64) if 'patience_minutes' in rows else PATIENCE_MINUTES
+        )
+        queue.loc[simulated] = summaries[list(queue.columns)].to_numpy()
+        usage_hours = usage_hours.copy()
+        usage_hours[simulated] = summaries['equivalent_usage_hours'].to_numpy()
+    monthly_revenue = estimate_monthly_revenue(
+        power_kw.to_numpy(dtype=np.float64), usage_hours, num_sockets, scenarios['price_per_kwh'].to_numpy(dtype=np.float64)
+    )
+    monthly_cost = scenarios[['monthly_electricity_cost', 'monthly_maintenance', 'monthly_rent']].sum(axis=1).to_numpy(dtype=np.float64)
+
+    with np.errstate(divide="ignore"):
+        roi = calculate_roi(investment, monthly_revenue, monthly_cost * 12, years)
+    results = pd.DataFrame({
+        "investment": investment,
+        "power_kw": power_kw.to_numpy(dtype=np.float64),
+        "daily_usage_hours": usage_hours,
+        "monthly_revenue": monthly_revenue,
+        "monthly_cost": monthly_cost,
+        "monthly_profit": monthly_revenue - monthly_cost,
+        "roi": roi['roi'],
+        "payback_period": roi['payback_period'],
+        "annual_profit": roi['annual_profit'],
+        "total_profit": roi['total_profit']
+    }, index=scenarios.index)
+    return results if queue is None else results.join(queue)
+
+def roi_scenario(station_type, num_sockets, daily_usage_hours, price_per_kwh, monthly_electricity_cost,
+                 monthly_maintenance, monthly_rent, years=5, **queue_options):
+    """Tek ROI senaryosu (ROI hesaplayıcı ekranı); `queue_options`: QUEUE_SCENARIO_FIELDS alanları"""
+    return roi_scenarios([{
+        "station_type": station_type,
+        "num_sockets": num_sockets,
+        "daily_usage_hours": daily_usage_hours,
+        "price_per_kwh": price_per_kwh,
+        "monthly_electricity_cost": monthly_electricity_cost,
+        "monthly_maintenance": monthly_maintenance,
+        "monthly_rent": monthly_rent,
+        "years": years,
+        **queue_options
+    }]).iloc[0].to_dict()
+
+def socket_sweep_roi(station_type, socket_counts, arrivals_per_day, price_per_kwh, monthly_cost, years=5, **queue_options):
+    """Soket sayısı taraması: aynı talep altında gerçekleşen enerji, doluluk, geri çevirme ve ROI"""
+    from evc.queueing import socket_sweep
+
+    sweep = socket_sweep(station_power_kw(station_type), socket_counts, arrivals_per_day, **queue_options)
+    num_sockets = sweep.index.to_numpy(dtype=np.float64)
+    sweep['investment'] = INVESTMENT_COSTS[station_type] + (num_sockets - 2) * EXTRA_SOCKET_COST
+    sweep['monthly_revenue'] = estimate_monthly_revenue(
+        station_power_kw(station_type), sweep['equivalent_usage_hours'].to_numpy(), num_sockets, price_per_kwh
+    )
+    with np.errstate(divide="ignore"):
+        roi = calculate_roi(sweep['investment'].to_numpy(), sweep['monthly_revenue'].to_numpy(), monthly_cost * 12, years)
+    sweep['roi'] = roi['roi']
+    sweep['payback_period'] = roi['payback_period']
+    return sweep
+
+class AnalyticsEngine:
+    """Bir veri sürümüne bağlı analiz motoru (uzamsal indeks ve operatör/şehir özetleri bir kez kurulur)"""
+
+    def __init__(self, stations_df, demographic_df, station_index=None, demand_model=None, aggregates=None, dataset=None):
+        self.stations_df = stations_df
+        self.demographic_df = demographic_df
+        self.version = dataset_version(stations_df)
+        self.station_index = station_index or GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+        self.aggregates = aggregates if aggregates is not None else StationAggregates(stations_df)
+        self.dataset = dataset
+        self._demand_model = demand_model
+
+    @property
+    def demand_model(self):
+        """Talep modeli; arka plan işi bitene kadar veya eğitilemezse None (puanlar demografik potansiyelle hesaplanır)"""
+        if self._demand_model is None:
+            job = self.demand_model_job()
+            if job.done():
+                self._demand_model = job.result()
+        return self._demand_model
+
+    def demand_model_job(self):
+        """Temel sürümün talep modeli işi (bkz. forecasting.demand_model_job); ilk çağrıda başlatılır"""
+        from evc.forecasting import demand_model_job
+
+        return demand_model_job(base_version(self.version), self.stations_df, self.demographic_df, self.station_index)
+
+    @classmethod
+    def from_dataset(cls, dataset, demographic_df, demand_model=None):
+        """Paylaşılan veri setinin (store.StationDataset) güncel sürümüne bağlı motor
+
+        Uzamsal indeks ve özetler veri setinden alınır; içe aktarımlarda veri
+        seti bunları artımlı günceller veya yalnızca sürüm değişince yeniden kurar.
+        Model verilmezse yükleme/eğitim arka planda hemen başlatılır.
+        """
+        stations_df = dataset.refresh()
+        version = dataset_version(stations_df)
+        engine = cls(
+            stations_df, demographic_df, dataset.station_index(version), demand_model, dataset.aggregates(version), dataset
+        )
+        if demand_model is None:
+            engine.demand_model_job()
+        return engine
+
+    @classmethod
+    def from_store(cls):
+        """Motoru kalıcı depodan yükle (depo yoksa bir kez üretilir); içe aktarımlar `refresh()` ile uygulanır"""
+        from evc.store import StationDataset, ensure_demographic_store, ensure_station_store, load_demographic_store
+
+        ensure_station_store()
+        ensure_demographic_store()
+        return cls.from_dataset(StationDataset(), load_demographic_store())
+
+    def refresh(self):
+        """Depoya yeni değişiklik birleştirildiyse güncel sürümün motoru, yoksa kendisi
+
+        Veri setine bağlı olmayan motor değişmez. Talep modeli temel sürüm
+        değişmedikçe yeni motora aktarılır.
+        """
+        if self.dataset is None or self.dataset.refresh() is self.stations_df:
+            return self
+        engine = type(self).from_dataset(self.dataset, self.demographic_df)
+        if base_version(engine.version) == base_version(self.version):
+            engine._demand_model = self._demand_model
+        return engine
+
+    def score(self, lats, lngs):
+        """Koordinat dizisini puanla (bkz. score_locations)"""
+        return score_locations(lats, lngs, self.stations_df, self.demographic_df, self.station_index, self.demand_model)
+
+    def analyze(self, lat, lng):
+        """Tek konumun ayrıntılı analizi (bkz. analyze_location)"""
+        return analyze_location(lat, lng, self.stations_df, self.demographic_df, self.station_index, self.demand_model)
+
+    def roi(self, scenarios):
+        return roi_scenarios(scenarios)
+
+    def operators(self, cities=None):
+        """Operatör performans tablosu (isteğe bağlı şehir filtresiyle)"""
+        return self.aggregates.operator_performance(cities)
+
+    def overview(self, cities=None):
+        return self.aggregates.overview(cities)
+
+    def city_report(self, city, report_type, include_maps=True, include_financials=True):
+        """Şehir raporu (içerik + HTML/PDF), arayüzdeki rapor ile aynı"""
+        from evc.reporting import generate_city_report
+
+        if city not in set(self.demographic_df['sehir']):
+            raise ValueError(f"Bilinmeyen şehir: {city}")
+        return generate_city_report(
+            city, report_type, self.demographic_df, self.stations_df, include_maps, include_financials, self.version,
+            self.aggregates
+        )
@@ -0,0 +1,223 @@
+"""Analiz motoru için yerel toplu (batch) HTTP servisi
+
+    python -m evc.api --host 127.0.0.1 --port 8765
+
+Yalnızca standart kütüphane (asyncio) kullanılır. Bağlantılar olay
+döngüsünde karşılanır; hesaplamalar bir iş parçacığı havuzunda çalışır
+(NumPy ve KD-ağacı sorguları GIL'i bırakır), böylece uzun bir toplu istek
+diğer istekleri bekletmez. Her istekte depo manifesti kontrol edilir;
+`evc.ingest` ile birleştirilen değişiklikler artımlı uygulanır. Talep modeli
+arka planda eğitilir; hazır olana kadar puanlar model olmadan döner.
+
+Uç noktalar (JSON):
+    GET  /health                       veri sürümü, istasyon sayısı ve talep modelinin hazır olup olmadığı
+    GET  /operators?city=Ankara        operatör performans tablosu
+    POST /score   {"lat": [...], "lng": [...]} veya {"locations": [{"lat": .., "lng": ..}]}
+    POST /roi     {"scenarios": [{"station_type": .., "num_sockets": .., ...}]}
+                  (isteğe bağlı "arrivals_per_day": gelir kuyruk simülasyonundan)
+    POST /report  {"city": .., "report_type": .., "include_maps": .., "include_financials": .., "format": "html" | "pdf"}
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+
+from evc.analytics import AnalyticsEngine
+
+API_HOST = "127.0.0.1"
+API_PORT = 8765
+API_WORKERS = 4
+MAX_BODY_BYTES = 64 * 1024 * 1024  # ~1M koordinatlık puanlama isteği
+MAX_BATCH_ROWS = 2_000_000
+
+class ApiError(Exception):
+    """İstemciye HTTP durum koduyla döndürülen hata"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def _frame_json(df):
+    """DataFrame -> kayıt listesi JSON'u (NaN -> null, kategoriler -> metin)"""
+    return df.to_json(orient="records", force_ascii=False)
+
+def _batch_size(rows):
+    if rows > MAX_BATCH_ROWS:
+        raise ApiError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, f"En fazla {MAX_BATCH_ROWS:,} satır gönderilebilir")
+    return rows
+
+class AnalyticsServer:
+    """Analiz motorunu HTTP üzerinden sunan asyncio sunucusu"""
+
+    def __init__(self, engine, workers=API_WORKERS):
+        from evc.reporting import ReportService
+
+        self.engine = engine
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evc-api")
+        self.reports = ReportService()
+        self.routes = {
+            ("GET", "/health"): self.health,
+            ("GET", "/operators"): self.operators,
+            ("POST", "/score"): self.score,
+            ("POST", "/roi"): self.roi,
+            ("POST", "/report"): self.report
+        }
+
+    async def _compute(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
+
+    async def _current_engine(self):
+        """İçe aktarılan değişiklikleri uygula; motor yalnızca veri sürümü değişince yenilenir"""
+        self.engine = await self._compute(self.engine.refresh)
+        return self.engine
+
+    # Uç noktalar: (durum, içerik tipi, gövde) döndürür
+
+    async def health(self, query, payload):
+        engine = await self._current_engine()
+        body = {
+            "status": "ok", "dataset_version": engine.version, "stations": len(engine.stations_df),
+            "demand_model_ready": engine.demand_model is not None
+        }
+        return HTTPStatus.OK, "application/json", json.dumps(body, ensure_ascii=False)
+
+    async def operators(self, query, payload):
+        engine = await self._current_engine()
+        table = await self._compute(engine.operators, query.get("city"))
+        return HTTPStatus.OK, "application/json", f'{{"results": {_frame_json(table.reset_index())}}}'
+
+    async def score(self, query, payload):
+        if "locations" in payload:
+            locations = payload["locations"]
+            lats = [location["lat"] for location in locations]
+            lngs = [location["lng"] for location in locations]
+        else:
+            lats, lngs = payload["lat"], payload["lng"]
+        if len(lats) != len(lngs):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "'lat' ve 'lng' aynı uzunlukta olmalı")
+        _batch_size(len(lats))
+        lats = np.asarray(lats, dtype=np.float64)
+        lngs = np.asarray(lngs, dtype=np.float64)
+        engine = await self._current_engine()
+        scores = await self._compute(engine.score, lats, lngs)
+        return HTTPStatus.OK, "application/json", f'{{"count": {len(scores)}, "results": {_frame_json(scores)}}}'
+
+    async def roi(self, query, payload):
+        scenarios = payload["scenarios"]
+        _batch_size(len(scenarios))
+        results = await self._compute(self.engine.roi, scenarios)
+        return HTTPStatus.OK, "application/json", f'{{"count": {len(results)}, "results": {_frame_json(results)}}}'
+
+    async def report(self, query, payload):
+        from evc.reporting import REPORT_TYPES
+
+        engine = await self._current_engine()
+        city = payload["city"]
+        if city not in set(engine.demographic_df['sehir']):
+            raise ApiError(HTTPStatus.NOT_FOUND, f"Bilinmeyen şehir: {city}")
+        report_type = payload.get("report_type", REPORT_TYPES[0])
+        if report_type not in REPORT_TYPES:
+            raise ApiError(HTTPStatus.BAD_REQUEST, f"Rapor tipi şunlardan biri olmalı: {', '.join(REPORT_TYPES)}")
+        report_format = payload.get("format", "html")
+        if report_format not in ("html", "pdf"):
+            raise ApiError(HTTPStatus.BAD_REQUEST, "Biçim 'html' veya 'pdf' olmalı")
+
+        # Rapor servisi aynı anahtarlı istekleri önbellekten veya süren işten karşılar
+        future = self.reports.submit(
+            city, report_type, payload.get("include_maps", True), payload.get("include_financials", True),
+            engine.version, engine.demographic_df, engine.stations_df
+        )
+        report = await asyncio.wrap_future(future)
+        if report_format == "pdf":
+            return HTTPStatus.OK, "application/pdf", report["pdf"]
+        return HTTPStatus.OK, "text/html; charset=utf-8", report["html"]
+
+    async def dispatch(self, method, target, body):
+        """İsteği uç noktaya yönlendir; hataları JSON hata gövdesine çevir"""
+        url = urlsplit(target)
+        handler = self.routes.get((method, url.path))
+        try:
+            if handler is None:
+                known_path = any(path == url.path for _, path in self.routes)
+                raise ApiError(HTTPStatus.METHOD_NOT_ALLOWED if known_path else HTTPStatus.NOT_FOUND, f"{method} {url.path}")
+            query = parse_qs(url.query)
+            payload = json.loads(body) if body else {}
+            if not isinstance(payload, dict):
+                raise ApiError(HTTPStatus.BAD_REQUEST, "İstek gövdesi bir JSON nesnesi olmalı")
+            return await handler(query, payload)
+        except ApiError as error:
+            status, message = error.status, str(error)
+        except json.JSONDecodeError as error:
+            status, message = HTTPStatus.BAD_REQUEST, f"Geçersiz JSON: {error}"
+        except KeyError as error:
+            status, message = HTTPStatus.BAD_REQUEST, f"Eksik alan: {error.args[0]}"
+        except (TypeError, ValueError) as error:
+            status, message = HTTPStatus.BAD_REQUEST, str(error)
+        except Exception as error:
+            status, message = HTTPStatus.INTERNAL_SERVER_ERROR, f"{type(error).__name__}: {error}"
+        body = json.dumps({"error": message}, ensure_ascii=False)
+        return status, "application/json", body
+
+    async def handle_connection(self, reader, writer):
+        """HTTP/1.1 bağlantısı (keep-alive destekli)"""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, version = request_line.decode("latin-1").split()
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY_BYTES:
+                    status, content_type, body = HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "application/json", '{"error": "İstek gövdesi çok büyük"}'
+                    keep_alive = False
+                else:
+                    body = await reader.readexactly(length) if length else b""
+                    status, content_type, body = await self.dispatch(method, target, body)
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+                if isinstance(body, str):
+                    body = body.encode("utf-8")
+                writer.write(
+                    f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                    f"Content-Type: {content_type}\r\n"
+                    f"Content-Length: {len(body)}\r\n"
+                    f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve(self, host=API_HOST, port=API_PORT):
+        server = await asyncio.start_server(self.handle_connection, host, port, limit=MAX_BODY_BYTES)
+        async with server:
+            print(f"Analiz servisi http://{host}:{port} adresinde (veri sürümü {self.engine.version})")
+            await server.serve_forever()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Analiz motoru için yerel HTTP servisi")
+    parser.add_argument("--host", default=API_HOST)
+    parser.add_argument("--port", type=int, default=API_PORT)
+    parser.add_argument("--workers", type=int, default=API_WORKERS, help="Hesaplama iş parçacığı sayısı")
+    args = parser.parse_args(argv)
+
+    server = AnalyticsServer(AnalyticsEngine.from_store(), args.workers)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+if __name__ == "__main__":
+    main()
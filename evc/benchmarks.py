@@ -0,0 +1,334 @@
+"""Veri ve analiz sıcak yolları için performans ölçümleri
+
+    python -m evc.benchmarks                       # 250 .. 10M istasyon
+    python -m evc.benchmarks --sizes 250 100000 --plot scaling.png
+
+Her ölçüm için en iyi süre (birkaç tekrarın en kısası) ve tracemalloc ile
+ayrı bir çalıştırmada tepe bellek kaydedilir. Sonuçlar JSON satırları olarak
+biriktirilir; her çalıştırma bir önceki çalıştırmayla karşılaştırılır ve
+boyuta göre ölçeklenme üssü (log-log eğim) yazdırılır.
+"""
+import argparse
+import gc
+import json
+import platform
+import subprocess
+import time
+import tracemalloc
+import uuid
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from evc.config import CITIES, DATA_DIR
+
+BENCHMARK_SIZES = (250, 10_000, 100_000, 1_000_000, 10_000_000)
+BENCHMARK_RESULTS = DATA_DIR / "benchmarks" / "results.jsonl"
+BENCHMARK_SEED = 42
+BENCHMARK_DATE = "2025-01-01"  # Üretilen veri çalıştırmalar arasında aynı kalsın
+MIN_TIMING_SECONDS = 0.2  # Tekrarlar toplamda en az bu kadar sürer
+MAX_REPEATS = 7
+SCORE_BATCH = 10_000  # score_locations için aday sayısı
+
+def _stations(size):
+    from evc.data import generate_station_network
+
+    return generate_station_network(size, BENCHMARK_SEED, reference_date=BENCHMARK_DATE)
+
+def _demographics():
+    from evc.data import generate_demographic_data
+
+    np.random.seed(BENCHMARK_SEED)
+    return generate_demographic_data()
+
+# Hazırlık fonksiyonları (boyut, istasyonlar, demografi) alır ve ölçülecek argümansız fonksiyonu döndürür
+
+def _bench_generate_stations(size, stations_df, demographic_df):
+    return lambda: _stations(size)
+
+def _bench_generate_demographics(size, stations_df, demographic_df):
+    return _demographics
+
+def _bench_station_index(size, stations_df, demographic_df):
+    from evc.spatial import GeoIndex
+
+    return lambda: GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+
+def _bench_analyze_location(size, stations_df, demographic_df):
+    from evc.scoring import analyze_location
+    from evc.spatial import GeoIndex
+
+    station_index = GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+    return lambda: analyze_location(41.0082, 28.9784, stations_df, demographic_df, station_index)
+
+def _bench_score_locations(size, stations_df, demographic_df):
+    from evc.scoring import score_locations
+    from evc.spatial import GeoIndex
+
+    station_index = GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+    rng = np.random.default_rng(BENCHMARK_SEED)
+    lats, lngs = rng.uniform(36, 42, SCORE_BATCH), rng.uniform(26, 45, SCORE_BATCH)
+    return lambda: score_locations(lats, lngs, stations_df, demographic_df, station_index)
+
+def _bench_score_locations_forecast(size, stations_df, demographic_df):
+    from evc.forecasting import train_demand_model
+    from evc.scoring import score_locations
+    from evc.spatial import GeoIndex
+
+    station_index = GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+    demand_model = train_demand_model(stations_df, demographic_df, station_index)
+    rng = np.random.default_rng(BENCHMARK_SEED)
+    lats, lngs = rng.uniform(36, 42, SCORE_BATCH), rng.uniform(26, 45, SCORE_BATCH)
+    return lambda: score_locations(lats, lngs, stations_df, demographic_df, station_index, demand_model)
+
+def _bench_assign_provinces(size, stations_df, demographic_df):
+    from evc.geography import assign_provinces
+
+    lats, lngs = stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy()
+    return lambda: assign_provinces(lats, lngs, workers=-1)
+
+def _bench_calculate_roi(size, stations_df, demographic_df):
+    from evc.roi import calculate_roi
+
+    return lambda: calculate_roi(200000, 45000, 25000 * 12, 5)
+
+def _bench_socket_sweep(size, stations_df, demographic_df):
+    from evc.analytics import socket_sweep_roi
+
+    return lambda: socket_sweep_roi("DC 50kW (Hızlı)", range(2, 13), 60, 7.5, 32000, seed=BENCHMARK_SEED)
+
+def _bench_roi_scenarios(size, stations_df, demographic_df):
+    from evc.analytics import roi_scenarios
+    from evc.roi import STATION_TYPES
+
+    rng = np.random.default_rng(BENCHMARK_SEED)
+    scenarios = pd.DataFrame({
+        "station_type": np.array(STATION_TYPES)[rng.integers(0, len(STATION_TYPES), size)],
+        "num_sockets": rng.integers(2, 13, size),
+        "daily_usage_hours": rng.integers(1, 25, size),
+        "price_per_kwh": rng.uniform(3, 15, size),
+        "monthly_electricity_cost": rng.integers(5000, 50000, size),
+        "monthly_maintenance": rng.integers(2000, 20000, size),
+        "monthly_rent": rng.integers(5000, 50000, size)
+    })
+    return lambda: roi_scenarios(scenarios)
+
+def _filter_arguments(stations_df):
+    cities = list(stations_df['sehir'].unique()[:3])
+    operators = list(stations_df['operatör'].unique())
+    power_range = (int(stations_df['güç_kw'].min()), int(stations_df['güç_kw'].max()))
+    return cities, operators, power_range
+
+def _bench_filter_mask(size, stations_df, demographic_df):
+    cities, operators, power_range = _filter_arguments(stations_df)
+    # Harita filtresinin pandas ifadesi (bitmap indeksinden önceki yol)
+    return lambda: stations_df[
+        (stations_df['sehir'].isin(cities)) &
+        (stations_df['operatör'].isin(operators)) &
+        (stations_df['güç_kw'] >= power_range[0]) &
+        (stations_df['güç_kw'] <= power_range[1])
+    ]
+
+def _bench_filter_index(size, stations_df, demographic_df):
+    from evc.filters import StationFilterIndex
+
+    cities, operators, power_range = _filter_arguments(stations_df)
+    filter_index = StationFilterIndex(stations_df)
+    return lambda: stations_df.iloc[filter_index.query(cities, operators, power_range)]
+
+def _bench_operator_groupby(size, stations_df, demographic_df):
+    from evc.analytics import operator_performance
+
+    return lambda: operator_performance(stations_df)
+
+def _bench_operator_aggregates(size, stations_df, demographic_df):
+    from evc.aggregates import StationAggregates
+
+    aggregates = StationAggregates(stations_df)
+    return lambda: aggregates.operator_performance()
+
+def _bench_folium_map(size, stations_df, demographic_df):
+    import evc.maps as maps
+
+    view = {"center": maps.MAP_CENTER, "zoom": maps.MAP_ZOOM, "bounds": None}
+
+    def build():
+        plan = maps.plan_station_layer(len(stations_df), "Otomatik", view)
+        m = maps.base_map(view)
+        maps.add_station_layer(m, stations_df, plan, marker_style="icon")
+        return m.get_root().render()
+    return build
+
+# Ölçüm adı -> (hazırlık fonksiyonu, boyuta bağlı mı)
+BENCHMARKS = {
+    "generate_charging_stations": (_bench_generate_stations, True),
+    "generate_demographic_data": (_bench_generate_demographics, False),
+    "station_index_build": (_bench_station_index, True),
+    "analyze_location": (_bench_analyze_location, True),
+    "score_locations_10k": (_bench_score_locations, True),
+    "score_locations_forecast_10k": (_bench_score_locations_forecast, True),
+    "assign_provinces": (_bench_assign_provinces, True),
+    "calculate_roi": (_bench_calculate_roi, False),
+    "roi_scenarios": (_bench_roi_scenarios, True),
+    "socket_sweep": (_bench_socket_sweep, False),
+    "filter_mask": (_bench_filter_mask, True),
+    "filter_index": (_bench_filter_index, True),
+    "operator_groupby": (_bench_operator_groupby, True),
+    "operator_aggregates": (_bench_operator_aggregates, False),
+    "folium_map": (_bench_folium_map, True)
+}
+
+def time_call(function):
+    """En iyi süre (saniye) ve tekrar sayısı"""
+    best, total, repeats = float("inf"), 0.0, 0
+    while repeats < MAX_REPEATS and (repeats == 0 or total < MIN_TIMING_SECONDS):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        best, total, repeats = min(best, elapsed), total + elapsed, repeats + 1
+    return best, repeats
+
+def peak_memory(function):
+    """Tek çağrı sırasında tracemalloc ile ölçülen tepe ek bellek (bayt)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak - baseline
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=Path(__file__).resolve().parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmarks(sizes=BENCHMARK_SIZES, names=None, memory=True):
+    """Ölçümleri çalıştır; her (ölçüm, boyut) için bir sonuç kaydı üretir"""
+    names = list(BENCHMARKS) if names is None else names
+    run = {
+        "run_id": uuid.uuid4().hex[:12],
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__
+    }
+    demographic_df = _demographics()
+    warmed_up = set()
+    for size in sorted(sizes):
+        stations_df = _stations(size)
+        for name in names:
+            setup, scales = BENCHMARKS[name]
+            if not scales and name in warmed_up:
+                continue
+            function = setup(size, stations_df, demographic_df)
+            # İlk boyutta bir ısınma çağrısı (içe aktarma, şablon derleme vb. ölçüme girmesin)
+            if name not in warmed_up:
+                function()
+                warmed_up.add(name)
+            seconds, repeats = time_call(function)
+            yield {
+                **run,
+                "benchmark": name,
+                "size": size if scales else len(CITIES),
+                "seconds": seconds,
+                "repeats": repeats,
+                "peak_bytes": peak_memory(function) if memory else None
+            }
+        del stations_df
+        gc.collect()
+
+def load_results(path=BENCHMARK_RESULTS):
+    """Kayıtlı tüm sonuçlar (DataFrame)"""
+    path = Path(path)
+    if not path.exists():
+        return pd.DataFrame()
+    return pd.read_json(path, lines=True)
+
+def previous_run(results, run_id):
+    """Verilen çalıştırmadan önceki son çalıştırmanın sonuçları"""
+    earlier = results[results['run_id'] != run_id]
+    if earlier.empty:
+        return earlier
+    last_run = earlier.sort_values('timestamp')['run_id'].iloc[-1]
+    return earlier[earlier['run_id'] == last_run]
+
+def scaling_exponent(sizes, seconds):
+    """log(süre) ~ log(boyut) eğimi (1 = doğrusal)"""
+    sizes, seconds = np.asarray(sizes, dtype=np.float64), np.asarray(seconds, dtype=np.float64)
+    if len(sizes) < 2:
+        return np.nan
+    return np.polyfit(np.log(sizes), np.log(np.maximum(seconds, 1e-9)), 1)[0]
+
+def scaling_table(current, baseline=None):
+    """Ölçüm x boyut süre tablosu (ms), ölçeklenme üssü ve önceki çalıştırmaya oran"""
+    table = current.pivot_table(index='benchmark', columns='size', values='seconds') * 1000
+    table = table.reindex([name for name in BENCHMARKS if name in table.index])
+    table['üs'] = [
+        scaling_exponent(*current.loc[current['benchmark'] == name, ['size', 'seconds']].to_numpy().T)
+        if BENCHMARKS[name][1] else np.nan
+        for name in table.index
+    ]
+    if baseline is not None and not baseline.empty:
+        merged = current.merge(baseline[['benchmark', 'size', 'seconds']], on=['benchmark', 'size'], suffixes=("", "_onceki"))
+        ratio = merged.assign(oran=merged['seconds'] / merged['seconds_onceki']).groupby('benchmark')['oran'].max()
+        table['en kötü oran'] = ratio.reindex(table.index)
+    return table
+
+def plot_scaling(current, path):
+    """Ölçüm başına süre-boyut (log-log) eğrilerini PNG olarak kaydet"""
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(9, 6))
+    ax = fig.add_subplot()
+    for name, group in current.groupby('benchmark'):
+        if BENCHMARKS[name][1]:
+            group = group.sort_values('size')
+            ax.loglog(group['size'], group['seconds'], marker="o", label=name)
+    ax.set_xlabel("İstasyon sayısı")
+    ax.set_ylabel("Süre (sn)")
+    ax.grid(True, which="both", alpha=0.3)
+    ax.legend(fontsize=7)
+    fig.savefig(path, dpi=110, bbox_inches="tight")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Veri ve analiz sıcak yolları için performans ölçümleri")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(BENCHMARK_SIZES), help="İstasyon sayıları")
+    parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS), default=None, help="Yalnızca bu ölçümler")
+    parser.add_argument("--output", default=str(BENCHMARK_RESULTS), help="Sonuçların ekleneceği JSONL dosyası")
+    parser.add_argument("--no-memory", action="store_true", help="Tepe bellek ölçümünü atla")
+    parser.add_argument("--plot", default=None, help="Ölçeklenme grafiğinin kaydedileceği PNG")
+    args = parser.parse_args(argv)
+
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    records = []
+    with output.open("a", encoding="utf-8") as results_file:
+        for record in run_benchmarks(args.sizes, args.only, memory=not args.no_memory):
+            records.append(record)
+            results_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+            results_file.flush()
+            memory = "" if record['peak_bytes'] is None else f"{record['peak_bytes'] / 2 ** 20:10.1f} MB"
+            print(f"  {record['benchmark']:<28} {record['size']:>10,} {record['seconds'] * 1000:10.2f} ms {memory}")
+
+    current = pd.DataFrame(records)
+    baseline = previous_run(load_results(output), records[0]['run_id']) if records else None
+    with pd.option_context("display.width", 200, "display.max_columns", 20, "display.float_format", "{:.2f}".format):
+        print()
+        print("Süre (ms), ölçeklenme üssü ve önceki çalıştırmaya göre en kötü oran:")
+        print(scaling_table(current, baseline))
+    if args.plot:
+        plot_scaling(current, args.plot)
+        print(f"Ölçeklenme grafiği: {args.plot}")
+
+if __name__ == "__main__":
+    main()
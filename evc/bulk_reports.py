@@ -0,0 +1,100 @@
+"""Tüm şehirler için toplu rapor üretimi (Streamlit'siz, çok süreçli)
+
+    python -m evc.bulk_reports --output reports --workers 8
+
+Her şehir ayrı bir görev olarak süreç havuzunda işlenir. Çalışanlar
+demografik verileri bir kez yükler, istasyonlardan yalnızca kendi şehrinin
+bölümünü okur ve raporu arayüzle aynı `evc.reporting` koduyla üretir.
+"""
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import get_context
+from pathlib import Path
+
+from evc.reporting import REPORT_TYPES, generate_city_report
+from evc.store import (
+    ensure_demographic_store, ensure_station_store, load_demographic_store, station_store_version
+)
+
+REPORT_FORMATS = ("html", "pdf")
+
+# Çalışan süreç başına bir kez yüklenen veriler
+_WORKER_STATE = {}
+
+def _init_worker():
+    _WORKER_STATE["demographic_df"] = load_demographic_store()
+    _WORKER_STATE["dataset_version"] = station_store_version()
+
+def report_file_stem(city, report_type):
+    """Rapor dosya adı kökü (ör. 'İstanbul-ozet-rapor')"""
+    slug = re.sub(r"[^0-9a-z]+", "-", report_type.lower().translate(str.maketrans("çğıöşüİ", "cgiosui"))).strip("-")
+    return f"{city}-{slug}"
+
+def render_city(city, output_dir, report_type, include_maps, include_financials, formats):
+    """Tek şehrin raporunu üretip diske yaz; (şehir, süre, yazılan dosyalar) döndür"""
+    start = time.perf_counter()
+    report = generate_city_report(
+        city, report_type, _WORKER_STATE["demographic_df"], include_maps=include_maps,
+        include_financials=include_financials, dataset_version=_WORKER_STATE["dataset_version"]
+    )
+    paths = []
+    for report_format in formats:
+        path = Path(output_dir) / f"{report_file_stem(city, report_type)}.{report_format}"
+        content = report[report_format]
+        if isinstance(content, str):
+            path.write_text(content, encoding="utf-8")
+        else:
+            path.write_bytes(content)
+        paths.append(path)
+    return city, time.perf_counter() - start, paths
+
+def run(output_dir, cities=None, workers=None, report_type=REPORT_TYPES[0], include_maps=True,
+        include_financials=True, formats=REPORT_FORMATS):
+    """Raporları süreç havuzunda üret; tamamlanma sırasıyla (şehir, süre, dosyalar) üretir"""
+    ensure_station_store()
+    ensure_demographic_store()
+    if cities is None:
+        cities = list(load_demographic_store()['sehir'].unique())
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    # Her süreç tek çekirdek kullanır; BLAS iş parçacıkları çekirdekleri paylaşmaz
+    for variable in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(variable, "1")
+    # 'spawn': çalışanlar ana süreçteki Arrow iş parçacıklarını devralmaz
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count(), mp_context=get_context("spawn"),
+                             initializer=_init_worker) as executor:
+        futures = [
+            executor.submit(render_city, city, output_dir, report_type, include_maps, include_financials, formats)
+            for city in cities
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tüm şehirler için analiz raporlarını üret")
+    parser.add_argument("--output", default="reports", help="Raporların yazılacağı klasör")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: çekirdek sayısı)")
+    parser.add_argument("--cities", nargs="+", default=None, help="Yalnızca bu şehirler")
+    parser.add_argument("--report-type", choices=REPORT_TYPES, default=REPORT_TYPES[0])
+    parser.add_argument("--formats", nargs="+", choices=REPORT_FORMATS, default=list(REPORT_FORMATS))
+    parser.add_argument("--no-maps", action="store_true", help="Haritasız rapor")
+    parser.add_argument("--no-financials", action="store_true", help="Finansal analizsiz rapor")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    busy = 0.0
+    count = 0
+    for city, seconds, paths in run(args.output, args.cities, args.workers, args.report_type,
+                                    not args.no_maps, not args.no_financials, args.formats):
+        busy += seconds
+        count += 1
+        print(f"  {city:<20} {seconds * 1000:8.1f} ms  {', '.join(path.name for path in paths)}")
+    elapsed = time.perf_counter() - start
+    print(f"{count} rapor {elapsed:.1f} sn'de üretildi (toplam iş {busy:.1f} sn, paralellik x{busy / elapsed:.1f})")
+
+if __name__ == "__main__":
+    main()
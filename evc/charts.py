@@ -0,0 +1,252 @@
+"""Plotly grafik oluşturucuları"""
+import numpy as np
+import plotly.express as px
+import plotly.graph_objects as go
+
+def distribution_pie(counts, title):
+    """Değer sayımlarından (ör. operatör dağılımı) pasta grafiği"""
+    return px.pie(
+        values=counts.values,
+        names=counts.index,
+        title=title
+    )
+
+def power_histogram(stations_df):
+    """Güç dağılımı"""
+    return px.histogram(
+        stations_df,
+        x='güç_kw',
+        title="Güç Dağılımı",
+        nbins=20
+    )
+
+def usage_histogram(stations_df):
+    """Kullanım oranı dağılımı"""
+    return px.histogram(
+        stations_df,
+        x='kullanim_orani',
+        title="Kullanım Oranı Dağılımı",
+        nbins=20
+    )
+
+def occupancy_histogram(occupancy):
+    """Seçili dönemde istasyon başına ortalama doluluk dağılımı"""
+    fig = px.histogram(x=occupancy, title="Doluluk Dağılımı (Seçili Dönem)", nbins=20)
+    fig.update_layout(xaxis_title="Ortalama Doluluk", yaxis_title="İstasyon Sayısı")
+    return fig
+
+def utilization_trend(energy, occupancy):
+    """Dönem başına toplam enerji (sütun) ve ortalama doluluk (çizgi, ikinci eksen)"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(x=energy.index, y=energy.to_numpy() / 1000, name='Enerji (MWh)', marker_color='#1f77b4'))
+    fig.add_trace(go.Scatter(
+        x=occupancy.index, y=occupancy.to_numpy() * 100, name='Ort. Doluluk (%)',
+        mode='lines', yaxis='y2', line=dict(color='orange', width=3)
+    ))
+    fig.update_layout(
+        title="Enerji ve Doluluk Eğilimi",
+        yaxis=dict(title="Enerji (MWh)"),
+        yaxis2=dict(title="Doluluk (%)", overlaying='y', side='right', rangemode='tozero'),
+        legend=dict(orientation='h', y=-0.15)
+    )
+    return fig
+
+def hourly_profile_bar(profile):
+    """Günün saatlerine göre ortalama doluluk (yoğun saatler)"""
+    fig = px.bar(x=profile.index, y=profile.to_numpy() * 100, title="Saatlik Ortalama Doluluk")
+    fig.update_layout(xaxis_title="Saat", yaxis_title="Doluluk (%)")
+    fig.update_xaxes(dtick=2)
+    return fig
+
+def city_station_bar(city_counts):
+    """Şehir bazında istasyon sayısı"""
+    fig_bar = px.bar(
+        x=city_counts.index,
+        y=city_counts.values,
+        title="Şehir Bazında İstasyon Sayısı"
+    )
+    fig_bar.update_xaxes(tickangle=45)
+    return fig_bar
+
+def income_vs_ev_scatter(demographic_df):
+    """Gelir vs EV oranı (nüfus boyutu)"""
+    return px.scatter(
+        demographic_df,
+        x='ortalama_gelir',
+        y='elektrikli_arac_orani',
+        size='nufus',
+        color='potansiyel_puan',
+        hover_name='sehir',
+        title="Gelir vs EV Oranı (Nüfus Boyutu)"
+    )
+
+def city_potential_bar(demographic_df):
+    """Şehir potansiyel puanları"""
+    return px.bar(
+        demographic_df.sort_values('potansiyel_puan', ascending=True),
+        x='potansiyel_puan',
+        y='sehir',
+        orientation='h',
+        title="Şehir Potansiyel Puanları"
+    )
+
+def operator_revenue_bar(operator_analysis):
+    """Operatör bazında ortalama günlük gelir"""
+    fig_revenue = px.bar(
+        x=operator_analysis.index,
+        y=operator_analysis['Ort. Günlük Gelir'],
+        title="Operatör Bazında Ortalama Günlük Gelir"
+    )
+    fig_revenue.update_xaxes(tickangle=45)
+    return fig_revenue
+
+def operator_energy_trend(energy):
+    """Operatör başına dönemsel enerji (dönem x operatör tablosu, kWh)"""
+    fig = px.line(energy / 1000, title="Operatör Bazında Enerji Eğilimi")
+    fig.update_layout(xaxis_title="Dönem", yaxis_title="Enerji (MWh)", legend_title="Operatör")
+    return fig
+
+def profit_projection(years, cumulative_profit):
+    """Kümülatif kar projeksiyonu ve başabaş çizgisi"""
+    fig_roi = go.Figure()
+    fig_roi.add_trace(go.Scatter(
+        x=years,
+        y=cumulative_profit,
+        mode='lines+markers',
+        name='Kümülatif Kar',
+        line=dict(color='green', width=3)
+    ))
+    fig_roi.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="Başabaş Noktası")
+    fig_roi.update_layout(
+        title=f"{len(years)} Yıllık Kar Projeksiyonu",
+        xaxis_title="Yıl",
+        yaxis_title="Kümülatif Kar (₺)",
+        showlegend=False
+    )
+    return fig_roi
+
+def socket_sweep_chart(sweep, current_sockets):
+    """Soket sayısına göre ROI (çubuk) ve geri çevrilen araç oranı (çizgi, ikinci eksen)"""
+    sockets = sweep.index.to_numpy()
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=sockets,
+        y=sweep['roi'],
+        name='ROI (%)',
+        marker_color=np.where(sockets == current_sockets, 'darkgreen', 'lightgreen')
+    ))
+    fig.add_trace(go.Scatter(
+        x=sockets,
+        y=sweep['turn_away_rate'] * 100,
+        mode='lines+markers',
+        name='Geri Çevrilen Araç (%)',
+        line=dict(color='red', width=2),
+        yaxis='y2'
+    ))
+    fig.update_layout(
+        title="Soket Sayısına Göre ROI ve Kayıp Talep",
+        xaxis=dict(title="Soket Sayısı", dtick=1),
+        yaxis=dict(title="ROI (%)"),
+        yaxis2=dict(title="Geri Çevrilen Araç (%)", overlaying='y', side='right', rangemode='tozero'),
+        legend=dict(orientation='h', y=-0.2)
+    )
+    return fig
+
+def cash_flow_fan_chart(bands):
+    """Kümülatif iskontolu nakit akışının yüzdelik bantları (Monte Carlo)"""
+    months = bands.index.to_numpy()
+    columns = list(bands.columns)
+    fig = go.Figure()
+    # Dış bantlardan içe doğru: P5-P95, P25-P75
+    for (low, high), opacity in zip([(columns[0], columns[-1]), (columns[1], columns[-2])], [0.15, 0.3]):
+        fig.add_trace(go.Scatter(x=months, y=bands[high], mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'))
+        fig.add_trace(go.Scatter(
+            x=months, y=bands[low], mode='lines', line=dict(width=0), fill='tonexty',
+            fillcolor=f'rgba(40, 167, 69, {opacity})', name=f'{low}-{high}'
+        ))
+    median = columns[len(columns) // 2]
+    fig.add_trace(go.Scatter(x=months, y=bands[median], mode='lines', name=f'Medyan ({median})', line=dict(color='green', width=3)))
+    fig.add_hline(y=0, line_dash="dash", line_color="red", annotation_text="Başabaş Noktası")
+    fig.update_layout(
+        title="Kümülatif İskontolu Nakit Akışı (Monte Carlo)",
+        xaxis_title="Ay",
+        yaxis_title="Kümülatif NBD (₺)"
+    )
+    return fig
+
+def payback_histogram(payback_months, n_months):
+    """Geri ödeme süresi dağılımı; ufuk içinde geri ödemeyen senaryolar ayrı gösterilir"""
+    paid_back = payback_months[np.isfinite(payback_months)]
+    not_paid_share = 1 - len(paid_back) / len(payback_months)
+    fig = px.histogram(x=paid_back, nbins=min(n_months, 60), histnorm='percent', title="Geri Ödeme Süresi Dağılımı")
+    fig.update_layout(xaxis_title="Ay", yaxis_title="Senaryo (%)", showlegend=False)
+    fig.update_xaxes(range=[0, n_months])
+    if not_paid_share > 0:
+        fig.add_annotation(
+            text=f"Ufuk içinde geri ödemeyen: %{not_paid_share * 100:.1f}",
+            xref="paper", yref="paper", x=0.98, y=0.95, showarrow=False
+        )
+    return fig
+
+def tornado_chart(tornado, base_roi):
+    """Parametre başına ROI aralığı (diğer parametreler mevcut değerlerinde)"""
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        y=tornado['parametre'],
+        x=tornado['roi_düşük'] - base_roi,
+        base=base_roi,
+        orientation='h',
+        name='Aralığın alt ucu',
+        marker_color='#dc3545',
+        customdata=np.column_stack([tornado['düşük_değer'].astype(str), tornado['roi_düşük'].round(1)]),
+        hovertemplate='%{y}: %{customdata[0]} → ROI %{customdata[1]}<extra></extra>'
+    ))
+    fig.add_trace(go.Bar(
+        y=tornado['parametre'],
+        x=tornado['roi_yüksek'] - base_roi,
+        base=base_roi,
+        orientation='h',
+        name='Aralığın üst ucu',
+        marker_color='#28a745',
+        customdata=np.column_stack([tornado['yüksek_değer'].astype(str), tornado['roi_yüksek'].round(1)]),
+        hovertemplate='%{y}: %{customdata[0]} → ROI %{customdata[1]}<extra></extra>'
+    ))
+    fig.add_vline(x=base_roi, line_dash="dash", line_color="gray", annotation_text="Mevcut ROI")
+    fig.update_layout(
+        title="ROI Duyarlılığı (Tornado)",
+        barmode='overlay',
+        xaxis_title="5 Yıllık ROI (%)",
+        yaxis_title=""
+    )
+    return fig
+
+def sensitivity_heatmap(table, title, x_label, y_label, value_label):
+    """İki parametreli duyarlılık kesiti ısı haritası (satırlar y, sütunlar x)"""
+    fig = px.imshow(
+        table.to_numpy(),
+        x=[str(value) for value in table.columns],
+        y=[str(value) for value in table.index],
+        origin='lower',
+        aspect='auto',
+        color_continuous_scale='RdYlGn',
+        labels=dict(x=x_label, y=y_label, color=value_label),
+        title=title
+    )
+    return fig
+
+def coverage_curve(sites, initial_coverage):
+    """Eklenen lokasyon sayısına göre kümülatif talep kapsama oranı"""
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(
+        x=np.concatenate([[0], sites['sira'].to_numpy()]),
+        y=np.concatenate([[initial_coverage], sites['kumulatif_kapsama'].to_numpy()]) * 100,
+        mode='lines+markers',
+        line=dict(color='green', width=3)
+    ))
+    fig.update_layout(
+        title="Yeni Lokasyon Sayısına Göre Talep Kapsama",
+        xaxis_title="Yeni Lokasyon Sayısı",
+        yaxis_title="Karşılanan Talep (%)",
+        showlegend=False
+    )
+    return fig
@@ -0,0 +1,64 @@
+"""Uygulama genelinde kullanılan sabitler ve ortam değişkeni ayarları"""
+import csv
+import os
+from pathlib import Path
+
+# 81 il: plaka sırasında il adı, merkez koordinatı ve yaklaşık nüfus (geodata/provinces.csv)
+PROVINCES_FILE = Path(__file__).parent / "geodata" / "provinces.csv"
+
+def _read_provinces(path):
+    with open(path, encoding="utf-8", newline="") as provinces_file:
+        return list(csv.DictReader(provinces_file))
+
+_PROVINCES = _read_provinces(PROVINCES_FILE)
+
+# Sabit veri tanımları
+CITIES = [row["il"] for row in _PROVINCES]
+OPERATORS = ["Zorlu Enerji", "Aksa Enerji", "Şarj Noktası", "ePark", "Voltrun", "Tesla Supercharger"]
+POWER_TYPES = ["AC 22kW", "DC 50kW", "DC 150kW", "DC 350kW"]
+
+# Harita ve grafiklerde operatör renkleri (folium ve matplotlib renk adları)
+OPERATOR_COLORS = {
+    "Zorlu Enerji": "red",
+    "Aksa Enerji": "blue",
+    "Şarj Noktası": "green",
+    "ePark": "purple",
+    "Voltrun": "orange",
+    "Tesla Supercharger": "darkred"
+}
+
+CITY_CENTERS = {row["il"]: (float(row["lat"]), float(row["lng"])) for row in _PROVINCES}
+CITY_POPULATIONS = {row["il"]: int(row["nufus"]) for row in _PROVINCES}
+
+STATION_COUNT = int(os.environ.get("EVC_STATION_COUNT", 250))
+STATION_SEED = int(os.environ.get("EVC_STATION_SEED", 42))
+
+# Kalıcı sütunsal veri deposu (Arrow IPC, şehir bazında bölümlenmiş)
+DATA_DIR = Path(os.environ.get("EVC_DATA_DIR", "data"))
+STATION_STORE = DATA_DIR / "stations"
+DEMOGRAPHIC_STORE = DATA_DIR / "demographics.arrow"
+MODEL_DIR = DATA_DIR / "models"  # Sürüm başına kaydedilen eğitilmiş modeller
+TIMESERIES_DIR = DATA_DIR / "timeseries"  # Sürüm başına saatlik doluluk/enerji serileri
+# Talep modeli eğitiminde çapraz doğrulama/hiperparametre aramasının süreç sayısı (-1: tüm çekirdekler)
+FORECAST_JOBS = int(os.environ.get("EVC_FORECAST_JOBS", -1))
+# Saatlik seriler istasyon x saat boyutunda büyür; bu sayının üzerindeki ağlar için üretilmez
+TIMESERIES_MAX_STATIONS = int(os.environ.get("EVC_TIMESERIES_MAX_STATIONS", 20_000))
+# İsteğe bağlı yerel coğrafya dosyaları: provinces.geojson, districts.csv, districts.geojson
+GEOGRAPHY_DIR = Path(os.environ.get("EVC_GEOGRAPHY_DIR", DATA_DIR / "geography"))
+STORE_MANIFEST = "manifest.json"
+STATION_COLUMNS = [
+    "istasyon_id", "isim", "sehir", "operatör", "güç_tipi", "güç_kw", "soket_sayisi",
+    "lat", "lng", "kullanim_orani", "gunluk_gelir", "kurulum_tarihi"
+]
+
+# Yeniden çalıştırma ölçümleri: hata ayıklama paneli ve izleme çıktıları (boşsa kapalı)
+DEBUG_PANEL = os.environ.get("EVC_DEBUG_PANEL", "0") == "1"
+METRICS_JSONL = os.environ.get("EVC_METRICS_JSONL") or None
+METRICS_PROM = os.environ.get("EVC_METRICS_PROM") or None
+
+EARTH_RADIUS_KM = 6371.0088
+NEARBY_RADIUS_KM = 10
+
+# Türkiye sınır kutusu (enlem_min, enlem_max, boylam_min, boylam_max)
+TURKEY_BOUNDS = (35.8, 42.1, 25.6, 44.8)
+HEATMAP_RESOLUTION_DEG = 0.1
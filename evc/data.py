@@ -0,0 +1,115 @@
+"""Simüle istasyon ve demografik veri üretimi"""
+import numpy as np
+import pandas as pd
+
+from evc.config import CITIES, CITY_CENTERS, CITY_POPULATIONS, OPERATORS, POWER_TYPES, STATION_COUNT, STATION_SEED
+
+def _station_ids(n_stations):
+    """"ST001" biçimindeki istasyon kimliklerini Python döngüsü olmadan üret"""
+    width = max(3, len(str(n_stations)))
+    numbers = np.arange(1, n_stations + 1, dtype=np.int64)
+    buffer = np.empty((n_stations, width + 2), dtype=np.uint8)
+    buffer[:, 0], buffer[:, 1] = ord("S"), ord("T")
+    buffer[:, 2:] = numbers[:, None] // 10 ** np.arange(width - 1, -1, -1, dtype=np.int64) % 10 + ord("0")
+    return buffer.view(f"S{width + 2}").ravel().astype(f"U{width + 2}")
+
+def generate_station_network(n_stations, seed, reference_date=None):
+    """Sütun bazlı (vektörize) şarj istasyonu ağı oluştur
+
+    Her sütun tek bir NumPy çağrısıyla doldurulur; aynı seed ve referans
+    tarihi için çıktı birebir aynıdır. Tekrarlayan metin sütunları
+    kategorik tutulur, böylece milyonlarca satır birkaç saniyede üretilir.
+    """
+    rng = np.random.default_rng(seed)
+    if reference_date is None:
+        reference_date = pd.Timestamp.now()
+    reference_day = np.datetime64(pd.Timestamp(reference_date).date(), "D")
+
+    n_cities, n_operators = len(CITIES), len(OPERATORS)
+    city_lat = np.array([CITY_CENTERS[city][0] for city in CITIES])
+    city_lng = np.array([CITY_CENTERS[city][1] for city in CITIES])
+    city_population = np.array([CITY_POPULATIONS[city] for city in CITIES], dtype=np.float64)
+    power_kw = np.array([int(p.split()[1].replace("kW", "")) for p in POWER_TYPES], dtype=np.int32)
+
+    # İstasyonlar illere nüfusla orantılı dağıtılır
+    city_codes = rng.choice(n_cities, n_stations, p=city_population / city_population.sum()).astype(np.int8)
+    operator_codes = rng.integers(0, n_operators, n_stations, dtype=np.int8)
+    name_operator_codes = rng.integers(0, n_operators, n_stations, dtype=np.int8)
+    power_codes = rng.integers(0, len(POWER_TYPES), n_stations, dtype=np.int8)
+
+    # İsimler "<operatör> - <şehir> <1..10>" kalıbında; sınırlı sayıda farklı değer olduğu için kategorik
+    name_categories = [
+        f"{operator} - {city} {k + 1}"
+        for operator in OPERATORS for city in CITIES for k in range(10)
+    ]
+    name_codes = (
+        (name_operator_codes.astype(np.int32) * n_cities + city_codes) * 10
+        + np.arange(n_stations, dtype=np.int64) % 10
+    )
+
+    lat = city_lat[city_codes] + rng.uniform(-0.3, 0.3, n_stations)
+    lng = city_lng[city_codes] + rng.uniform(-0.3, 0.3, n_stations)
+
+    # Kullanım nüfusla artar, il merkezinden uzaklaştıkça azalır; gelir kullanım, güç ve soket sayısıyla ölçeklenir
+    log_population = np.log(city_population)
+    population_score = (log_population - log_population.min()) / (log_population.max() - log_population.min())
+    center_offset = np.hypot(lat - city_lat[city_codes], lng - city_lng[city_codes]) / np.hypot(0.3, 0.3)
+    station_power = power_kw[power_codes]
+    sockets = rng.integers(2, 12, n_stations, dtype=np.int32)
+    utilization = np.clip(
+        0.45 + 0.35 * population_score[city_codes] - 0.25 * center_offset - 0.0003 * station_power
+        + rng.normal(0, 0.06, n_stations), 0.05, 0.95
+    )
+    revenue = utilization * (1000 + 6 * station_power) * (0.5 + 0.1 * sockets) * rng.lognormal(0, 0.1, n_stations)
+
+    stations_df = pd.DataFrame({
+        "istasyon_id": pd.Categorical.from_codes(np.arange(n_stations), categories=_station_ids(n_stations)),
+        "isim": pd.Categorical.from_codes(name_codes, categories=name_categories),
+        "sehir": pd.Categorical.from_codes(city_codes, categories=CITIES),
+        "operatör": pd.Categorical.from_codes(operator_codes, categories=OPERATORS),
+        "güç_tipi": pd.Categorical.from_codes(power_codes, categories=POWER_TYPES),
+        "güç_kw": station_power,
+        "soket_sayisi": sockets,
+        "lat": lat,
+        "lng": lng,
+        "kullanim_orani": utilization,
+        "gunluk_gelir": revenue,
+        "kurulum_tarihi": (
+            reference_day - rng.integers(30, 1095, n_stations).astype("timedelta64[D]")
+        ).astype("datetime64[ns]"),
+    })
+    stations_df.attrs["dataset_version"] = f"sim-n{n_stations}-s{seed}-{reference_day}"
+    return stations_df
+
+def generate_charging_stations():
+    """Türkiye'deki şarj istasyonları için örnek veri oluştur"""
+    return generate_station_network(STATION_COUNT, seed=STATION_SEED)
+
+def generate_demographic_data():
+    """Demografik veriler oluştur"""
+    data = []
+    
+    for city in CITIES:
+        population = CITY_POPULATIONS[city]
+        data.append({
+            "sehir": city,
+            "nufus": population,
+            "ortalama_gelir": np.random.randint(35000, 85000),
+            "ev_sayisi": int(population / np.random.uniform(2.8, 4.2)),
+            "trafik_yogunlugu": np.random.uniform(0.4, 0.95),
+            "elektrikli_arac_orani": np.random.uniform(0.02, 0.08),
+            "potansiyel_puan": np.random.uniform(3.5, 9.2)
+        })
+    
+    return pd.DataFrame(data)
+
+def dataset_version(df):
+    """Veri setinin sürüm anahtarını döndür (önbellek anahtarı olarak kullanılır)"""
+    version = df.attrs.get("dataset_version")
+    if version is None:
+        version = f"hash-{len(df)}-{pd.util.hash_pandas_object(df[['lat', 'lng']], index=False).sum()}"
+    return version
+
+def base_version(version):
+    """Sürüm anahtarının içe aktarma günlüğü sırası olmadan temel kısmı ("<temel>+<sıra>")"""
+    return version.split("+", 1)[0]
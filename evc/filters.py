@@ -0,0 +1,70 @@
+"""Harita filtreleri için bitmap indeksli filtre motoru"""
+import numpy as np
+import pandas as pd
+
+class StationFilterIndex:
+    """Şehir, operatör ve güç sınıfı için değer başına sıkıştırılmış bitmap indeksi
+
+    Her değer için satır başına bir bit tutulur (np.packbits). Filtre
+    kombinasyonları seçilen değerlerin bitmap'lerinin OR'u ve boyutlar
+    arası AND ile cevaplanır; sonuç, çerçeve kopyalanmadan satır
+    pozisyonları olarak döndürülür.
+    """
+
+    def __init__(self, stations_df):
+        self.n_rows = len(stations_df)
+        self.cities = self._build(stations_df['sehir'])
+        self.operators = self._build(stations_df['operatör'])
+        self.power_classes = self._build(stations_df['güç_kw'])
+
+    def _build(self, column):
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            values, codes = column.cat.categories, column.cat.codes.to_numpy()
+        else:
+            values, codes = np.unique(column.to_numpy(), return_inverse=True)
+        return {value: np.packbits(codes == code) for code, value in enumerate(values.tolist())}
+
+    def apply_changes(self, keep, appended_df):
+        """Satır silme/ekleme sonrası güncel indeks
+
+        `keep`: eski satırlardan kalanların maskesi; `appended_df`: sona eklenen
+        satırlar. Var olan bitmap'ler yeniden hesaplanmadan kaydırılır, yalnızca
+        eklenen satırlar için değerler karşılaştırılır.
+        """
+        updated = object.__new__(StationFilterIndex)
+        updated.n_rows = int(np.count_nonzero(keep)) + len(appended_df)
+        updated.cities = self._shift(self.cities, keep, appended_df['sehir'])
+        updated.operators = self._shift(self.operators, keep, appended_df['operatör'])
+        updated.power_classes = self._shift(self.power_classes, keep, appended_df['güç_kw'])
+        return updated
+
+    def _shift(self, bitmaps, keep, appended):
+        appended = appended.to_numpy(dtype=object)
+        values = list(bitmaps) + [value for value in pd.unique(appended) if value not in bitmaps]
+        return {
+            value: np.packbits(np.concatenate([
+                np.unpackbits(bitmaps[value], count=self.n_rows)[keep] if value in bitmaps else np.zeros(np.count_nonzero(keep), dtype=np.uint8),
+                (appended == value).astype(np.uint8)
+            ]))
+            for value in values
+        }
+
+    def _union(self, bitmaps, selected):
+        result = np.zeros((self.n_rows + 7) // 8, dtype=np.uint8)
+        for value in selected:
+            if value in bitmaps:
+                np.bitwise_or(result, bitmaps[value], out=result)
+        return result
+
+    def query(self, cities=None, operators=None, power_range=None):
+        """Filtre kombinasyonunu sağlayan satırların pozisyonlarını döndür (None = filtre yok)"""
+        result = np.full((self.n_rows + 7) // 8, 0xFF, dtype=np.uint8)
+        if cities is not None:
+            np.bitwise_and(result, self._union(self.cities, cities), out=result)
+        if operators is not None:
+            np.bitwise_and(result, self._union(self.operators, operators), out=result)
+        if power_range is not None:
+            low, high = power_range
+            selected = [power for power in self.power_classes if low <= power <= high]
+            np.bitwise_and(result, self._union(self.power_classes, selected), out=result)
+        return np.flatnonzero(np.unpackbits(result, count=self.n_rows))
@@ -0,0 +1,222 @@
+"""Lokasyon başına kullanım ve günlük gelir tahmini (talep modeli)
+
+Özellikler il demografisi (nüfus, gelir, trafik yoğunluğu, elektrikli araç
+oranı), rekabet (yarıçap içindeki ve en yakın istasyon), il merkezine
+uzaklık ve istasyon gücü/soket sayısıdır. Her hedef için ayrı bir
+gradyan artırmalı regresyon modeli, çapraz doğrulamalı rastgele
+hiperparametre aramasıyla eğitilir; aday denemeleri yerel süreç havuzunda
+(joblib/loky) paralel çalışır. Eğitilmiş modeller veri sürümü başına diske
+kaydedilir. Tahmin parça parça ve vektörizedir; özellikler KD-ağacı ve il
+ataması üzerinden Python döngüsü olmadan hesaplanır.
+"""
+import re
+import threading
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.model_selection import KFold, RandomizedSearchCV
+
+from evc.config import CITIES, CITY_CENTERS, FORECAST_JOBS, MODEL_DIR, NEARBY_RADIUS_KM
+from evc.geography import assign_provinces
+from evc.spatial import GeoIndex, haversine_km
+
+FORECAST_FEATURES = [
+    "nufus_log", "ortalama_gelir", "trafik_yogunlugu", "elektrikli_arac_orani",
+    "yakin_istasyon", "en_yakin_km", "merkez_km", "güç_kw", "soket_sayisi"
+]
+# Hedef sütun -> tahmin sütunu
+FORECAST_TARGETS = {"kullanim_orani": "tahmini_kullanim", "gunluk_gelir": "tahmini_gelir"}
+
+SITE_POWER_KW = 50  # Aday lokasyonlar için varsayılan istasyon (DC 50kW, 4 soket)
+SITE_SOCKETS = 4
+FORECAST_MIN_ROWS = 50  # Bundan az etiketli istasyon varsa model eğitilmez
+FORECAST_TRAIN_ROWS = 100_000  # Eğitim örneklemi (büyük ağlarda eğitim süresi sınırlı kalsın)
+FORECAST_BATCH_ROWS = 262_144  # Tahminde parça boyutu
+FORECAST_CV_FOLDS = 3
+# Tahmin süresi ağaç sayısıyla doğrusal artar; erken durdurma çoğu zaman bu sınırın altında keser
+FORECAST_MAX_TREES = 100
+FORECAST_SEARCH_ITER = 8  # Rastgele aramada denenen hiperparametre kombinasyonu sayısı
+FORECAST_PARAM_GRID = {
+    "learning_rate": [0.1, 0.2],
+    "max_leaf_nodes": [15, 31, 63],
+    "min_samples_leaf": [10, 40],
+    "l2_regularization": [0.0, 1.0]
+}
+REVENUE_REFERENCE_QUANTILE = 0.95  # Bu gelir dilimi talep potansiyelinde 10 puana karşılık gelir
+
+def _demographic_columns(demographic_df, city_positions):
+    """Demografik sütunlar CITIES sırasına dizilip noktaların illerine yayılır (eksik iller NaN)"""
+    demo = demographic_df.drop_duplicates('sehir').set_index('sehir').reindex(CITIES)
+    population = demo['nufus'].to_numpy(dtype=np.float64)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        population_log = np.log10(population)
+    return [population_log[city_positions]] + [
+        demo[column].to_numpy(dtype=np.float64)[city_positions]
+        for column in ["ortalama_gelir", "trafik_yogunlugu", "elektrikli_arac_orani"]
+    ]
+
+def site_features(lats, lngs, demographic_df, station_index, power_kw=SITE_POWER_KW, sockets=SITE_SOCKETS,
+                  nearby=None, city_positions=None, exclude_self=False):
+    """FORECAST_FEATURES sırasında özellik matrisi
+
+    `nearby` ve `city_positions` önceden hesaplandıysa (ör. toplu puanlamada)
+    yeniden sorgulanmaz. `exclude_self`: noktalar indeksteki istasyonların
+    kendisiyse (eğitim) her nokta kendi rakibi sayılmaz.
+    """
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    lngs = np.asarray(lngs, dtype=np.float64).ravel()
+    if len(lats) == 0:
+        return np.empty((0, len(FORECAST_FEATURES)))
+    if city_positions is None:
+        city_positions = assign_provinces(lats, lngs, workers=-1)
+    if nearby is None:
+        nearby = station_index.count_within(lats, lngs, NEARBY_RADIUS_KM, workers=-1) - int(exclude_self)
+    rank = int(exclude_self)
+    if len(station_index) > rank:
+        distances, _ = station_index.nearest(lats, lngs, k=rank + 1, workers=-1)
+        nearest_km = distances.reshape(len(lats), -1)[:, rank]
+    else:
+        nearest_km = np.full(len(lats), np.nan)
+    center_lat = np.array([CITY_CENTERS[city][0] for city in CITIES])[city_positions]
+    center_lng = np.array([CITY_CENTERS[city][1] for city in CITIES])[city_positions]
+
+    columns = _demographic_columns(demographic_df, city_positions) + [
+        np.asarray(nearby, dtype=np.float64),
+        nearest_km,
+        haversine_km(lats, lngs, center_lat, center_lng),
+        np.broadcast_to(np.asarray(power_kw, dtype=np.float64), lats.shape),
+        np.broadcast_to(np.asarray(sockets, dtype=np.float64), lats.shape)
+    ]
+    return np.column_stack(columns)
+
+def training_sample(stations_df, max_rows=FORECAST_TRAIN_ROWS, seed=42):
+    """Hedefleri dolu istasyonlardan (en fazla `max_rows`) örneklem satır pozisyonları"""
+    labeled = np.flatnonzero(stations_df[list(FORECAST_TARGETS)].notna().all(axis=1).to_numpy())
+    if len(labeled) > max_rows:
+        labeled = np.sort(np.random.default_rng(seed).choice(labeled, max_rows, replace=False))
+    return labeled
+
+class DemandModel:
+    """Kullanım oranı ve günlük gelir için hedef başına HistGradientBoostingRegressor"""
+
+    def __init__(self, version=None, seed=42):
+        self.features = list(FORECAST_FEATURES)
+        self.version = version
+        self.seed = seed
+        self.estimators = {}
+        self.cv_results = {}  # hedef -> {"r2": ortalama, "r2_std": sapma, "params": en iyi parametreler}
+        self.rows_trained = 0
+        self.revenue_reference = np.nan
+
+    def fit(self, features, targets, n_jobs=FORECAST_JOBS):
+        """`targets`: hedef sütun -> değer dizisi; her hedef için CV'li arama yapılıp en iyi model yeniden eğitilir"""
+        folds = KFold(FORECAST_CV_FOLDS, shuffle=True, random_state=self.seed)
+        for target in FORECAST_TARGETS:
+            search = RandomizedSearchCV(
+                HistGradientBoostingRegressor(max_iter=FORECAST_MAX_TREES, early_stopping=True, random_state=self.seed),
+                FORECAST_PARAM_GRID, n_iter=FORECAST_SEARCH_ITER, scoring="r2", cv=folds,
+                n_jobs=n_jobs, random_state=self.seed
+            )
+            search.fit(features, np.asarray(targets[target], dtype=np.float64))
+            best = search.best_index_
+            self.estimators[target] = search.best_estimator_
+            self.cv_results[target] = {
+                "r2": float(search.cv_results_['mean_test_score'][best]),
+                "r2_std": float(search.cv_results_['std_test_score'][best]),
+                "params": search.best_params_
+            }
+        self.rows_trained = len(features)
+        self.revenue_reference = float(np.quantile(targets['gunluk_gelir'], REVENUE_REFERENCE_QUANTILE))
+        return self
+
+    def predict(self, features):
+        """Tahmin sütunları (FORECAST_TARGETS değerleri); parça parça hesaplanır"""
+        predictions = {column: np.empty(len(features)) for column in FORECAST_TARGETS.values()}
+        for start in range(0, len(features), FORECAST_BATCH_ROWS):
+            batch = features[start:start + FORECAST_BATCH_ROWS]
+            for target, column in FORECAST_TARGETS.items():
+                predictions[column][start:start + len(batch)] = self.estimators[target].predict(batch)
+        predictions['tahmini_kullanim'] = np.clip(predictions['tahmini_kullanim'], 0, 1)
+        predictions['tahmini_gelir'] = np.maximum(predictions['tahmini_gelir'], 0)
+        return pd.DataFrame(predictions)
+
+    def predict_sites(self, lats, lngs, demographic_df, station_index, **feature_options):
+        """Aday koordinatlar için tahmin (özellik seçenekleri için bkz. site_features)"""
+        return self.predict(site_features(lats, lngs, demographic_df, station_index, **feature_options))
+
+    def demand_potential(self, predicted_revenue):
+        """Tahmini günlük geliri 0-10 talep potansiyeline ölçekle (potansiyel puandaki demografik bileşen)"""
+        return 10 * np.clip(np.asarray(predicted_revenue, dtype=np.float64) / self.revenue_reference, 0, 1)
+
+    def summary(self):
+        """Hedef başına CV başarımı ve seçilen parametreler"""
+        return pd.DataFrame({
+            target: {"r2": result["r2"], "r2_std": result["r2_std"], **result["params"]}
+            for target, result in self.cv_results.items()
+        }).T.rename_axis("hedef")
+
+def model_path(version, model_dir=MODEL_DIR):
+    """Model dosyasının yolu; sürüm anahtarı dosya adına uygun hale getirilir"""
+    safe_version = re.sub(r"[^0-9A-Za-z_.-]+", "_", str(version))
+    return Path(model_dir) / f"demand-{safe_version}.joblib"
+
+def train_demand_model(stations_df, demographic_df, station_index=None, version=None, n_jobs=FORECAST_JOBS):
+    """İstasyon ağından talep modeli eğit; yeterli etiketli istasyon yoksa None"""
+    rows = training_sample(stations_df)
+    if len(rows) < FORECAST_MIN_ROWS:
+        return None
+    if station_index is None:
+        station_index = GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+    sample = stations_df.iloc[rows]
+    features = site_features(
+        sample['lat'].to_numpy(), sample['lng'].to_numpy(), demographic_df, station_index,
+        power_kw=sample['güç_kw'].to_numpy(dtype=np.float64), sockets=sample['soket_sayisi'].to_numpy(dtype=np.float64),
+        exclude_self=True
+    )
+    targets = {target: sample[target].to_numpy(dtype=np.float64) for target in FORECAST_TARGETS}
+    return DemandModel(version=version).fit(features, targets, n_jobs=n_jobs)
+
+def load_or_train_model(version, stations_df, demographic_df, station_index=None, model_dir=MODEL_DIR, n_jobs=FORECAST_JOBS):
+    """Kayıtlı modeli yükle; yoksa eğit ve kaydet (eğitilemezse None)"""
+    path = model_path(version, model_dir)
+    if path.exists():
+        model = joblib.load(path)
+        if isinstance(model, DemandModel) and model.features == FORECAST_FEATURES:
+            return model
+    model = train_demand_model(stations_df, demographic_df, station_index, version=version, n_jobs=n_jobs)
+    if model is None:
+        return None
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Eşzamanlı yazıcılar (ör. arayüz ve servis süreçleri) aynı geçici dosyayı paylaşmasın
+    temporary = path.with_name(f"{path.stem}.{uuid.uuid4().hex[:8]}.tmp")
+    joblib.dump(model, temporary)
+    temporary.replace(path)
+    return model
+
+_model_jobs = {}  # Temel sürüm -> yükleme/eğitim işi (süreç içinde paylaşılır)
+_model_jobs_lock = threading.Lock()
+_model_executor = None
+
+def demand_model_job(version, stations_df, demographic_df, station_index=None):
+    """Sürüm başına tek talep modeli işi (arka planda load_or_train_model)
+
+    Aynı sürüm için eşzamanlı çağrılar aynı işi (Future) alır; model süreç
+    içinde bir kez yüklenir veya eğitilir. Yeni sürüm istendiğinde diğer
+    sürümlerin tamamlanmış işleri bırakılır.
+    """
+    global _model_executor
+    with _model_jobs_lock:
+        job = _model_jobs.get(version)
+        if job is None:
+            if _model_executor is None:
+                _model_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="evc-forecast")
+            for other in [key for key, other_job in _model_jobs.items() if other_job.done()]:
+                del _model_jobs[other]
+            job = _model_executor.submit(load_or_train_model, version, stations_df, demographic_df, station_index)
+            _model_jobs[version] = job
+        return job
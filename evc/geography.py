@@ -0,0 +1,199 @@
+"""İl ve ilçe düzeyinde vektörize bölge ataması
+
+İl merkezleri paketle gelen `geodata/provinces.csv` dosyasından okunur
+(CITIES sırası). İsteğe bağlı yerel dosyalar GEOGRAPHY_DIR altında aranır:
+
+    provinces.geojson   il sınırları (özellik: "il")
+    districts.csv       ilçe merkezleri (sütunlar: il, ilce, lat, lng)
+    districts.geojson   ilçe sınırları (özellikler: "il", "ilce")
+
+Bir nokta önce KD-ağacıyla en yakın birkaç bölge merkezine eşlenir; sınır
+poligonları varsa bu adaylar sırayla nokta-içinde-poligon testiyle
+doğrulanır. Hiçbir adayın poligonuna düşmeyen (veya poligonu olmayan)
+noktalar en yakın merkezin bölgesine atanır. Testler bölge başına toplu
+yapılır, böylece milyonlarca nokta Python döngüsü olmadan atanır.
+"""
+import json
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from evc.config import CITIES, CITY_CENTERS, GEOGRAPHY_DIR
+from evc.spatial import GeoIndex
+
+REGION_CANDIDATES = 8  # Poligon testi yapılacak en yakın merkez sayısı
+ASSIGN_BATCH_ROWS = 1_000_000  # Toplu atamada parça boyutu (aday matrisi belleği sınırlı kalsın)
+
+def _geometry_paths(geometry):
+    """GeoJSON (Multi)Polygon geometrisinin dış halkaları (delikler yok sayılır)"""
+    from matplotlib.path import Path as PolygonPath
+
+    if geometry is None:
+        return []
+    if geometry["type"] == "Polygon":
+        polygons = [geometry["coordinates"]]
+    elif geometry["type"] == "MultiPolygon":
+        polygons = geometry["coordinates"]
+    else:
+        return []
+    return [PolygonPath(np.asarray(polygon[0], dtype=np.float64)[:, :2]) for polygon in polygons]
+
+def _ring_centroid(path):
+    """Halkanın alan ağırlıklı merkezi (boylam, enlem) ve alanı"""
+    x, y = path.vertices[:, 0], path.vertices[:, 1]
+    cross = x * np.roll(y, -1) - np.roll(x, -1) * y
+    area = cross.sum() / 2
+    if area == 0:
+        return x.mean(), y.mean(), 0.0
+    return ((x + np.roll(x, -1)) * cross).sum() / (6 * area), ((y + np.roll(y, -1)) * cross).sum() / (6 * area), abs(area)
+
+def read_boundaries(path, key_fields):
+    """GeoJSON sınır dosyasını {anahtar: [Path, ...]} sözlüğüne oku (dosya yoksa boş)"""
+    if not path.exists():
+        return {}
+    features = json.loads(path.read_text(encoding="utf-8"))["features"]
+    boundaries = {}
+    for feature in features:
+        properties = feature.get("properties") or {}
+        key = tuple(properties.get(field) for field in key_fields)
+        boundaries.setdefault(key if len(key) > 1 else key[0], []).extend(_geometry_paths(feature.get("geometry")))
+    return boundaries
+
+class RegionIndex:
+    """Bölge merkezleri ve (varsa) sınır poligonları üzerinde nokta -> bölge ataması
+
+    `regions`: en az `lat` ve `lng` sütunları olan DataFrame; atama sonucu bu
+    tablodaki satır pozisyonlarıdır. `boundaries`: satır pozisyonu -> Path listesi.
+    """
+
+    def __init__(self, regions, boundaries=None):
+        self.regions = regions.reset_index(drop=True)
+        self.index = GeoIndex(self.regions['lat'].to_numpy(), self.regions['lng'].to_numpy())
+        self.boundaries = {position: paths for position, paths in (boundaries or {}).items() if paths}
+        # Bölge başına sınır kutusu (xmin, ymin, xmax, ymax); kutu dışındaki noktalar poligon testine girmez
+        self.extents = {
+            position: np.concatenate([path.vertices for path in paths]).min(axis=0).tolist()
+            + np.concatenate([path.vertices for path in paths]).max(axis=0).tolist()
+            for position, paths in self.boundaries.items()
+        }
+
+    def __len__(self):
+        return len(self.regions)
+
+    def _inside(self, points, regions):
+        """Her nokta kendi aday bölgesinin poligonlarından birinin içinde mi (bölge başına toplu test)"""
+        inside = np.zeros(len(points), dtype=bool)
+        order = np.argsort(regions, kind="stable")
+        for group in np.split(order, np.flatnonzero(np.diff(regions[order])) + 1):
+            region = int(regions[group[0]])
+            paths = self.boundaries.get(region)
+            if paths is None:
+                continue
+            xmin, ymin, xmax, ymax = self.extents[region]
+            group_points = points[group]
+            in_box = (
+                (group_points[:, 0] >= xmin) & (group_points[:, 0] <= xmax)
+                & (group_points[:, 1] >= ymin) & (group_points[:, 1] <= ymax)
+            )
+            group, group_points = group[in_box], group_points[in_box]
+            for path in paths:
+                inside[group] |= path.contains_points(group_points)
+        return inside
+
+    def _assign_batch(self, lat, lng, workers):
+        _, nearest = self.index.nearest(lat, lng, workers=workers)
+        assigned = np.asarray(nearest, dtype=np.int64).reshape(len(lat))
+        if not self.boundaries:
+            return assigned
+
+        # Çoğu nokta en yakın merkezin poligonundadır; diğerleri için sonraki adaylar yakınlık sırasıyla denenir
+        points = np.column_stack([lng, lat])
+        unresolved = np.flatnonzero(~self._inside(points, assigned))
+        k = min(REGION_CANDIDATES, len(self))
+        if not len(unresolved) or k < 2:
+            return assigned
+        _, candidates = self.index.nearest(lat[unresolved], lng[unresolved], k=k, workers=workers)
+        candidates = np.asarray(candidates, dtype=np.int64).reshape(len(unresolved), k)
+        remaining = np.arange(len(unresolved))
+        for rank in range(1, k):
+            regions = candidates[remaining, rank]
+            inside = self._inside(points[unresolved[remaining]], regions)
+            assigned[unresolved[remaining[inside]]] = regions[inside]
+            remaining = remaining[~inside]
+            if not len(remaining):
+                break
+        return assigned
+
+    def assign(self, lat, lng, workers=1):
+        """Koordinat dizilerini bölge satır pozisyonlarına ata"""
+        lat = np.atleast_1d(np.asarray(lat, dtype=np.float64)).ravel()
+        lng = np.atleast_1d(np.asarray(lng, dtype=np.float64)).ravel()
+        if len(lat) <= ASSIGN_BATCH_ROWS:
+            return self._assign_batch(lat, lng, workers)
+        return np.concatenate([
+            self._assign_batch(lat[start:start + ASSIGN_BATCH_ROWS], lng[start:start + ASSIGN_BATCH_ROWS], workers)
+            for start in range(0, len(lat), ASSIGN_BATCH_ROWS)
+        ])
+
+@lru_cache(maxsize=1)
+def province_index():
+    """81 il için bölge indeksi (satır pozisyonları CITIES sırasındadır)"""
+    regions = pd.DataFrame({
+        "il": CITIES,
+        "lat": [CITY_CENTERS[city][0] for city in CITIES],
+        "lng": [CITY_CENTERS[city][1] for city in CITIES]
+    })
+    boundaries = read_boundaries(GEOGRAPHY_DIR / "provinces.geojson", ("il",))
+    positions = {city: position for position, city in enumerate(CITIES)}
+    return RegionIndex(regions, {positions[name]: paths for name, paths in boundaries.items() if name in positions})
+
+@lru_cache(maxsize=1)
+def district_index():
+    """İlçe bölge indeksi; yerel ilçe dosyası yoksa None
+
+    Merkezler districts.csv dosyasından okunur; yalnızca districts.geojson
+    varsa merkezler poligonlardan (en büyük halkanın ağırlık merkezi) hesaplanır.
+    """
+    boundaries = read_boundaries(GEOGRAPHY_DIR / "districts.geojson", ("il", "ilce"))
+    centers_path = GEOGRAPHY_DIR / "districts.csv"
+    if centers_path.exists():
+        regions = pd.read_csv(centers_path, usecols=["il", "ilce", "lat", "lng"])
+    elif boundaries:
+        rows = []
+        for (province, district), paths in boundaries.items():
+            lng, lat, _ = max((_ring_centroid(path) for path in paths), key=lambda centroid: centroid[2])
+            rows.append({"il": province, "ilce": district, "lat": lat, "lng": lng})
+        regions = pd.DataFrame(rows)
+    else:
+        return None
+    positions = {key: position for position, key in enumerate(zip(regions['il'], regions['ilce']))}
+    return RegionIndex(regions, {positions[key]: paths for key, paths in boundaries.items() if key in positions})
+
+def assign_provinces(lat, lng, workers=1):
+    """Koordinatların bulunduğu illerin CITIES pozisyonları"""
+    return province_index().assign(lat, lng, workers=workers)
+
+def _assign_districts(lat, lng, province_positions, workers):
+    """İlçe adları; atanan ilçe noktanın iline ait değilse (eksik ilçe verisi) boş"""
+    districts = district_index()
+    district_positions = districts.assign(lat, lng, workers=workers)
+    names = districts.regions['ilce'].to_numpy(dtype=object)[district_positions]
+    provinces = np.asarray(CITIES, dtype=object)[province_positions]
+    return np.where(districts.regions['il'].to_numpy(dtype=object)[district_positions] == provinces, names, None)
+
+def assign_regions(lat, lng, workers=-1):
+    """Toplu il (ve ilçe dosyası varsa ilçe) ataması; `il` ve `ilce` sütunlu DataFrame"""
+    province_positions = assign_provinces(lat, lng, workers)
+    regions = pd.DataFrame({"il": pd.Categorical.from_codes(province_positions, categories=CITIES)})
+    if district_index() is not None:
+        regions["ilce"] = pd.Categorical(_assign_districts(lat, lng, province_positions, workers))
+    return regions
+
+def locate(lat, lng):
+    """Tek bir noktanın ili ve (ilçe dosyası varsa) ilçesi"""
+    province_positions = assign_provinces(lat, lng)
+    district = None
+    if district_index() is not None:
+        district = _assign_districts(lat, lng, province_positions, 1)[0]
+    return {"province": CITIES[int(province_positions[0])], "district": district}
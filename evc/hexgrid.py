@@ -0,0 +1,71 @@
+"""Altıgen (hex) ızgara üzerinde istasyon toplulaştırma"""
+import numpy as np
+
+from evc.config import EARTH_RADIUS_KM
+
+HEX_SIZES_KM = [100, 50, 25, 10, 5]  # Altıgen merkezinden köşesine uzaklık
+HEX_REFERENCE_LAT = 39.0  # Eşdikdörtgen izdüşüm için referans enlem
+
+def _project_km(lat, lng):
+    """Enlem/boylamı referans enlemde eşdikdörtgen izdüşümle km cinsine çevir"""
+    x = np.radians(lng) * EARTH_RADIUS_KM * np.cos(np.radians(HEX_REFERENCE_LAT))
+    y = np.radians(lat) * EARTH_RADIUS_KM
+    return x, y
+
+def _unproject_km(x, y):
+    """_project_km dönüşümünün tersi"""
+    lng = np.degrees(x / (EARTH_RADIUS_KM * np.cos(np.radians(HEX_REFERENCE_LAT))))
+    lat = np.degrees(y / EARTH_RADIUS_KM)
+    return lat, lng
+
+def hex_cells(lat, lng, size_km):
+    """Noktaları sivri tepeli altıgen ızgaranın eksenel (q, r) hücrelerine ata"""
+    x, y = _project_km(np.asarray(lat, dtype=np.float64), np.asarray(lng, dtype=np.float64))
+    q = (np.sqrt(3) / 3 * x - y / 3) / size_km
+    r = (2 / 3 * y) / size_km
+    
+    # Küp koordinatlarında yuvarlama
+    s = -q - r
+    rq, rr, rs = np.round(q), np.round(r), np.round(s)
+    dq, dr, ds = np.abs(rq - q), np.abs(rr - r), np.abs(rs - s)
+    fix_q = (dq > dr) & (dq > ds)
+    fix_r = ~fix_q & (dr > ds)
+    rq = np.where(fix_q, -rr - rs, rq)
+    rr = np.where(fix_r, -rq - rs, rr)
+    return rq.astype(np.int64), rr.astype(np.int64)
+
+def _hex_center_km(q, r, size_km):
+    q, r = np.asarray(q, dtype=np.float64), np.asarray(r, dtype=np.float64)
+    return size_km * np.sqrt(3) * (q + r / 2), size_km * 1.5 * r
+
+def hex_centers(q, r, size_km):
+    """Hücre merkezlerinin (enlem, boylam) dizileri"""
+    return _unproject_km(*_hex_center_km(q, r, size_km))
+
+def hex_polygons(q, r, size_km):
+    """Hücrelerin köşe koordinatlarını [hücre, köşe, (boylam, enlem)] dizisi olarak döndür"""
+    center_x, center_y = _hex_center_km(q, r, size_km)
+    angles = np.radians(60 * np.arange(6) - 30)
+    corner_x = center_x[:, None] + size_km * np.cos(angles)[None, :]
+    corner_y = center_y[:, None] + size_km * np.sin(angles)[None, :]
+    lat, lng = _unproject_km(corner_x, corner_y)
+    return np.stack([lng, lat], axis=-1)
+
+def hex_size_for_zoom(zoom, pixels=30):
+    """Zoom seviyesinde ekranda yaklaşık `pixels` genişliğe denk gelen altıgen boyutunu seç"""
+    km_per_pixel = 156.543 * np.cos(np.radians(HEX_REFERENCE_LAT)) / 2 ** zoom
+    target = pixels * km_per_pixel
+    return min(HEX_SIZES_KM, key=lambda size: abs(np.log(size / target)))
+
+def aggregate_hex(stations_df, size_km):
+    """İstasyonları altıgen hücrelerde tek bir vektörize group-by ile özetle"""
+    q, r = hex_cells(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy(), size_km)
+    aggregated = stations_df[['soket_sayisi', 'güç_kw', 'kullanim_orani', 'gunluk_gelir']].groupby([q, r]).agg(
+        istasyon_sayisi=('soket_sayisi', 'size'),
+        soket_sayisi=('soket_sayisi', 'sum'),
+        ort_guc_kw=('güç_kw', 'mean'),
+        ort_kullanim=('kullanim_orani', 'mean'),
+        toplam_gunluk_gelir=('gunluk_gelir', 'sum')
+    )
+    aggregated.index.names = ['q', 'r']
+    return aggregated.reset_index()
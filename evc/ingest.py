@@ -0,0 +1,369 @@
+"""Gerçek istasyon listelerinin ve durum anlık görüntülerinin akış halinde içe aktarımı
+
+    python -m evc.ingest locations.json                 # depoya birleştir (ekle/güncelle/sil)
+    python -m evc.ingest dump.ndjson --replace          # depoyu dosyanın içeriğiyle değiştir
+    python -m evc.ingest evse_status.csv                # yalnızca kullanım oranlarını güncelle
+
+Desteklenen girdiler:
+    * OCPI Location nesneleri: JSON dizisi, OCPI yanıtı ({"data": [...]}) veya
+      satır başına bir nesne (NDJSON). `publish: false` olan ya da tüm EVSE'leri
+      REMOVED olan lokasyonlar silinir.
+    * Düz istasyon kayıtları (CSV veya JSON): istasyon şeması sütunları ya da
+      COLUMN_ALIASES içindeki İngilizce adlar; `islem` sütunu "sil" ise satır silinir.
+    * EVSE durum kayıtları (location_id, evse_uid, status): lokasyon başına
+      kullanım oranı = CHARGING durumundaki EVSE payı.
+
+Dosyalar parça parça okunur; her parça doğrulanıp istasyon şemasına
+normalize edilir ve depo yazıcısına aktarılır, böylece bellek kullanımı
+dosya boyutundan bağımsızdır.
+"""
+import argparse
+import json
+import re
+from collections import Counter, namedtuple
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from evc.config import CITIES, STATION_STORE, TURKEY_BOUNDS
+from evc.geography import assign_provinces
+from evc.store import StationStoreWriter
+
+INGEST_CHUNK_ROWS = 50_000
+JSON_READ_CHARS = 1 << 20
+COORDINATE_MARGIN_DEG = 0.5  # Türkiye sınır kutusu dışında kabul edilen pay
+MAX_POWER_KW = 1000
+MAX_SOCKETS = 100
+DELETE_ACTIONS = {"sil", "delete", "deleted", "remove", "removed", "d"}
+UNKNOWN_OPERATOR = "Bilinmiyor"
+
+# Düz kayıtlarda kabul edilen İngilizce sütun adları -> istasyon şeması
+COLUMN_ALIASES = {
+    "id": "istasyon_id", "station_id": "istasyon_id", "location_id": "istasyon_id",
+    "name": "isim", "station_name": "isim",
+    "operator": "operatör", "operator_name": "operatör", "operator_id": "operatör",
+    "power_kw": "güç_kw", "max_power_kw": "güç_kw",
+    "power_type": "akim", "current_type": "akim",
+    "sockets": "soket_sayisi", "connectors": "soket_sayisi", "socket_count": "soket_sayisi",
+    "latitude": "lat", "longitude": "lng", "lon": "lng",
+    "utilization": "kullanim_orani", "daily_revenue": "gunluk_gelir", "installed_at": "kurulum_tarihi",
+    "action": "islem"
+}
+
+StationChanges = namedtuple("StationChanges", ["upserts", "deletes", "patches", "rejected"])
+
+class _JsonStream:
+    """Metin akışı üzerinde sırayla JSON değerleri çözen okuyucu (yalnızca bir parça tamponlanır)"""
+    _WHITESPACE = re.compile(r"[ \t\r\n]*")
+
+    def __init__(self, source, read_chars=JSON_READ_CHARS):
+        self.source = source
+        self.read_chars = read_chars
+        self.decoder = json.JSONDecoder()
+        self.buffer, self.position, self.eof = "", 0, False
+
+    def _fill(self):
+        chunk = self.source.read(self.read_chars)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.position:] + chunk
+        self.position = 0
+        return True
+
+    def peek(self):
+        """Boşlukları atla; sıradaki karakter (dosya sonunda boş)"""
+        while True:
+            self.position = self._WHITESPACE.match(self.buffer, self.position).end()
+            if self.position < len(self.buffer):
+                return self.buffer[self.position]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"JSON: '{char}' bekleniyordu (konum {self.position})")
+        self.position += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # Tamponun sonunda biten bir sayı yarım okunmuş olabilir
+            if end == len(self.buffer) and not self.eof and self._fill():
+                continue
+            self.position = end
+            return value
+
+    def array(self):
+        """Dizinin elemanlarını tek tek döndür"""
+        self.expect("[")
+        while True:
+            char = self.peek()
+            if char == "]":
+                self.position += 1
+                return
+            if char == ",":
+                self.position += 1
+                continue
+            if not char:
+                raise ValueError("JSON: dizi kapanmadan dosya bitti")
+            yield self.value()
+
+    def first_object(self):
+        """İlk üst düzey nesne: "data" dizisi içeriyorsa elemanları, yoksa nesnenin kendisi"""
+        self.expect("{")
+        record, wrapped = {}, False
+        while True:
+            char = self.peek()
+            if char == "}":
+                self.position += 1
+                break
+            if char == ",":
+                self.position += 1
+                continue
+            key = self.value()
+            self.expect(":")
+            if key == "data" and self.peek() == "[":
+                wrapped = True
+                yield from self.array()
+            else:
+                record[key] = self.value()
+        if not wrapped:
+            yield record
+
+def iter_json_records(path, read_chars=JSON_READ_CHARS):
+    """JSON dizisi, OCPI yanıtı veya NDJSON dosyasındaki kayıtları sabit bellekle akıt"""
+    with open(path, encoding="utf-8") as source:
+        stream = _JsonStream(source, read_chars)
+        first = stream.peek()
+        if first == "[":
+            yield from stream.array()
+        elif first == "{":
+            yield from stream.first_object()
+            while stream.peek() == "{":
+                yield stream.value()
+        elif first:
+            raise ValueError(f"{path}: JSON dizisi veya nesnesi bekleniyordu")
+
+def _chunks(records, chunk_rows):
+    chunk = []
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+def _record_kind(record):
+    if "evse_uid" in record and "status" in record:
+        return "status"
+    if "coordinates" in record or "evses" in record:
+        return "ocpi"
+    return "flat"
+
+def _location_id(record, id_field="id"):
+    """CPO'lar arasında çakışmasın diye ülke ve parti kodlu OCPI lokasyon kimliği"""
+    return "-".join(str(part) for part in (record.get("country_code"), record.get("party_id"), record.get(id_field)) if part)
+
+def _connector_power_w(connector):
+    if connector.get("max_electric_power"):
+        return float(connector["max_electric_power"])
+    phases = 3 if connector.get("power_type") == "AC_3_PHASE" else 1
+    return float(connector.get("max_voltage") or 0) * float(connector.get("max_amperage") or 0) * phases
+
+def _ocpi_station(location):
+    """OCPI Location -> (istasyon satırı veya None, silinecek mi)"""
+    evses = location.get("evses") or []
+    active = [evse for evse in evses if evse.get("status") != "REMOVED"]
+    if location.get("publish") is False or (evses and not active):
+        return None, True
+    connectors = [connector for evse in active for connector in evse.get("connectors") or []]
+    statuses = [evse.get("status") for evse in active if evse.get("status")]
+    coordinates = location.get("coordinates") or {}
+    operator = (location.get("operator") or {}).get("name") or (location.get("owner") or {}).get("name") or location.get("party_id")
+    return {
+        "istasyon_id": _location_id(location),
+        "isim": location.get("name"),
+        "operatör": operator,
+        "güç_kw": max((_connector_power_w(connector) for connector in connectors), default=np.nan) / 1000,
+        "akim": "DC" if any(connector.get("power_type") == "DC" for connector in connectors) else "AC",
+        "soket_sayisi": len(connectors) or len(active),
+        "lat": coordinates.get("latitude"),
+        "lng": coordinates.get("longitude"),
+        "kullanim_orani": statuses.count("CHARGING") / len(statuses) if statuses else np.nan,
+        "kurulum_tarihi": None
+    }, False
+
+def _numeric(frame, column):
+    if column not in frame:
+        return pd.Series(np.nan, index=frame.index)
+    return pd.to_numeric(frame[column], errors="coerce")
+
+def validate_stations(frame):
+    """Ham satırları doğrula ve istasyon şemasına normalize et; (geçerli satırlar, ret sayaçları)"""
+    frame = frame.rename(columns=COLUMN_ALIASES)
+    rejected = Counter()
+    ids = frame['istasyon_id'].astype("string").str.strip() if 'istasyon_id' in frame else pd.Series(pd.NA, index=frame.index, dtype="string")
+    lat, lng = _numeric(frame, 'lat'), _numeric(frame, 'lng')
+    power_kw = _numeric(frame, 'güç_kw').round()
+    sockets = _numeric(frame, 'soket_sayisi').fillna(1)
+
+    lat_min, lat_max, lng_min, lng_max = TURKEY_BOUNDS
+    checks = {
+        "kimlik eksik": ids.isna() | (ids == ""),
+        "koordinat": ~(lat.between(lat_min - COORDINATE_MARGIN_DEG, lat_max + COORDINATE_MARGIN_DEG)
+                       & lng.between(lng_min - COORDINATE_MARGIN_DEG, lng_max + COORDINATE_MARGIN_DEG)),
+        "güç": ~power_kw.between(1, MAX_POWER_KW),
+        "soket": ~sockets.between(1, MAX_SOCKETS)
+    }
+    invalid = pd.Series(False, index=frame.index)
+    for reason, failed in checks.items():
+        failed = failed.fillna(True) & ~invalid  # her satır ilk hatasıyla sayılır
+        rejected[reason] += int(failed.sum())
+        invalid |= failed
+    valid = ~invalid.to_numpy()
+
+    frame, ids, lat, lng = frame[valid], ids[valid], lat[valid].to_numpy(), lng[valid].to_numpy()
+    power_kw = power_kw[valid].astype(np.int32)
+    if 'güç_tipi' in frame:
+        power_type = frame['güç_tipi'].astype("string")
+    else:
+        current = frame['akim'].astype("string").str.upper().str[:2] if 'akim' in frame else pd.Series(pd.NA, index=frame.index, dtype="string")
+        current = current.where(current.isin(["AC", "DC"]), np.where(power_kw > 22, "DC", "AC"))
+        power_type = current + " " + power_kw.astype(str) + "kW"
+    usage = _numeric(frame, 'kullanim_orani')
+    names = frame['isim'].astype("string") if 'isim' in frame else ids
+    operators = frame['operatör'].astype("string") if 'operatör' in frame else pd.Series(pd.NA, index=frame.index, dtype="string")
+
+    stations = pd.DataFrame({
+        "istasyon_id": ids.to_numpy(dtype=object),
+        "isim": names.fillna(ids).to_numpy(dtype=object),
+        "sehir": np.asarray(CITIES, dtype=object)[assign_provinces(lat, lng, workers=-1)],
+        "operatör": operators.fillna(UNKNOWN_OPERATOR).to_numpy(dtype=object),
+        "güç_tipi": power_type.to_numpy(dtype=object),
+        "güç_kw": power_kw.to_numpy(),
+        "soket_sayisi": sockets[valid].astype(np.int32).to_numpy(),
+        "lat": lat,
+        "lng": lng,
+        "kullanim_orani": usage.where(usage.between(0, 1)).to_numpy(dtype=np.float64),
+        "gunluk_gelir": _numeric(frame, 'gunluk_gelir').to_numpy(dtype=np.float64),
+        "kurulum_tarihi": pd.to_datetime(frame['kurulum_tarihi'], errors="coerce").to_numpy() if 'kurulum_tarihi' in frame else pd.NaT
+    })
+    return stations.drop_duplicates('istasyon_id', keep='last').reset_index(drop=True), rejected
+
+def normalize_records(records):
+    """Bir parça OCPI veya düz istasyon kaydını StationChanges'e çevir"""
+    rows = []
+    for record in records:
+        if _record_kind(record) == "ocpi":
+            station, deleted = _ocpi_station(record)
+            # Silinen lokasyonlar akış sırası korunsun diye silme satırı olarak yerinde kalır
+            rows.append({"istasyon_id": _location_id(record), "islem": "sil"} if deleted else station)
+        else:
+            rows.append(record)
+    return normalize_frame(pd.DataFrame(rows))
+
+def normalize_frame(frame, deletes=()):
+    """Düz istasyon satırlarını (CSV parçası) StationChanges'e çevir
+
+    Silmeler parçadaki eklemelerden önce uygulanmak üzere döndürülür; bu yüzden
+    parça içinde silme satırından önce gelen ekleme/güncellemeler atılır.
+    """
+    deletes = list(deletes)
+    frame = frame.rename(columns=COLUMN_ALIASES)
+    if 'islem' in frame:
+        delete_rows = frame['islem'].astype("string").str.strip().str.lower().isin(DELETE_ACTIONS).to_numpy()
+        delete_ids = frame.loc[delete_rows, 'istasyon_id'].astype(str).str.strip()
+        deletes += delete_ids.tolist()
+        last_delete = pd.Series(np.flatnonzero(delete_rows), index=delete_ids.to_numpy()).groupby(level=0).max()
+        ids = frame['istasyon_id'].astype(str).str.strip()
+        superseded = (ids.map(last_delete) > np.arange(len(frame))).to_numpy()
+        frame = frame[~delete_rows & ~superseded]
+    if not len(frame):
+        return StationChanges(frame.iloc[:0], deletes, None, Counter())
+    upserts, rejected = validate_stations(frame)
+    return StationChanges(upserts, deletes, None, rejected)
+
+def fold_statuses(statuses, records):
+    """EVSE durum kayıtlarını lokasyon -> {evse_uid: son durum} sözlüğüne işle
+
+    Aynı lokasyonun EVSE'leri dosyanın farklı parçalarında olabileceği için
+    durumlar dosya sonuna kadar bu sözlükte tutulur; bellek kayıt sayısıyla
+    değil farklı EVSE sayısıyla büyür.
+    """
+    for record in records:
+        statuses.setdefault(_location_id(record, "location_id"), {})[record["evse_uid"]] = record["status"]
+    return statuses
+
+def status_patches(statuses):
+    """Lokasyon başına EVSE durumlarından (bkz. fold_statuses) kullanım oranı güncellemeleri"""
+    patches = pd.DataFrame({
+        "istasyon_id": list(statuses),
+        "kullanim_orani": [
+            sum(status == "CHARGING" for status in evses.values()) / max(sum(status != "REMOVED" for status in evses.values()), 1)
+            for evses in statuses.values()
+        ]
+    })
+    return StationChanges(None, [], patches, Counter())
+
+def iter_changes(path, chunk_rows=INGEST_CHUNK_ROWS):
+    """Dosyayı parça parça okuyup StationChanges akışına çevir"""
+    path = Path(path)
+    if path.suffix.lower() == ".csv":
+        chunks = (chunk.to_dict("records") for chunk in pd.read_csv(path, chunksize=chunk_rows, dtype=str))
+    else:
+        chunks = _chunks(iter_json_records(path), chunk_rows)
+
+    statuses = {}
+    for records in chunks:
+        station_records = [record for record in records if _record_kind(record) != "status"]
+        fold_statuses(statuses, (record for record in records if _record_kind(record) == "status"))
+        if station_records:
+            yield normalize_records(station_records)
+    if statuses:
+        yield status_patches(statuses)
+
+def ingest(paths, store_path=STATION_STORE, replace=False, chunk_rows=INGEST_CHUNK_ROWS):
+    """Dosyaları depoya uygula; içe aktarım özetini döndür"""
+    writer = StationStoreWriter(store_path, replace=replace)
+    records, rejected = 0, Counter()
+    for path in paths:
+        for changes in iter_changes(path, chunk_rows):
+            # Parçadaki silmeler önce uygulanır (bkz. normalize_frame); sonraki eklemeler istasyonu geri getirir
+            writer.delete(changes.deletes)
+            if changes.upserts is not None:
+                writer.upsert(changes.upserts)
+                records += len(changes.upserts)
+            if changes.patches is not None:
+                writer.patch(changes.patches)
+                records += len(changes.patches)
+            records += len(changes.deletes) + sum(changes.rejected.values())
+            rejected += changes.rejected
+    return {"records": records, "rejected": dict(rejected), **writer.commit()}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OCPI/CSV istasyon dosyalarını veri deposuna aktar")
+    parser.add_argument("paths", nargs="+", type=Path, help="JSON, NDJSON veya CSV dosyaları")
+    parser.add_argument("--replace", action="store_true", help="Depoyu dosyaların içeriğiyle değiştir (varsayılan: birleştir)")
+    parser.add_argument("--store", type=Path, default=STATION_STORE, help="İstasyon deposu klasörü")
+    parser.add_argument("--chunk-rows", type=int, default=INGEST_CHUNK_ROWS, help="Parça başına kayıt sayısı")
+    args = parser.parse_args(argv)
+
+    summary = ingest(args.paths, args.store, args.replace, args.chunk_rows)
+    print(f"{summary['records']:,} kayıt okundu; {summary['upserted']:,} eklendi/güncellendi, "
+          f"{summary['deleted']:,} silindi, {summary['patched']:,} durum güncellendi")
+    for reason, count in sorted(summary['rejected'].items()):
+        if count:
+            print(f"  reddedildi ({reason}): {count:,}")
+    print(f"{summary['partitions']} bölüm yeniden yazıldı; depoda {summary['rows']:,} istasyon (sürüm {summary['dataset_version']})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""Yeniden çalıştırma (rerun) başına süre ve bellek ölçümleri
+
+Uygulamanın her çalıştırması bir "rerun" kaydıdır; `span(ad)` blokları bu
+kayda iç içe aşamalar olarak eklenir (ör. `investor/show_location_analysis/st_folium`).
+Ölçüm kapalıyken `span()` paylaşılan boş bir bağlam döndürür, yani maliyeti
+tek bir öznitelik okumasıdır.
+
+Bellek değeri, aşama boyunca süreç RSS değişimidir (Linux'ta /proc/self/statm);
+aynı süreçte eşzamanlı oturumlar varsa yaklaşık bir değerdir.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+from evc.config import DEBUG_PANEL, METRICS_JSONL, METRICS_PROM
+
+RERUN_HISTORY = 200  # Panelde ve dışa aktarımda tutulan son rerun sayısı
+
+# Süreç genelinde tamamlanan rerun kayıtları ve aşama başına birikimli toplamlar
+RERUNS = deque(maxlen=RERUN_HISTORY)
+SPAN_TOTALS = {}  # aşama -> {"count", "seconds", "max_seconds", "rss_delta_bytes"}
+RERUN_TOTALS = {"count": 0, "seconds": 0.0}
+
+_NULL_SPAN = nullcontext()
+_state = threading.local()  # Streamlit her oturumun betiğini ayrı bir iş parçacığında çalıştırır
+_lock = threading.RLock()
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+def instrumentation_enabled():
+    """Panel veya dışa aktarım açık mı"""
+    return DEBUG_PANEL or METRICS_JSONL is not None or METRICS_PROM is not None
+
+def rss_bytes():
+    """Sürecin anlık yerleşik bellek kullanımı (bayt)"""
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * _PAGE_SIZE
+    except OSError:
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+@contextmanager
+def _recorded_span(rerun, name):
+    stack = _state.stack
+    path = "/".join([*stack, name])
+    stack.append(name)
+    offset = time.perf_counter() - rerun["_start"]
+    start_rss = rss_bytes()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        stack.pop()
+        rerun["spans"].append({
+            "span": path,
+            "depth": len(stack),
+            "offset_seconds": offset,
+            "seconds": seconds,
+            "rss_delta_bytes": rss_bytes() - start_rss
+        })
+
+def span(name):
+    """Aktif rerun içinde bir ölçüm aşaması (ölçüm kapalıysa boş bağlam)"""
+    rerun = getattr(_state, "rerun", None)
+    if rerun is None:
+        return _NULL_SPAN
+    return _recorded_span(rerun, name)
+
+def timed(name=None):
+    """Fonksiyonun her çağrısını bir aşama olarak ölçen dekoratör"""
+    def decorator(function):
+        span_name = name or function.__name__
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            with span(span_name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
+
+@contextmanager
+def rerun(session=None):
+    """Bir uygulama çalıştırmasını ölç; bittiğinde kaydı geçmişe ekle ve dışa aktar"""
+    if not instrumentation_enabled():
+        yield None
+        return
+    record = {
+        "rerun_id": uuid.uuid4().hex[:12],
+        "session": session,
+        "timestamp": datetime.now().isoformat(timespec="milliseconds"),
+        "spans": [],
+        "_start": time.perf_counter()
+    }
+    _state.rerun, _state.stack = record, []
+    start_rss = rss_bytes()
+    try:
+        yield record
+    finally:
+        _state.rerun = None
+        record["seconds"] = time.perf_counter() - record.pop("_start")
+        record["rss_bytes"] = rss_bytes()
+        record["rss_delta_bytes"] = record["rss_bytes"] - start_rss
+        # Aşamalar bitiş sırasıyla eklenir; başlangıç sırasına çevir
+        record["spans"].sort(key=lambda item: item["offset_seconds"])
+        _finish(record)
+
+def _finish(record):
+    with _lock:
+        RERUNS.append(record)
+        RERUN_TOTALS["count"] += 1
+        RERUN_TOTALS["seconds"] += record["seconds"]
+        for item in record["spans"]:
+            totals = SPAN_TOTALS.setdefault(item["span"], {"count": 0, "seconds": 0.0, "max_seconds": 0.0, "rss_delta_bytes": 0})
+            totals["count"] += 1
+            totals["seconds"] += item["seconds"]
+            totals["max_seconds"] = max(totals["max_seconds"], item["seconds"])
+            totals["rss_delta_bytes"] = item["rss_delta_bytes"]
+        if METRICS_JSONL is not None:
+            with open(METRICS_JSONL, "a", encoding="utf-8") as metrics_file:
+                metrics_file.write(to_jsonl([record]))
+        if METRICS_PROM is not None:
+            # node_exporter textfile toplayıcısı yarım dosya okumasın diye atomik yazılır
+            path = Path(METRICS_PROM)
+            temporary = path.with_suffix(".tmp")
+            temporary.write_text(to_prometheus(), encoding="utf-8")
+            temporary.replace(path)
+
+def last_rerun():
+    """Bu süreçte tamamlanan son rerun kaydı (yoksa None)"""
+    with _lock:
+        return RERUNS[-1] if RERUNS else None
+
+def to_jsonl(reruns=None):
+    """Aşama başına bir JSON satırı (rerun kimliği ve zaman damgasıyla)"""
+    if reruns is None:
+        with _lock:
+            reruns = list(RERUNS)
+    lines = []
+    for record in reruns:
+        header = {"rerun_id": record["rerun_id"], "session": record["session"], "timestamp": record["timestamp"]}
+        lines.append(json.dumps({**header, "span": "rerun", "depth": -1, "offset_seconds": 0.0,
+                                 "seconds": record["seconds"], "rss_delta_bytes": record["rss_delta_bytes"]}, ensure_ascii=False))
+        lines.extend(json.dumps({**header, **item}, ensure_ascii=False) for item in record["spans"])
+    return "".join(line + "\n" for line in lines)
+
+def _label(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+def to_prometheus():
+    """Birikimli aşama metrikleri (Prometheus metin biçimi)"""
+    with _lock:
+        totals = {name: dict(values) for name, values in SPAN_TOTALS.items()}
+        rss = RERUNS[-1]["rss_bytes"] if RERUNS else rss_bytes()
+        reruns = dict(RERUN_TOTALS)
+    lines = [
+        "# HELP evc_rerun_seconds Uygulama çalıştırma süresi (saniye)",
+        "# TYPE evc_rerun_seconds summary",
+        f"evc_rerun_seconds_sum {reruns['seconds']:.6f}",
+        f"evc_rerun_seconds_count {reruns['count']}",
+        "# HELP evc_span_seconds Aşama süresi (saniye)",
+        "# TYPE evc_span_seconds summary"
+    ]
+    for name, values in sorted(totals.items()):
+        lines.append(f'evc_span_seconds_sum{{span="{_label(name)}"}} {values["seconds"]:.6f}')
+        lines.append(f'evc_span_seconds_count{{span="{_label(name)}"}} {values["count"]}')
+    lines += ["# HELP evc_span_max_seconds En uzun aşama süresi (saniye)", "# TYPE evc_span_max_seconds gauge"]
+    lines += [f'evc_span_max_seconds{{span="{_label(name)}"}} {values["max_seconds"]:.6f}' for name, values in sorted(totals.items())]
+    lines += ["# HELP evc_span_rss_delta_bytes Son çalıştırmadaki RSS değişimi (bayt)", "# TYPE evc_span_rss_delta_bytes gauge"]
+    lines += [f'evc_span_rss_delta_bytes{{span="{_label(name)}"}} {values["rss_delta_bytes"]}' for name, values in sorted(totals.items())]
+    lines += [
+        "# HELP evc_process_rss_bytes Süreç RSS (bayt)", "# TYPE evc_process_rss_bytes gauge",
+        f"evc_process_rss_bytes {rss}"
+    ]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,338 @@
+"""Folium harita katmanları (istasyonlar, özet hücreler, altıgen ve ısı katmanları)"""
+import json
+
+import branca.colormap as cm
+import folium
+import numpy as np
+from branca.element import MacroElement
+from folium.elements import JSCSSMixin
+from folium.plugins import FastMarkerCluster, HeatMap
+from jinja2 import Template
+
+from evc.config import OPERATOR_COLORS
+from evc.hexgrid import hex_polygons
+
+# Harita çizim ayarları
+MAP_CENTER = [39.9334, 32.8597]
+MAP_ZOOM = 6
+MARKER_LIMIT = 1000  # Bu sayının üzerinde tekil işaretçi yerine özet/kümeleme kullanılır
+DETAIL_ZOOM = 11  # Bu zoom seviyesinden itibaren görünümdeki istasyonlar tek tek gösterilir
+MAP_RENDER_MODES = ["Otomatik", "Tekil işaretçiler", "Kümelenmiş"]
+
+SEGMENT_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f", "#bcbd22", "#17becf"]
+
+HEX_METRICS = {
+    "İstasyon Sayısı": "istasyon_sayisi",
+    "Toplam Soket": "soket_sayisi",
+    "Ortalama Kullanım": "ort_kullanim",
+    "Toplam Günlük Gelir": "toplam_gunluk_gelir"
+}
+
+VIEWPORT_POINT_LIMIT = 20000  # Görünümde bundan fazla istasyon varsa yine özet gösterilir
+
+# FastMarkerCluster satırları: [enlem, boylam, isim, operatör, güç tipi, soket, kullanım %]
+_FAST_MARKER_CALLBACK = """
+function (row) {
+    var colors = %s;
+    var marker = L.circleMarker(new L.LatLng(row[0], row[1]), {
+        radius: 6, color: %s, fill: true, fillOpacity: 0.7
+    });
+    marker.bindPopup(
+        "<b>" + row[2] + "</b><br>Operatör: " + row[3] + "<br>Güç: " + row[4] +
+        "<br>Soket: " + row[5] + "<br>Kullanım: %%" + row[6]
+    );
+    marker.bindTooltip(row[2]);
+    return marker;
+}
+"""
+
+def cluster_cell_deg(zoom):
+    """Zoom seviyesine göre sunucu tarafı özet hücre boyutu (derece)"""
+    return 360 / 2 ** zoom / 8
+
+def _pad_bounds(bounds, padding=0.5):
+    """(güney, batı, kuzey, doğu) sınırlarını her yönde oransal olarak genişlet"""
+    south, west, north, east = bounds
+    lat_pad, lng_pad = (north - south) * padding, (east - west) * padding
+    return (south - lat_pad, west - lng_pad, north + lat_pad, east + lng_pad)
+
+def plan_station_layer(n_stations, mode, view):
+    """Görünüm ve kayıt sayısına göre çizim planını (tür, parametre) belirle"""
+    if mode == "Tekil işaretçiler" or (mode == "Otomatik" and n_stations <= MARKER_LIMIT):
+        return ("markers", None)
+    if mode == "Kümelenmiş":
+        return ("cluster", None)
+    if view["zoom"] < DETAIL_ZOOM or view["bounds"] is None:
+        return ("aggregate", cluster_cell_deg(view["zoom"]))
+    return ("viewport", _pad_bounds(view["bounds"]))
+
+def aggregate_stations_grid(stations_df, cell_deg):
+    """İstasyonları enlem/boylam hücrelerinde özetle (hücre başına sayı, soket, merkez)"""
+    cell_lat = np.floor(stations_df['lat'].to_numpy() / cell_deg).astype(np.int64)
+    cell_lng = np.floor(stations_df['lng'].to_numpy() / cell_deg).astype(np.int64)
+    aggregated = stations_df[['lat', 'lng', 'soket_sayisi']].groupby([cell_lat, cell_lng]).agg(
+        lat=('lat', 'mean'),
+        lng=('lng', 'mean'),
+        istasyon_sayisi=('lat', 'size'),
+        soket_sayisi=('soket_sayisi', 'sum')
+    )
+    return aggregated.reset_index(drop=True)
+
+def stations_in_bounds(stations_df, bounds):
+    """(güney, batı, kuzey, doğu) sınırları içindeki istasyonları döndür"""
+    south, west, north, east = bounds
+    lat, lng = stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy()
+    return stations_df[(lat >= south) & (lat <= north) & (lng >= west) & (lng <= east)]
+
+def station_points_payload(stations_df):
+    """FastMarkerCluster için kompakt nokta dizisi (popup metni tarayıcıda oluşturulur)"""
+    return list(zip(
+        stations_df['lat'].round(5).tolist(),
+        stations_df['lng'].round(5).tolist(),
+        stations_df['isim'].astype(str).tolist(),
+        stations_df['operatör'].astype(str).tolist(),
+        stations_df['güç_tipi'].astype(str).tolist(),
+        stations_df['soket_sayisi'].tolist(),
+        (stations_df['kullanim_orani'] * 100).round().astype(int).tolist()
+    ))
+
+def _fast_marker_callback(color=None):
+    """İşaretçi rengi sabit değilse operatöre göre renklendiren JS geri çağrısı"""
+    color_expression = json.dumps(color) if color else "colors[row[3]] || 'gray'"
+    return _FAST_MARKER_CALLBACK % (json.dumps(OPERATOR_COLORS, ensure_ascii=False), color_expression)
+
+def add_station_layer(m, stations_df, plan, marker_style="icon"):
+    """Çizim planına göre istasyon katmanını haritaya ekle, kullanıcıya gösterilecek açıklamayı döndür"""
+    kind, parameter = plan
+    callback = _fast_marker_callback(None if marker_style == "icon" else "blue")
+    
+    if kind == "markers":
+        for _, station in stations_df.iterrows():
+            if marker_style == "icon":
+                folium.Marker(
+                    [station['lat'], station['lng']],
+                    popup=f"""
+                    <b>{station['isim']}</b><br>
+                    Operatör: {station['operatör']}<br>
+                    Güç: {station['güç_tipi']}<br>
+                    Soket: {station['soket_sayisi']}<br>
+                    Kullanım: %{station['kullanim_orani']:.0%}
+                    """,
+                    tooltip=station['isim'],
+                    icon=folium.Icon(color=OPERATOR_COLORS.get(station['operatör'], 'gray'))
+                ).add_to(m)
+            else:
+                folium.CircleMarker(
+                    [station['lat'], station['lng']],
+                    radius=5,
+                    popup=f"{station['isim']}",
+                    color='blue',
+                    fill=True,
+                    fillOpacity=0.6
+                ).add_to(m)
+        return f"{len(stations_df):,} istasyon tekil işaretçi olarak gösteriliyor."
+    
+    if kind == "cluster":
+        FastMarkerCluster(station_points_payload(stations_df), callback=callback).add_to(m)
+        return f"{len(stations_df):,} istasyon kümelenmiş olarak gösteriliyor."
+    
+    if kind == "viewport":
+        visible = stations_in_bounds(stations_df, parameter)
+        if len(visible) <= VIEWPORT_POINT_LIMIT:
+            FastMarkerCluster(station_points_payload(visible), callback=callback).add_to(m)
+            return f"Görünümdeki {len(visible):,} istasyon gösteriliyor (toplam {len(stations_df):,})."
+        south, west, north, east = parameter
+        cells = aggregate_stations_grid(visible, max(north - south, east - west) / 20)
+        _add_cell_markers(m, cells)
+        return f"Görünümde {len(visible):,} istasyon var; {len(cells):,} bölge özeti olarak gösteriliyor."
+    
+    # Uzak zoom: hücre özetleri
+    cells = aggregate_stations_grid(stations_df, parameter)
+    _add_cell_markers(m, cells)
+    return (
+        f"{len(stations_df):,} istasyon {len(cells):,} bölge özeti olarak gösteriliyor; "
+        f"tekil istasyonlar için zoom {DETAIL_ZOOM}+ seviyesine yaklaşın."
+    )
+
+def _add_cell_markers(m, cells):
+    """Hücre özetlerini istasyon sayısıyla ölçeklenen daireler olarak haritaya ekle"""
+    max_count = max(int(cells['istasyon_sayisi'].max()), 1) if len(cells) > 0 else 1
+    for cell in cells.itertuples(index=False):
+        folium.CircleMarker(
+            [cell.lat, cell.lng],
+            radius=4 + 16 * np.sqrt(cell.istasyon_sayisi / max_count),
+            tooltip=f"{cell.istasyon_sayisi:,} istasyon, {cell.soket_sayisi:,} soket",
+            color='#1f77b4',
+            fill=True,
+            fillOpacity=0.5
+        ).add_to(m)
+
+def add_hex_layer(m, cells, size_km, metric):
+    """Altıgen özetlerini seçilen metriğe göre renklendirilmiş koroplet katmanı olarak ekle"""
+    if len(cells) == 0:
+        return
+    column = HEX_METRICS[metric]
+    values = cells[column].to_numpy(dtype=np.float64)
+    colormap = cm.linear.YlOrRd_09.scale(values.min(), max(values.max(), values.min() + 1e-9))
+    colormap.caption = metric
+    
+    polygons = hex_polygons(cells['q'].to_numpy(), cells['r'].to_numpy(), size_km).round(5)
+    features = []
+    for cell, polygon, value in zip(cells.itertuples(index=False), polygons, values):
+        ring = polygon.tolist()
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [ring + ring[:1]]},
+            "properties": {
+                "renk": colormap(value),
+                "istasyon_sayisi": int(cell.istasyon_sayisi),
+                "soket_sayisi": int(cell.soket_sayisi),
+                "ort_kullanim": f"%{cell.ort_kullanim:.0%}",
+                "toplam_gunluk_gelir": f"₺{cell.toplam_gunluk_gelir:,.0f}"
+            }
+        })
+    
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        name=f"Altıgen katman ({size_km} km)",
+        style_function=lambda feature: {
+            "fillColor": feature["properties"]["renk"],
+            "color": "#555555",
+            "weight": 0.5,
+            "fillOpacity": 0.6
+        },
+        tooltip=folium.GeoJsonTooltip(
+            fields=["istasyon_sayisi", "soket_sayisi", "ort_kullanim", "toplam_gunluk_gelir"],
+            aliases=["İstasyon", "Soket", "Ort. Kullanım", "Günlük Gelir"]
+        )
+    ).add_to(m)
+    colormap.add_to(m)
+
+def base_map(view):
+    """Verilen görünümde (merkez, zoom) boş bir harita oluştur"""
+    return folium.Map(location=view['center'], zoom_start=view['zoom'])
+
+# Dondurulmuş katman metninde harita değişkeninin yerini tutan işaret
+_MAP_PLACEHOLDER = "__evc_map__"
+
+class FrozenLayer(JSCSSMixin, MacroElement):
+    """Daha önce çizilmiş bir katmanın JavaScript metni; haritaya tek öğe olarak eklenir
+
+    Tekil işaretçiler gibi yüzlerce öğeden oluşan katmanlar her çalıştırmada
+    yeniden şablonlanmak yerine saklanan metinden çizilir.
+    """
+    _template = Template("""
+        {% macro script(this, kwargs) %}
+            {{ this.script_for_parent() }}
+        {% endmacro %}
+    """)
+
+    def __init__(self, frozen):
+        super().__init__()
+        self._name = "FrozenLayer"
+        self.script = frozen["script"]
+        self.default_js = [tuple(item) for item in frozen["js"]]
+        self.default_css = [tuple(item) for item in frozen["css"]]
+
+    def script_for_parent(self):
+        return self.script.replace(_MAP_PLACEHOLDER, self._parent.get_name())
+
+def _walk(element):
+    yield element
+    for child in element._children.values():
+        yield from _walk(child)
+
+def freeze_layer(build, view):
+    """`build(m)` ile boş bir haritaya eklenen katmanı çiz ve saklanabilir metne dönüştür
+
+    Dönüş: {"script", "js", "css", "result"}; `result`, `build` fonksiyonunun
+    dönüş değeridir (ör. katman açıklaması).
+    """
+    scratch = base_map(view)
+    existing = {element.get_name() for element in _walk(scratch)}
+    result = build(scratch)
+    figure = scratch.get_root()
+    figure.render()
+
+    added = [element for element in _walk(scratch) if element.get_name() not in existing]
+    added_names = {element.get_name() for element in added}
+    script = "\n".join(
+        element.render() for name, element in figure.script._children.items() if name in added_names
+    )
+    js = {name: url for element in added for name, url in getattr(element, "default_js", [])}
+    css = {name: url for element in added for name, url in getattr(element, "default_css", [])}
+    return {
+        "script": script.replace(scratch.get_name(), _MAP_PLACEHOLDER),
+        "js": [list(item) for item in js.items()],
+        "css": [list(item) for item in css.items()],
+        "result": result
+    }
+
+def add_frozen_layer(m, frozen):
+    """freeze_layer() çıktısını haritaya ekle; katmanın `result` değerini döndür"""
+    FrozenLayer(frozen).add_to(m)
+    return frozen["result"]
+
+def add_heatmap_layer(m, heat_points):
+    """Önceden hesaplanmış potansiyel noktalarını ısı haritası katmanı olarak ekle"""
+    HeatMap(heat_points, name="Potansiyel Isı Haritası", min_opacity=0.2, radius=12, blur=15).add_to(m)
+    folium.LayerControl().add_to(m)
+
+def add_site_layer(m, sites, coverage_km):
+    """Önerilen yeni lokasyonları sıra numaralı işaretçiler ve kapsama daireleriyle ekle"""
+    layer = folium.FeatureGroup(name="Önerilen lokasyonlar")
+    for site in sites.itertuples(index=False):
+        folium.Circle(
+            [site.lat, site.lng],
+            radius=coverage_km * 1000,
+            color='#28a745',
+            weight=1,
+            fill=True,
+            fillOpacity=0.15
+        ).add_to(layer)
+        folium.Marker(
+            [site.lat, site.lng],
+            tooltip=f"#{site.sira} - {site.sehir}: kapsama %{site.kumulatif_kapsama * 100:.1f}",
+            icon=folium.DivIcon(
+                html=f'<div style="background:#28a745;color:white;border-radius:50%;width:22px;height:22px;'
+                     f'text-align:center;line-height:22px;font-size:11px;font-weight:bold;">{site.sira}</div>',
+                icon_size=(22, 22),
+                icon_anchor=(11, 11)
+            )
+        ).add_to(layer)
+    layer.add_to(m)
+
+def add_segment_layer(m, cells, size_km):
+    """Segment numarası atanmış altıgen hücreleri kategorik renklerle ekle"""
+    if len(cells) == 0:
+        return
+    polygons = hex_polygons(cells['q'].to_numpy(), cells['r'].to_numpy(), size_km).round(5)
+    features = []
+    for cell, polygon in zip(cells.itertuples(index=False), polygons):
+        ring = polygon.tolist()
+        features.append({
+            "type": "Feature",
+            "geometry": {"type": "Polygon", "coordinates": [ring + ring[:1]]},
+            "properties": {
+                "renk": SEGMENT_COLORS[int(cell.segment) % len(SEGMENT_COLORS)],
+                "segment": f"Segment {int(cell.segment) + 1}",
+                "istasyon_sayisi": int(cell.istasyon_sayisi),
+                "ort_kullanim": f"%{cell.ort_kullanim * 100:.0f}",
+                "toplam_gunluk_gelir": f"₺{cell.toplam_gunluk_gelir:,.0f}"
+            }
+        })
+    
+    folium.GeoJson(
+        {"type": "FeatureCollection", "features": features},
+        name=f"Bölge segmentleri ({size_km} km)",
+        style_function=lambda feature: {
+            "fillColor": feature["properties"]["renk"],
+            "color": "#555555",
+            "weight": 0.5,
+            "fillOpacity": 0.6
+        },
+        tooltip=folium.GeoJsonTooltip(
+            fields=["segment", "istasyon_sayisi", "ort_kullanim", "toplam_gunluk_gelir"],
+            aliases=["Segment", "İstasyon", "Ort. Kullanım", "Günlük Gelir"]
+        )
+    ).add_to(m)
@@ -0,0 +1,154 @@
+"""Çoklu lokasyon seçimi (maksimum kapsama problemi)
+
+Talep, şehirlerin nüfus, elektrikli araç oranı ve trafik yoğunluğundan türetilip
+şehir merkezleri etrafına dağıtılan ızgara hücreleriyle temsil edilir. Mevcut
+istasyonların kapsama yarıçapındaki talep karşılanmış sayılır. Yeni lokasyonlar,
+karşılanmamış talebi en çok artıracak şekilde tembel açgözlü (CELF) yöntemle
+tek tek seçilir.
+"""
+import heapq
+
+import numpy as np
+import pandas as pd
+
+from evc.config import CITIES, EARTH_RADIUS_KM, NEARBY_RADIUS_KM, TURKEY_BOUNDS
+from evc.geography import assign_provinces
+from evc.scoring import candidate_grid
+from evc.spatial import GeoIndex, city_index
+
+DEMAND_RESOLUTION_DEG = 0.05  # Talep hücrelerinin boyutu (~5 km)
+DEMAND_SPREAD_KM = 25  # Şehir talebinin merkez etrafında dağılımı (Gauss ölçeği)
+DEMAND_CUTOFF_KM = 75  # Bu mesafenin ötesindeki hücrelerin talebi yok sayılır
+CANDIDATE_RESOLUTION_DEG = 0.01  # Varsayılan aday ızgarası (~1 km, Türkiye için ~1.2M aday)
+# Talep hücresi x aday çifti üst sınırı (~80 MB kapsama listesi, birkaç saniyelik hesap); arayüz aşan
+# yarıçap/ızgara birleşimlerinde daha kaba aday ızgarası kullanır
+MAX_COVERAGE_PAIRS = 20_000_000
+COVERAGE_BLOCK_ROWS = 16_384  # Kapsama listeleri ve başlangıç kazançları bu boyutta aday bloklarıyla hesaplanır
+
+def city_demand_weights(demographic_df):
+    """Şehir başına talep ağırlığı: nüfus x elektrikli araç oranı x trafik yoğunluğu (CITIES sırasında)"""
+    demo = demographic_df.drop_duplicates('sehir').set_index('sehir').reindex(CITIES)
+    weights = demo['nufus'] * demo['elektrikli_arac_orani'] * demo['trafik_yogunlugu']
+    return weights.fillna(0).to_numpy(dtype=np.float64)
+
+def demand_points(demographic_df, resolution_deg=DEMAND_RESOLUTION_DEG, spread_km=DEMAND_SPREAD_KM,
+                  cutoff_km=DEMAND_CUTOFF_KM, bounds=TURKEY_BOUNDS):
+    """Talep hücreleri: her şehrin talebi merkezine uzaklıkla azalan ağırlıklarla hücrelere paylaştırılır
+
+    Bir şehrin hücrelerindeki talep toplamı şehir talep ağırlığına eşittir.
+    """
+    grid_lat, grid_lng = candidate_grid(resolution_deg, bounds)
+    distances, city_positions = city_index().nearest(grid_lat, grid_lng, workers=-1)
+    keep = distances <= cutoff_km
+    grid_lat, grid_lng = grid_lat[keep], grid_lng[keep]
+    distances, city_positions = distances[keep], city_positions[keep]
+
+    decay = np.exp(-0.5 * (distances / spread_km) ** 2)
+    city_totals = np.bincount(city_positions, weights=decay, minlength=len(CITIES))
+    weights = city_demand_weights(demographic_df)[city_positions] * decay / city_totals[city_positions]
+
+    return pd.DataFrame({
+        "lat": grid_lat,
+        "lng": grid_lng,
+        "sehir": pd.Categorical.from_codes(city_positions, categories=CITIES),
+        "talep": weights
+    })
+
+def coverage_pair_estimate(n_demand, coverage_km, resolution_deg, bounds=TURKEY_BOUNDS):
+    """Kapsama listelerindeki çift sayısının kestirimi: talep hücresi x kapsama dairesindeki aday sayısı"""
+    mid_lat = (bounds[0] + bounds[1]) / 2
+    cell_km2 = (np.radians(resolution_deg) * EARTH_RADIUS_KM) ** 2 * np.cos(np.radians(mid_lat))
+    return n_demand * np.pi * coverage_km ** 2 / cell_km2
+
+def _coverage_lists(demand_df, candidate_lat, candidate_lng, coverage_km, block_rows=COVERAGE_BLOCK_ROWS):
+    """Aday -> kapsadığı talep hücreleri (CSR: başlangıç ofsetleri, talep pozisyonları) ve aday pozisyonları
+
+    Yalnızca en az bir talep hücresini kapsayan adaylar döndürülür. Çiftler aday
+    blokları halinde bulunur ve bloğun listeleri hemen 4 baytlık pozisyonlara
+    sıkıştırılır; ara bellek blok boyutuyla sınırlı kalır.
+    """
+    demand_index = GeoIndex(demand_df['lat'].to_numpy(), demand_df['lng'].to_numpy())
+    candidate_blocks, count_blocks, position_blocks = [], [], []
+    for start in range(0, len(candidate_lat), block_rows):
+        block_positions, demand_positions = demand_index.pairs_within(
+            candidate_lat[start:start + block_rows], candidate_lng[start:start + block_rows], coverage_km
+        )
+        block_candidates, counts = np.unique(block_positions, return_counts=True)
+        candidate_blocks.append(block_candidates + start)
+        count_blocks.append(counts)
+        position_blocks.append(demand_positions.astype(np.int32))
+
+    offsets = np.zeros(sum(len(counts) for counts in count_blocks) + 1, dtype=np.int64)
+    np.cumsum(np.concatenate(count_blocks), out=offsets[1:])
+    return np.concatenate(candidate_blocks), offsets, np.concatenate(position_blocks)
+
+def _initial_gains(remaining, offsets, demand_positions, block_rows=COVERAGE_BLOCK_ROWS):
+    """Aday başına karşılanmamış talep toplamı; aday blokları halinde hesaplanır"""
+    gains = np.empty(len(offsets) - 1)
+    for start in range(0, len(gains), block_rows):
+        block_offsets = offsets[start:start + block_rows + 1]
+        values = remaining[demand_positions[block_offsets[0]:block_offsets[-1]]]
+        gains[start:start + len(block_offsets) - 1] = np.add.reduceat(values, block_offsets[:-1] - block_offsets[0])
+    return gains
+
+def select_sites(n_sites, demand_df, stations_df=None, candidate_lat=None, candidate_lng=None,
+                 coverage_km=NEARBY_RADIUS_KM, station_index=None):
+    """Karşılanmamış talebi en çok artıran `n_sites` lokasyonu tembel açgözlü (CELF) yöntemle seç
+
+    Kapsama fonksiyonu alt-modüler olduğundan bir adayın kazancı yalnızca
+    azalabilir; yığının tepesindeki aday güncel değilse kazancı yeniden
+    hesaplanır ve geri itilir, güncelse seçilir. Seçilen adayın kapsadığı
+    talep hücreleri karşılanmış olarak işaretlenir.
+    """
+    if candidate_lat is None or candidate_lng is None:
+        candidate_lat, candidate_lng = candidate_grid(CANDIDATE_RESOLUTION_DEG)
+    candidate_lat = np.asarray(candidate_lat, dtype=np.float64)
+    candidate_lng = np.asarray(candidate_lng, dtype=np.float64)
+    weights = demand_df['talep'].to_numpy(dtype=np.float64)
+    total_demand = weights.sum()
+
+    # Mevcut istasyonların kapsadığı talep
+    covered = np.zeros(len(demand_df), dtype=bool)
+    if station_index is None and stations_df is not None and len(stations_df) > 0:
+        station_index = GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+    if station_index is not None and len(station_index) > 0:
+        covered = station_index.count_within(demand_df['lat'].to_numpy(), demand_df['lng'].to_numpy(), coverage_km, workers=-1) > 0
+    initial_coverage = weights[covered].sum() / total_demand if total_demand > 0 else 0.0
+
+    candidates, offsets, demand_positions = _coverage_lists(demand_df, candidate_lat, candidate_lng, coverage_km)
+    remaining = np.where(covered, 0.0, weights)
+
+    gains = _initial_gains(remaining, offsets, demand_positions)
+    heap = [(-gain, int(i), 0) for i, gain in enumerate(gains) if gain > 0]
+    heapq.heapify(heap)
+
+    selected, evaluations = [], 0
+    coverage = initial_coverage
+    while heap and len(selected) < n_sites:
+        neg_gain, i, computed_at = heapq.heappop(heap)
+        if computed_at == len(selected):
+            covered_cells = demand_positions[offsets[i]:offsets[i + 1]]
+            remaining[covered_cells] = 0.0
+            coverage += -neg_gain / total_demand
+            position = candidates[i]
+            selected.append((candidate_lat[position], candidate_lng[position], -neg_gain, coverage))
+            continue
+        gain = remaining[demand_positions[offsets[i]:offsets[i + 1]]].sum()
+        evaluations += 1
+        if gain > 0:
+            heapq.heappush(heap, (-gain, i, len(selected)))
+
+    sites = pd.DataFrame(selected, columns=["lat", "lng", "kazanc", "kumulatif_kapsama"])
+    sites.insert(0, "sira", np.arange(1, len(sites) + 1))
+    if len(sites):
+        city_positions = assign_provinces(sites['lat'].to_numpy(), sites['lng'].to_numpy())
+        sites["sehir"] = pd.Categorical.from_codes(city_positions, categories=CITIES)
+
+    return {
+        "sites": sites,
+        "initial_coverage": initial_coverage,
+        "final_coverage": coverage,
+        "total_demand": total_demand,
+        "candidates_considered": len(candidates),
+        "evaluations": evaluations
+    }
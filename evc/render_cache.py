@@ -0,0 +1,89 @@
+"""Çizilmiş harita katmanları ve grafikler için boyut sınırlı LRU önbellek
+
+Girdiler (veri sürümü + filtre/parametre durumu) değişmedikçe harita
+katmanının JavaScript metni veya Plotly grafiğinin JSON'u yeniden
+üretilmez. Önbellek toplam bayt sınırına göre en az kullanılanı atar ve
+isabet/ıska sayaçlarını tutar.
+"""
+import hashlib
+import threading
+from collections import OrderedDict
+
+RENDER_CACHE_BYTES = 256 * 1024 * 1024
+
+def render_key(*parts):
+    """Anahtar parçalarından (sürüm, bileşen adı, filtre durumu...) kararlı bir özet"""
+    return hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=16).hexdigest()
+
+def payload_size(payload):
+    """Önbellek girdisinin yaklaşık boyutu (bayt)"""
+    if isinstance(payload, (str, bytes)):
+        return len(payload)
+    if isinstance(payload, dict):
+        return sum(payload_size(value) for value in payload.values())
+    if isinstance(payload, (list, tuple)):
+        return sum(payload_size(value) for value in payload)
+    return 64
+
+class RenderCache:
+    """İş parçacığı güvenli, bayt sınırlı LRU önbellek"""
+
+    def __init__(self, max_bytes=RENDER_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # anahtar -> (içerik, boyut)
+        self._lock = threading.Lock()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, payload):
+        size = payload_size(payload)
+        with self._lock:
+            if size > self.max_bytes:
+                return payload
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (payload, size)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self.bytes -= evicted_size
+                self.evictions += 1
+        return payload
+
+    def get_or_render(self, key, render):
+        """Önbellekte varsa içeriği döndür; yoksa `render()` ile üretip sakla"""
+        payload = self.get(key)
+        if payload is None:
+            payload = self.put(key, render())
+        return payload
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self.bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
@@ -0,0 +1,405 @@
+"""Şehir analiz raporları: içerik, grafikler ve HTML/PDF çıktıları
+
+Rapor içeriği Streamlit'ten bağımsız bir sözlük olarak üretilir; arayüz,
+HTML/PDF dışa aktarımı ve toplu rapor komutu aynı içeriği kullanır.
+Raporlar arka planda bir iş parçacığı havuzunda üretilir ve
+(şehir, rapor tipi, harita, finansal analiz, veri sürümü) anahtarıyla
+önbelleğe alınır.
+"""
+import base64
+import html
+import io
+import re
+import textwrap
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+import matplotlib
+matplotlib.use("Agg")
+from matplotlib.backends.backend_pdf import PdfPages
+from matplotlib.figure import Figure
+from matplotlib.image import imread
+
+from evc.config import OPERATOR_COLORS
+from evc.roi import calculate_roi
+
+REPORT_TYPES = ["Özet Rapor", "Detaylı Rapor", "Yatırımcı Sunumu"]
+REPORT_WORKERS = 2
+REPORT_CACHE_SIZE = 64
+
+SWOT = {
+    "💪 Güçlü Yönler": ["Yüksek nüfus yoğunluğu", "Gelişen EV pazarı", "Devlet teşvikleri", "Çevre bilinci artışı"],
+    "⚠️ Zayıf Yönler": ["Yüksek ilk yatırım maliyeti", "Teknoloji bağımlılığı", "Elektrik maliyetleri", "Mevzuat belirsizlikleri"],
+    "🚀 Fırsatlar": ["Artan EV satışları", "Hızlı şarj teknolojileri", "Akıllı şehir projeleri", "Turizm potansiyeli"],
+    "⚡ Tehditler": ["Yoğun rekabet", "Teknoloji eskimesi", "Düzenleyici değişiklikler", "Ekonomik dalgalanmalar"]
+}
+
+ACTION_PLAN = [
+    ("Detaylı saha araştırması", "yapın"),
+    ("Yerel yönetimlerle görüşün", "(izin ve teşvikler için)"),
+    ("Elektrik şebekesi kapasitesini", "kontrol edin"),
+    ("Arsa/kira anlaşmalarını", "değerlendirin"),
+    ("Finansman seçeneklerini", "araştırın"),
+    ("Teknik altyapı gereksinimlerini", "planlayın")
+]
+
+# Örnek yatırım senaryosu (DC 50kW, 4 soket)
+EXAMPLE_INVESTMENT = 200000  # 200K TL
+EXAMPLE_MONTHLY_REVENUE = 45000  # 45K TL/ay
+EXAMPLE_MONTHLY_COST = 25000  # 25K TL/ay
+
+RECOMMENDATION_COLORS = {"success": "#28a745", "warning": "#ffc107", "danger": "#dc3545"}
+
+def city_report_stations(city, stations_df=None):
+    """Rapor için şehrin istasyonları: çerçeve verildiyse ondan, verilmediyse depodan yalnızca o şehrin bölümü"""
+    if stations_df is not None:
+        return stations_df[stations_df['sehir'] == city]
+    from evc.store import load_station_store
+
+    return load_station_store(cities=[city])
+
+def city_summary(city_stations):
+    """Rapor için şehir özeti: istasyon/soket sayısı, ortalamalar ve operatör dağılımı
+
+    Özetler hazırsa aynı sözlük `StationAggregates.city_summary` ile satırlar taranmadan alınır.
+    """
+    return {
+        "istasyon_sayisi": len(city_stations),
+        "soket_sayisi": int(city_stations['soket_sayisi'].sum()),
+        "güç_kw": city_stations['güç_kw'].mean(),
+        "kullanim_orani": city_stations['kullanim_orani'].mean(),
+        "gunluk_gelir": city_stations['gunluk_gelir'].mean(),
+        "operatorler": city_stations['operatör'].value_counts()
+    }
+
+def _png(fig):
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=110, bbox_inches="tight")
+    return buffer.getvalue()
+
+def operator_pie_png(operator_distribution, title):
+    """Operatör dağılımı pasta grafiği (PNG)"""
+    fig = Figure(figsize=(5, 4))
+    ax = fig.add_subplot()
+    ax.pie(
+        operator_distribution.values,
+        labels=operator_distribution.index,
+        colors=[OPERATOR_COLORS.get(operator, "gray") for operator in operator_distribution.index],
+        autopct="%1.0f%%",
+        textprops={"fontsize": 8}
+    )
+    ax.set_title(title, fontsize=10)
+    return _png(fig)
+
+def station_map_png(city_stations, title):
+    """İstasyon konumlarının operatöre göre renklendirilmiş statik haritası (PNG)"""
+    fig = Figure(figsize=(5, 4))
+    ax = fig.add_subplot()
+    for operator, group in city_stations.groupby('operatör', observed=True):
+        ax.scatter(group['lng'], group['lat'], s=8, alpha=0.7, color=OPERATOR_COLORS.get(operator, "gray"), label=operator)
+    ax.set_xlabel("Boylam")
+    ax.set_ylabel("Enlem")
+    ax.set_aspect(1.3)
+    ax.set_title(title, fontsize=10)
+    ax.legend(fontsize=6, loc="best")
+    return _png(fig)
+
+def build_city_report(city, report_type, summary, demographic_df, city_stations=None, include_maps=True,
+                      include_financials=True, dataset_version=None, report_date=None):
+    """Şehir raporunun içeriğini (metrikler, bölümler, önceden çizilmiş grafikler) oluştur
+
+    `summary`: `city_summary` sözlüğü; `city_stations` yalnızca harita için gerekir.
+    """
+    report_date = report_date or datetime.now()
+    city_data = demographic_df[demographic_df['sehir'] == city].iloc[0]
+    n_stations = summary['istasyon_sayisi']
+
+    report = {
+        "city": city,
+        "report_type": report_type,
+        "report_date": report_date.strftime('%d.%m.%Y'),
+        "dataset_version": dataset_version,
+        "include_maps": include_maps,
+        "include_financials": include_financials,
+        "metrics": {
+            "Mevcut İstasyon": f"{n_stations}",
+            "Toplam Soket": f"{summary['soket_sayisi']}",
+            "Nüfus": f"{city_data['nufus']:,}",
+            "Potansiyel Puan": f"{city_data['potansiyel_puan']:.1f}/10"
+        },
+        "market": [
+            ("Nüfus", f"{city_data['nufus']:,} kişi"),
+            ("Ortalama Gelir", f"₺{city_data['ortalama_gelir']:,}"),
+            ("Elektrikli Araç Oranı", f"%{city_data['elektrikli_arac_orani']:.1%}"),
+            ("Trafik Yoğunluğu", f"%{city_data['trafik_yogunlugu']:.0%}"),
+            ("Mevcut İstasyon Sayısı", f"{n_stations}")
+        ],
+        "competition": None,
+        "operator_distribution": {},
+        "financials": None,
+        "swot": SWOT,
+        "action_plan": ACTION_PLAN,
+        "images": {}
+    }
+
+    # Rekabet analizi
+    if n_stations > 0:
+        operator_dist = summary['operatorler']
+        operator_dist = operator_dist[operator_dist > 0]
+        market_leader_share = (operator_dist.iloc[0] / n_stations) * 100
+        report["operator_distribution"] = {str(operator): int(count) for operator, count in operator_dist.items()}
+        report["competition"] = [
+            ("Pazar Lideri", f"{operator_dist.index[0]} (%{market_leader_share:.1f} pazar payı)"),
+            ("Ortalama İstasyon Gücü", f"{summary['güç_kw']:.0f} kW"),
+            ("Ortalama Kullanım Oranı", f"%{summary['kullanim_orani']:.0%}"),
+            ("Ortalama Günlük Gelir", f"₺{summary['gunluk_gelir']:,.0f}")
+        ]
+        if len(operator_dist) > 1:
+            report["images"]["operators"] = operator_pie_png(operator_dist, f"{city} - Operatör Dağılımı")
+        if include_maps and city_stations is not None:
+            report["images"]["map"] = station_map_png(city_stations, f"{city} - İstasyon Konumları")
+
+    # Finansal öngörüler
+    if include_financials:
+        example_roi = calculate_roi(EXAMPLE_INVESTMENT, EXAMPLE_MONTHLY_REVENUE, EXAMPLE_MONTHLY_COST * 12, 5)
+        report["financials"] = [
+            ("İlk Yatırım", f"₺{EXAMPLE_INVESTMENT:,}"),
+            ("Aylık Gelir", f"₺{EXAMPLE_MONTHLY_REVENUE:,}"),
+            ("Aylık Maliyet", f"₺{EXAMPLE_MONTHLY_COST:,}"),
+            ("Aylık Net Kar", f"₺{EXAMPLE_MONTHLY_REVENUE - EXAMPLE_MONTHLY_COST:,}"),
+            ("5 Yıllık ROI", f"%{example_roi['roi']:.1f}"),
+            ("Geri Ödeme Süresi", f"{example_roi['payback_period']:.1f} yıl")
+        ]
+
+    # Genel değerlendirme
+    if city_data['potansiyel_puan'] >= 7:
+        report["recommendation"], report["recommendation_level"] = "Yüksek potansiyelli bir lokasyon. Yatırım için uygun.", "success"
+    elif city_data['potansiyel_puan'] >= 5:
+        report["recommendation"], report["recommendation_level"] = "Orta potansiyelli lokasyon. Dikkatli değerlendirme gerekli.", "warning"
+    else:
+        report["recommendation"], report["recommendation_level"] = "Düşük potansiyelli lokasyon. Alternatif arayın.", "danger"
+
+    return report
+
+def render_html(report):
+    """Raporu grafikleri gömülü, tek başına açılabilen bir HTML belgesine dönüştür"""
+    escape = html.escape
+
+    def items(pairs):
+        return "".join(f"<li><b>{escape(label)}:</b> {escape(value)}</li>" for label, value in pairs)
+
+    def image(name):
+        data = report["images"].get(name)
+        if data is None:
+            return ""
+        return f'<img src="data:image/png;base64,{base64.b64encode(data).decode()}" alt="{escape(name)}">'
+
+    parts = [
+        f"<h1>📋 {escape(report['city'])} Elektrikli Şarj İstasyonu Analiz Raporu</h1>",
+        f"<p><b>Rapor Tarihi:</b> {report['report_date']}<br><b>Rapor Tipi:</b> {escape(report['report_type'])}<br>"
+        "<b>Hazırlayan:</b> EV Charging Analytics System</p>",
+        "<h2>📊 Özet Bilgiler</h2>",
+        '<div class="metrics">' + "".join(
+            f'<div class="metric"><span>{escape(label)}</span><strong>{escape(value)}</strong></div>'
+            for label, value in report["metrics"].items()
+        ) + "</div>",
+        "<h2>🎯 Pazar Analizi</h2>",
+        f"<p><b>{escape(report['city'])}</b> şehri elektrikli şarj istasyonu yatırımı için aşağıdaki özelliklere sahiptir:</p>",
+        f"<ul>{items(report['market'])}</ul>"
+    ]
+    if report["competition"]:
+        parts += ["<h2>🏆 Rekabet Durumu</h2>", f"<ul>{items(report['competition'])}</ul>", image("operators")]
+    if report["images"].get("map") is not None:
+        parts += ["<h2>🗺️ İstasyon Haritası</h2>", image("map")]
+    parts.append("<h2>🎯 SWOT Analizi</h2><div class=\"swot\">" + "".join(
+        f"<div><h3>{escape(title)}</h3><ul>{''.join(f'<li>{escape(item)}</li>' for item in entries)}</ul></div>"
+        for title, entries in report["swot"].items()
+    ) + "</div>")
+    if report["financials"]:
+        parts += [
+            "<h2>💰 Finansal Öngörüler</h2>",
+            "<p><b>Örnek Yatırım Senaryosu (DC 50kW, 4 Soket):</b></p>",
+            f"<ul>{items(report['financials'])}</ul>"
+        ]
+    parts += [
+        "<h2>💡 Öneriler ve Sonuç</h2>",
+        f'<div class="card" style="border-left-color: {RECOMMENDATION_COLORS[report["recommendation_level"]]}">'
+        f"<h4>🎯 Genel Değerlendirme</h4><p>{escape(report['recommendation'])}</p></div>",
+        "<h3>📋 Eylem Planı:</h3><ol>" + "".join(
+            f"<li><b>{escape(action)}</b> {escape(detail)}</li>" for action, detail in report["action_plan"]
+        ) + "</ol>"
+    ]
+    style = (
+        "body{font-family:sans-serif;max-width:900px;margin:2rem auto;color:#222}"
+        "h1{color:#1f77b4}.metrics{display:flex;gap:1rem}"
+        ".metric{flex:1;background:#f0f2f6;padding:1rem;border-radius:.5rem;border-left:4px solid #1f77b4}"
+        ".metric span{display:block;font-size:.85rem;color:#555}.metric strong{font-size:1.4rem}"
+        ".swot{display:grid;grid-template-columns:1fr 1fr;gap:0 2rem}"
+        ".card{background:#f8f9fa;padding:1rem;border-radius:.5rem;border-left:4px solid}img{max-width:100%}"
+    )
+    return (
+        f'<!DOCTYPE html><html lang="tr"><head><meta charset="utf-8">'
+        f"<title>{escape(report['city'])} Analiz Raporu</title><style>{style}</style></head>"
+        f"<body>{''.join(parts)}</body></html>"
+    )
+
+# PDF yazı tipinde bulunmayan emoji ve semboller çıkarılır
+_NON_TEXT = re.compile(r"[^\u0000-ɏ‐-‧₺•]+")
+
+class _PdfPageWriter:
+    """A4 sayfalara yukarıdan aşağı metin ve görsel yerleştiren basit yazıcı"""
+
+    def __init__(self, pdf):
+        self.pdf = pdf
+        self.fig = None
+        self.y = 0
+
+    def _new_page(self):
+        self.close_page()
+        self.fig = Figure(figsize=(8.27, 11.69))
+        self.y = 0.95
+
+    def close_page(self):
+        if self.fig is not None:
+            self.pdf.savefig(self.fig)
+            self.fig = None
+
+    def _ensure(self, height):
+        if self.fig is None or self.y - height < 0.05:
+            self._new_page()
+
+    def text(self, content, size=10, weight="normal", indent=0.0, width=95):
+        content = _NON_TEXT.sub("", content).strip()
+        for line in textwrap.wrap(content, width=width) or [""]:
+            line_height = size / 11.69 / 72 * 1.5
+            self._ensure(line_height)
+            self.fig.text(0.08 + indent, self.y, line, fontsize=size, weight=weight, va="top")
+            self.y -= line_height
+
+    def space(self, amount=0.01):
+        self.y -= amount
+
+    def image(self, data, height=0.3):
+        if data is None:
+            return
+        self._ensure(height)
+        ax = self.fig.add_axes([0.15, self.y - height, 0.7, height])
+        ax.imshow(imread(io.BytesIO(data), format="png"))
+        ax.axis("off")
+        self.y -= height + 0.01
+
+def render_pdf(report):
+    """Raporu grafikleri gömülü bir PDF belgesine dönüştür"""
+    buffer = io.BytesIO()
+    with PdfPages(buffer) as pdf:
+        writer = _PdfPageWriter(pdf)
+        writer.text(f"{report['city']} Elektrikli Şarj İstasyonu Analiz Raporu", size=16, weight="bold")
+        writer.text(f"Rapor Tarihi: {report['report_date']}   Rapor Tipi: {report['report_type']}   "
+                    "Hazırlayan: EV Charging Analytics System", size=9)
+        writer.space(0.015)
+
+        writer.text("Özet Bilgiler", size=13, weight="bold")
+        writer.text("   ".join(f"{label}: {value}" for label, value in report["metrics"].items()))
+        writer.space()
+
+        writer.text("Pazar Analizi", size=13, weight="bold")
+        writer.text(f"{report['city']} şehri elektrikli şarj istasyonu yatırımı için aşağıdaki özelliklere sahiptir:")
+        for label, value in report["market"]:
+            writer.text(f"• {label}: {value}", indent=0.02)
+        writer.space()
+
+        if report["competition"]:
+            writer.text("Rekabet Durumu", size=13, weight="bold")
+            for label, value in report["competition"]:
+                writer.text(f"• {label}: {value}", indent=0.02)
+            writer.image(report["images"].get("operators"))
+        if report["images"].get("map") is not None:
+            writer.text("İstasyon Haritası", size=13, weight="bold")
+            writer.image(report["images"]["map"])
+
+        writer.text("SWOT Analizi", size=13, weight="bold")
+        for title, entries in report["swot"].items():
+            writer.text(title, size=11, weight="bold")
+            for entry in entries:
+                writer.text(f"• {entry}", indent=0.02)
+        writer.space()
+
+        if report["financials"]:
+            writer.text("Finansal Öngörüler", size=13, weight="bold")
+            writer.text("Örnek Yatırım Senaryosu (DC 50kW, 4 Soket):", weight="bold")
+            for label, value in report["financials"]:
+                writer.text(f"• {label}: {value}", indent=0.02)
+            writer.space()
+
+        writer.text("Öneriler ve Sonuç", size=13, weight="bold")
+        writer.text(f"Genel Değerlendirme: {report['recommendation']}")
+        writer.text("Eylem Planı:", weight="bold")
+        for number, (action, detail) in enumerate(report["action_plan"], start=1):
+            writer.text(f"{number}. {action} {detail}", indent=0.02)
+        writer.close_page()
+    return buffer.getvalue()
+
+def generate_city_report(city, report_type, demographic_df, stations_df=None, include_maps=True,
+                         include_financials=True, dataset_version=None, aggregates=None):
+    """Rapor içeriğini oluştur ve HTML/PDF çıktılarını üret (arayüz ve toplu komut ortak yolu)
+
+    `aggregates` (StationAggregates) verilirse özetler ondan okunur; şehrin
+    istasyon satırları yalnızca harita istendiğinde yüklenir.
+    """
+    city_stations = None
+    if aggregates is None or include_maps:
+        city_stations = city_report_stations(city, stations_df)
+    summary = aggregates.city_summary(city) if aggregates is not None else city_summary(city_stations)
+    report = build_city_report(
+        city, report_type, summary, demographic_df, city_stations,
+        include_maps=include_maps, include_financials=include_financials, dataset_version=dataset_version
+    )
+    report["html"] = render_html(report)
+    report["pdf"] = render_pdf(report)
+    return report
+
+class ReportService:
+    """Raporları arka plandaki iş parçacığı havuzunda üreten ve sonuçları önbelleğe alan servis
+
+    Anahtar: (şehir, rapor tipi, harita, finansal analiz, veri sürümü). Aynı
+    anahtarla gelen istekler, üretim sürerken de aynı işi paylaşır.
+    """
+
+    def __init__(self, workers=REPORT_WORKERS, cache_size=REPORT_CACHE_SIZE):
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evc-report")
+        self._futures = OrderedDict()
+        self._lock = threading.Lock()
+        self.cache_size = cache_size
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(city, report_type, include_maps, include_financials, dataset_version):
+        return (city, report_type, bool(include_maps), bool(include_financials), dataset_version)
+
+    def submit(self, city, report_type, include_maps, include_financials, dataset_version, demographic_df, stations_df=None,
+               aggregates=None):
+        """Raporu kuyruğa al (önbellekte veya üretimdeyse mevcut işi döndür)"""
+        key = self.key(city, report_type, include_maps, include_financials, dataset_version)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is not None and not (future.done() and future.exception() is not None):
+                self._futures.move_to_end(key)
+                self.hits += 1
+                return future
+            self.misses += 1
+            future = self._executor.submit(
+                generate_city_report, city, report_type, demographic_df, stations_df,
+                include_maps, include_financials, dataset_version, aggregates
+            )
+            self._futures[key] = future
+            while len(self._futures) > self.cache_size:
+                self._futures.popitem(last=False)
+            return future
+
+    def get(self, key):
+        """Anahtara ait işi döndür (yoksa None)"""
+        with self._lock:
+            return self._futures.get(key)
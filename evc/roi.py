@@ -0,0 +1,295 @@
+"""Yatırım getirisi (ROI) hesapları
+
+Basit ROI hesabının yanında aylık nakit akışları üzerinden iskontolu NPV, IRR ve
+geri ödeme süresini binlerce stokastik senaryo için tek seferde hesaplayan
+Monte Carlo motorunu içerir.
+"""
+import numpy as np
+import pandas as pd
+
+STATION_TYPES = ["AC 22kW (Orta)", "DC 50kW (Hızlı)", "DC 150kW (Ultra Hızlı)", "DC 350kW (Süper Hızlı)"]
+
+# Yatırım maliyetleri (istasyon tipine göre)
+INVESTMENT_COSTS = {
+    "AC 22kW (Orta)": 50000,
+    "DC 50kW (Hızlı)": 150000,
+    "DC 150kW (Ultra Hızlı)": 300000,
+    "DC 350kW (Süper Hızlı)": 500000
+}
+EXTRA_SOCKET_COST = 25000  # İlk iki soketten sonraki her soket için
+CHARGING_EFFICIENCY = 0.7  # %70 verimlilik
+
+def station_power_kw(station_type):
+    """İstasyon tipi etiketinden güç değerini (kW) çıkar"""
+    return int(station_type.split()[1].replace("kW", ""))
+
+def total_investment(station_type, num_sockets):
+    """İstasyon tipi ve soket sayısına göre toplam yatırım tutarı"""
+    return INVESTMENT_COSTS[station_type] + (num_sockets - 2) * EXTRA_SOCKET_COST
+
+def estimate_monthly_revenue(power_kw, daily_usage_hours, num_sockets, price_per_kwh):
+    """Aylık gelir tahmini (skaler veya NumPy dizileriyle çalışır)"""
+    daily_energy = power_kw * daily_usage_hours * num_sockets * CHARGING_EFFICIENCY
+    daily_revenue = daily_energy * price_per_kwh
+    return daily_revenue * 30
+
+def calculate_roi(investment, monthly_revenue, operating_cost, years=5):
+    """Yatırım getirisi hesapla"""
+    annual_revenue = monthly_revenue * 12
+    annual_profit = annual_revenue - operating_cost
+    total_profit = annual_profit * years
+    roi = ((total_profit - investment) / investment) * 100
+    payback_period = investment / annual_profit
+
+    return {
+        "roi": roi,
+        "payback_period": payback_period,
+        "annual_profit": annual_profit,
+        "total_profit": total_profit
+    }
+
+# Monte Carlo varsayılanları
+SIMULATION_DRAWS = 100_000
+SIMULATION_PERCENTILES = (5, 25, 50, 75, 95)
+IRR_GRID_SIZE = 128  # log(1 + yıllık oran) uzayında eşit aralıklı aday oranlar
+IRR_ANNUAL_RANGE = (-0.95, 10.0)  # IRR bu aralığın üstündeyse +inf, altındaysa -inf
+IRR_CHUNK_ROWS = 8192  # IRR ızgarası satır blokları halinde hesaplanır (bellek sınırı)
+BAND_SAMPLE_DRAWS = 20_000  # Aylık yüzdelik bantları bu kadar senaryodan hesaplanır
+
+def annual_to_monthly_rate(annual_rate):
+    """Yıllık bileşik oranı aylık orana çevir"""
+    return (1 + np.asarray(annual_rate, dtype=np.float64)) ** (1 / 12) - 1
+
+def monthly_to_annual_rate(monthly_rate):
+    """Aylık oranı yıllık bileşik orana çevir"""
+    return (1 + np.asarray(monthly_rate, dtype=np.float64)) ** 12 - 1
+
+def discount_factors(monthly_rate, n_periods):
+    """0..n_periods dönemleri için iskonto çarpanları"""
+    return (1 + monthly_rate) ** -np.arange(n_periods + 1, dtype=np.float64)
+
+def npv(cash_flows, monthly_rate):
+    """Nakit akışı matrisinin (senaryo x dönem, 0. dönem yatırım) net bugünkü değeri"""
+    cash_flows = np.atleast_2d(cash_flows)
+    return cash_flows @ discount_factors(monthly_rate, cash_flows.shape[1] - 1)
+
+def irr(cash_flows):
+    """Her senaryo için yıllık iç verim oranı
+
+    NPV, aday oranlardan oluşan iskonto matrisiyle tek bir matris çarpımında
+    hesaplanır; işaretin ilk değiştiği iki aday arasında doğrusal interpolasyon
+    yapılır. Aralıkta kök yoksa NPV tüm aralıkta pozitifse +inf, en düşük
+    oranda bile pozitif değilse -inf döner (yüzdeliklerde sıralamayı korur);
+    NaN yalnızca eksik nakit akışlı senaryolarda çıkar.
+    """
+    cash_flows = np.atleast_2d(np.asarray(cash_flows, dtype=np.float64))
+    n_periods = cash_flows.shape[1] - 1
+    log_grid = np.linspace(np.log1p(IRR_ANNUAL_RANGE[0]), np.log1p(IRR_ANNUAL_RANGE[1]), IRR_GRID_SIZE)
+    # (1 + aylık oran)^-t = exp(-t * log(1 + yıllık oran) / 12)
+    discount_matrix = np.exp(-np.outer(np.arange(n_periods + 1), log_grid) / 12)
+    
+    result = np.full(len(cash_flows), np.nan)
+    for start in range(0, len(cash_flows), IRR_CHUNK_ROWS):
+        values = cash_flows[start:start + IRR_CHUNK_ROWS] @ discount_matrix
+        crossed = (values[:, :-1] > 0) & (values[:, 1:] <= 0)
+        has_root = crossed.any(axis=1)
+        upper = crossed.argmax(axis=1) + 1
+        rows = np.flatnonzero(has_root)
+        hi = upper[rows]
+        v_lo, v_hi = values[rows, hi - 1], values[rows, hi]
+        log_rate = log_grid[hi - 1] + (log_grid[hi] - log_grid[hi - 1]) * v_lo / (v_lo - v_hi)
+        result[start + rows] = np.expm1(log_rate)
+        
+        # Aralık dışı kökler
+        outside = start + np.flatnonzero(~has_root)
+        result[outside[values[~has_root, -1] > 0]] = np.inf
+        result[outside[values[~has_root, 0] <= 0]] = -np.inf
+    return result
+
+def _first_nonnegative_month(cumulative):
+    """Kümülatif nakit akışının ilk kez sıfırı geçtiği dönem; geçmezse NaN"""
+    reached = cumulative >= 0
+    first = reached.argmax(axis=1)
+    return np.where(reached[np.arange(len(first)), first], first, np.nan)
+
+def payback_months(cash_flows, monthly_rate=0.0):
+    """Geri ödeme süresi (ay); `monthly_rate` verilirse iskontolu geri ödeme"""
+    cash_flows = np.atleast_2d(cash_flows)
+    return _first_nonnegative_month(np.cumsum(cash_flows * discount_factors(monthly_rate, cash_flows.shape[1] - 1), axis=1))
+
+def simulate_cash_flows(investment, power_kw, daily_usage_hours, num_sockets, price_per_kwh, monthly_cost,
+                        years=5, n_draws=SIMULATION_DRAWS, usage_volatility=0.25, price_volatility=0.10,
+                        cost_volatility=0.10, monthly_volatility=0.10, ramp_up_months=0, seed=None):
+    """Stokastik aylık nakit akışı matrisi (senaryo x dönem) üret
+
+    Her senaryo için kullanım (log-normal), fiyat ve maliyet (normal) çarpanları
+    çekilir; kullanım ayrıca her ay `monthly_volatility` kadar dalgalanır ve ilk
+    `ramp_up_months` ayda %50'den tam seviyeye doğrusal olarak yükselir.
+    0. dönem ilk yatırımdır.
+    """
+    rng = np.random.default_rng(seed)
+    n_months = int(years * 12)
+    
+    usage = np.exp(rng.normal(-usage_volatility ** 2 / 2, usage_volatility, n_draws))
+    price = np.clip(rng.normal(1.0, price_volatility, n_draws), 0.0, None)
+    cost = np.clip(rng.normal(1.0, cost_volatility, n_draws), 0.0, None)
+    
+    month = np.arange(1, n_months + 1)
+    ramp = np.minimum(1.0, 0.5 + 0.5 * month / ramp_up_months) if ramp_up_months > 0 else np.ones(n_months)
+    
+    # Senaryo x ay kullanım saatleri (ara diziler oluşturmamak için yerinde işlemler)
+    hours = rng.standard_normal((n_draws, n_months))
+    hours *= monthly_volatility
+    hours += 1.0
+    np.clip(hours, 0.0, None, out=hours)
+    hours *= daily_usage_hours * usage[:, None]
+    hours *= ramp
+    np.minimum(hours, 24.0, out=hours)
+    
+    cash_flows = np.empty((n_draws, n_months + 1))
+    cash_flows[:, 0] = -investment
+    cash_flows[:, 1:] = estimate_monthly_revenue(power_kw, hours, num_sockets, price_per_kwh * price[:, None])
+    cash_flows[:, 1:] -= monthly_cost * cost[:, None]
+    return cash_flows
+
+def simulate_roi(investment, power_kw, daily_usage_hours, num_sockets, price_per_kwh, monthly_cost,
+                 annual_discount_rate=0.25, years=5, percentiles=SIMULATION_PERCENTILES, **simulation_options):
+    """Monte Carlo DCF analizi: NPV, IRR, geri ödeme dağılımları ve kümülatif nakit akışı bantları"""
+    cash_flows = simulate_cash_flows(
+        investment, power_kw, daily_usage_hours, num_sockets, price_per_kwh, monthly_cost,
+        years=years, **simulation_options
+    )
+    monthly_rate = annual_to_monthly_rate(annual_discount_rate)
+    discounted_cumulative = np.cumsum(cash_flows * discount_factors(monthly_rate, cash_flows.shape[1] - 1), axis=1)
+    
+    # Bantlar için alt örneklem yeterli; dönem başına sıralama yapılacağı için satırlar bitişik tutulur
+    sample = np.ascontiguousarray(discounted_cumulative[:BAND_SAMPLE_DRAWS].T)
+    bands = pd.DataFrame(np.percentile(sample, percentiles, axis=1).T, columns=[f"P{p}" for p in percentiles])
+    bands.index.name = "ay"
+    
+    return {
+        "npv": discounted_cumulative[:, -1],
+        "irr": irr(cash_flows),
+        "payback_months": _first_nonnegative_month(np.cumsum(cash_flows, axis=1)),
+        "discounted_payback_months": _first_nonnegative_month(discounted_cumulative),
+        "cumulative_bands": bands,
+        "n_months": cash_flows.shape[1] - 1
+    }
+
+def simulation_summary(simulation, percentiles=SIMULATION_PERCENTILES):
+    """Simülasyon sonuçlarının yüzdelik tablosu
+
+    Geri ödeme süresi ufuk içinde gerçekleşmeyen senaryolarda NaN'dır ve
+    yüzdeliklere sonsuz (ufuk dışı) olarak katılır.
+    """
+    rows = {
+        "NPV (₺)": simulation["npv"],
+        "IRR (yıllık)": simulation["irr"],
+        "Geri Ödeme (ay)": np.nan_to_num(simulation["payback_months"], nan=np.inf),
+        "İskontolu Geri Ödeme (ay)": np.nan_to_num(simulation["discounted_payback_months"], nan=np.inf)
+    }
+    return pd.DataFrame(
+        {label: np.nanpercentile(values, percentiles, method="nearest") for label, values in rows.items()},
+        index=[f"P{p}" for p in percentiles]
+    ).T
+
+# Duyarlılık ızgarası eksenleri (sıra ızgara boyutlarının sırasıdır)
+SENSITIVITY_PARAMETERS = {
+    "station_type": "İstasyon Tipi",
+    "num_sockets": "Soket Sayısı",
+    "daily_usage_hours": "Günlük Kullanım Saati",
+    "price_per_kwh": "kWh Fiyatı (₺)",
+    "monthly_electricity_cost": "Aylık Elektrik Maliyeti (₺)",
+    "monthly_maintenance": "Aylık Bakım Maliyeti (₺)",
+    "monthly_rent": "Aylık Kira/Arsa Maliyeti (₺)"
+}
+
+def sensitivity_axes(price_step=0.5, cost_points=(4, 3, 3)):
+    """Hesaplayıcıdaki kaydırıcı aralıklarını kapsayan varsayılan ızgara eksenleri (~1M kombinasyon)"""
+    electricity_points, maintenance_points, rent_points = cost_points
+    return {
+        "station_type": list(STATION_TYPES),
+        "num_sockets": np.arange(2, 13),
+        "daily_usage_hours": np.arange(1, 25),
+        "price_per_kwh": np.round(np.arange(3.0, 15.0 + price_step / 2, price_step), 2),
+        "monthly_electricity_cost": np.linspace(5000, 50000, electricity_points).round(),
+        "monthly_maintenance": np.linspace(2000, 20000, maintenance_points).round(),
+        "monthly_rent": np.linspace(5000, 50000, rent_points).round()
+    }
+
+def _along_axis(values, axis, n_axes):
+    """1B diziyi ızgaranın `axis` boyutuna yerleştir (diğer boyutlar 1)"""
+    shape = [1] * n_axes
+    shape[axis] = -1
+    return np.asarray(values, dtype=np.float64).reshape(shape)
+
+def sensitivity_grid(axes, years=5):
+    """ROI formülünü (%) tüm parametre kombinasyonlarında tek bir yayınlanmış (broadcast) işlemle hesapla
+
+    Sonuç dizisinin boyutları SENSITIVITY_PARAMETERS sırasındadır.
+    """
+    n_axes = len(SENSITIVITY_PARAMETERS)
+    grid = {name: _along_axis(
+        [station_power_kw(t) for t in axes[name]] if name == "station_type" else axes[name],
+        axis, n_axes
+    ) for axis, name in enumerate(SENSITIVITY_PARAMETERS)}
+    base_costs = _along_axis([INVESTMENT_COSTS[t] for t in axes["station_type"]], 0, n_axes)
+    
+    investment = base_costs + (grid["num_sockets"] - 2) * EXTRA_SOCKET_COST
+    monthly_revenue = estimate_monthly_revenue(
+        grid["station_type"], grid["daily_usage_hours"], grid["num_sockets"], grid["price_per_kwh"]
+    )
+    monthly_cost = grid["monthly_electricity_cost"] + grid["monthly_maintenance"] + grid["monthly_rent"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return calculate_roi(investment, monthly_revenue, monthly_cost * 12, years)["roi"]
+
+def nearest_grid_index(values, value):
+    """Eksende verilen değere en yakın noktanın indeksi"""
+    if not np.issubdtype(np.asarray(values).dtype, np.number):
+        return list(values).index(value)
+    return int(np.abs(np.asarray(values, dtype=np.float64) - value).argmin())
+
+def _base_indices(axes, base):
+    return [nearest_grid_index(axes[name], base[name]) for name in SENSITIVITY_PARAMETERS]
+
+def tornado_table(grid, axes, base):
+    """Her parametre tek başına aralığı boyunca değişirken (diğerleri `base` değerinde) ROI aralığı"""
+    indices = _base_indices(axes, base)
+    base_roi = grid[tuple(indices)]
+    rows = []
+    for axis, (name, label) in enumerate(SENSITIVITY_PARAMETERS.items()):
+        index = list(indices)
+        index[axis] = slice(None)
+        line = grid[tuple(index)]
+        rows.append({
+            "parametre": label,
+            "düşük_değer": axes[name][0],
+            "yüksek_değer": axes[name][-1],
+            "roi_düşük": line[0],
+            "roi_yüksek": line[-1],
+            "roi_min": line.min(),
+            "roi_max": line.max()
+        })
+    table = pd.DataFrame(rows)
+    table["etki"] = table["roi_max"] - table["roi_min"]
+    return table.sort_values("etki").reset_index(drop=True), base_roi
+
+def grid_slice(grid, axes, base, x, y):
+    """İki parametre üzerinde ROI kesiti (diğer parametreler `base` değerinde); satırlar y, sütunlar x"""
+    index = _base_indices(axes, base)
+    names = list(SENSITIVITY_PARAMETERS)
+    index[names.index(x)] = slice(None)
+    index[names.index(y)] = slice(None)
+    values = grid[tuple(index)]
+    if names.index(x) < names.index(y):
+        values = values.T
+    return pd.DataFrame(values, index=list(axes[y]), columns=list(axes[x]))
+
+def share_above(grid, axes, x, y, threshold):
+    """Diğer tüm parametre kombinasyonları içinde ROI'nin eşiği aştığı oran; satırlar y, sütunlar x"""
+    names = list(SENSITIVITY_PARAMETERS)
+    other_axes = tuple(axis for axis, name in enumerate(names) if name not in (x, y))
+    values = (grid > threshold).mean(axis=other_axes)
+    if names.index(x) < names.index(y):
+        values = values.T
+    return pd.DataFrame(values, index=list(axes[y]), columns=list(axes[x]))
@@ -0,0 +1,139 @@
+"""Lokasyon potansiyel puanlaması (tekil ve toplu)"""
+import numpy as np
+import pandas as pd
+
+from evc.config import CITIES, NEARBY_RADIUS_KM, TURKEY_BOUNDS
+from evc.geography import assign_provinces, locate
+from evc.spatial import GeoIndex
+
+def potential_score_formula(demo_potential, competition_score, traffic_density):
+    """Potansiyel puan ağırlıkları (tekil ve toplu puanlama için ortak)"""
+    return (
+        demo_potential * 0.4 +
+        (10 - competition_score) * 0.3 +
+        traffic_density * 10 * 0.3
+    )
+
+def competition_levels(competition_scores):
+    """Yakındaki istasyon sayılarını rekabet seviyesine çevir"""
+    competition_scores = np.asarray(competition_scores)
+    return np.select(
+        [competition_scores == 0, competition_scores < 3],
+        ["Düşük", "Orta"],
+        default="Yüksek"
+    )
+
+def analyze_location(lat, lng, stations_df, demographic_df, station_index=None, demand_model=None):
+    """Seçilen lokasyonu analiz et
+
+    `demand_model` (bkz. evc.forecasting) verilirse tahmini kullanım ve günlük
+    gelir eklenir ve potansiyel puanın demografik bileşeni tahmini talepten
+    hesaplanır.
+    """
+    if station_index is None:
+        station_index = GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+    
+    # Yakındaki istasyonları bul (haversine, NEARBY_RADIUS_KM yarıçapında)
+    nearby_stations = int(station_index.count_within(lat, lng, NEARBY_RADIUS_KM))
+    
+    # Noktanın bulunduğu il ve ilçe (sınır dosyası yoksa en yakın merkez)
+    region = locate(lat, lng)
+    closest_city = region["province"]
+    
+    # Demografik veriyi al
+    city_rows = demographic_df[demographic_df['sehir'] == closest_city]
+    demo_data = city_rows.iloc[0] if len(city_rows) > 0 else None
+    
+    # Rekabet analizi
+    competition_score = nearby_stations
+    competition_level = str(competition_levels(competition_score))
+    
+    # Talep tahmini (model varsa)
+    forecast = None
+    demo_potential = demo_data['potansiyel_puan'] if demo_data is not None else None
+    if demand_model is not None:
+        forecast = demand_model.predict_sites(
+            lat, lng, demographic_df, station_index, nearby=np.array([nearby_stations]),
+            city_positions=np.array([CITIES.index(closest_city)])
+        ).iloc[0]
+        demo_potential = float(demand_model.demand_potential(forecast['tahmini_gelir']))
+    
+    # Potansiyel puan hesapla
+    if demo_data is not None:
+        potential_score = potential_score_formula(
+            demo_potential, competition_score, demo_data['trafik_yogunlugu']
+        )
+    else:
+        potential_score = 5.0
+    
+    return {
+        "closest_city": closest_city,
+        "district": region["district"],
+        "nearby_stations": nearby_stations,
+        "competition_level": competition_level,
+        "potential_score": round(potential_score, 1),
+        "predicted_utilization": None if forecast is None else float(forecast['tahmini_kullanim']),
+        "predicted_daily_revenue": None if forecast is None else float(forecast['tahmini_gelir']),
+        "demographic_data": demo_data
+    }
+
+def score_locations(lats, lngs, stations_df, demographic_df, station_index=None, demand_model=None):
+    """Aday koordinat dizisini tek seferde (vektörize) puanla
+
+    analyze_location() ile aynı ağırlıkları kullanır; her aday için bulunduğu
+    il, yakındaki istasyon sayısı, rekabet seviyesi ve potansiyel puanı
+    içeren bir DataFrame döndürür. `demand_model` verilirse tahmini kullanım
+    ve günlük gelir sütunları eklenir.
+    """
+    lats = np.asarray(lats, dtype=np.float64).ravel()
+    lngs = np.asarray(lngs, dtype=np.float64).ravel()
+    if station_index is None:
+        station_index = GeoIndex(stations_df['lat'].to_numpy(), stations_df['lng'].to_numpy())
+    
+    nearby_stations = station_index.count_within(lats, lngs, NEARBY_RADIUS_KM, workers=-1)
+    city_positions = assign_provinces(lats, lngs, workers=-1)
+    
+    # Demografik değerler şehir sırasına göre dizilir, eksik şehirler NaN olur
+    demo = demographic_df.drop_duplicates('sehir').set_index('sehir').reindex(CITIES)
+    demo_potential = demo['potansiyel_puan'].to_numpy(dtype=np.float64)[city_positions]
+    traffic_density = demo['trafik_yogunlugu'].to_numpy(dtype=np.float64)[city_positions]
+    
+    forecast = None
+    if demand_model is not None:
+        forecast = demand_model.predict_sites(
+            lats, lngs, demographic_df, station_index, nearby=nearby_stations, city_positions=city_positions
+        )
+        demo_potential = np.where(np.isnan(demo_potential), np.nan, demand_model.demand_potential(forecast['tahmini_gelir']))
+    
+    potential_scores = potential_score_formula(demo_potential, nearby_stations, traffic_density)
+    potential_scores = np.where(np.isnan(potential_scores), 5.0, potential_scores)
+    
+    scores = pd.DataFrame({
+        "lat": lats,
+        "lng": lngs,
+        "closest_city": pd.Categorical.from_codes(city_positions, categories=CITIES),
+        "nearby_stations": nearby_stations,
+        "competition_level": pd.Categorical(competition_levels(nearby_stations), categories=["Düşük", "Orta", "Yüksek"]),
+        "potential_score": np.round(potential_scores, 1)
+    })
+    if forecast is not None:
+        scores["predicted_utilization"] = forecast['tahmini_kullanim'].to_numpy()
+        scores["predicted_daily_revenue"] = forecast['tahmini_gelir'].to_numpy()
+    return scores
+
+def candidate_grid(resolution_deg, bounds=TURKEY_BOUNDS):
+    """Sınır kutusunu kaplayan düzenli aday nokta ızgarası (enlem, boylam dizileri)"""
+    lat_min, lat_max, lng_min, lng_max = bounds
+    grid_lat, grid_lng = np.meshgrid(
+        np.arange(lat_min + resolution_deg / 2, lat_max, resolution_deg),
+        np.arange(lng_min + resolution_deg / 2, lng_max, resolution_deg),
+        indexing="ij"
+    )
+    return grid_lat.ravel(), grid_lng.ravel()
+
+def potential_heatmap_points(resolution_deg, stations_df, demographic_df, station_index=None, demand_model=None):
+    """Türkiye geneli potansiyel ısı haritası noktalarını ([enlem, boylam, ağırlık]) hesapla"""
+    grid_lat, grid_lng = candidate_grid(resolution_deg)
+    scores = score_locations(grid_lat, grid_lng, stations_df, demographic_df, station_index, demand_model)
+    weights = np.clip(scores['potential_score'].to_numpy() / 10, 0, 1)
+    return np.column_stack([grid_lat, grid_lng, weights]).round(4).tolist()
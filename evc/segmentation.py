@@ -0,0 +1,152 @@
+"""Akış tabanlı (mini-batch) K-Means ile bölge segmentasyonu
+
+Ölçekleyici ve K-Means modeli veri parçaları üzerinde `partial_fit` ile
+eğitilir; böylece milyonlarca satır sınırlı bellekle işlenir. Eğitilmiş
+modeller veri sürümü başına diske kaydedilir ve sonraki çalıştırmalarda
+yeniden eğitilmeden yüklenir.
+"""
+import re
+import uuid
+from pathlib import Path
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.cluster import MiniBatchKMeans
+from sklearn.preprocessing import StandardScaler
+
+from evc.config import MODEL_DIR
+from evc.hexgrid import aggregate_hex, hex_cells, hex_centers
+from evc.placement import DEMAND_CUTOFF_KM, DEMAND_RESOLUTION_DEG
+from evc.scoring import candidate_grid
+from evc.spatial import city_index
+
+SEGMENT_COUNT = 6
+SEGMENT_BATCH_ROWS = 65_536
+SEGMENT_CELL_KM = 10  # Aday hücre segmentasyonu için altıgen boyutu
+
+# Segmentasyon türü -> özellik sütunları
+STATION_SEGMENT_FEATURES = ["lat", "lng", "güç_kw", "kullanim_orani", "gunluk_gelir"]
+CELL_SEGMENT_FEATURES = ["lat", "lng", "istasyon_sayisi", "ort_guc_kw", "ort_kullanim", "toplam_gunluk_gelir"]
+
+def iter_frame_batches(df, batch_rows=SEGMENT_BATCH_ROWS):
+    """Bellekteki DataFrame'i satır dilimleri halinde döndür (kopyalamadan)"""
+    for start in range(0, len(df), batch_rows):
+        yield df.iloc[start:start + batch_rows]
+
+class SegmentModel:
+    """Ölçekleyici + MiniBatchKMeans; segmentler ortalama günlük gelire göre azalan sırada numaralanır"""
+
+    def __init__(self, features, n_segments=SEGMENT_COUNT, seed=42, version=None):
+        self.features = list(features)
+        self.n_segments = n_segments
+        self.version = version
+        self.scaler = StandardScaler()
+        self.kmeans = MiniBatchKMeans(n_clusters=n_segments, random_state=seed, n_init=3, batch_size=4096)
+        self.order = np.arange(n_segments)
+        self.rows_seen = 0
+
+    def _matrix(self, df):
+        return df[self.features].to_numpy(dtype=np.float64)
+
+    def _scaled(self, df):
+        """Ölçeklenmiş özellikler; eksik değerler (ör. içe aktarılan istasyonlarda gelir) ortalamayla doldurulur"""
+        return np.nan_to_num(self.scaler.transform(self._matrix(df)), nan=0.0)
+
+    def fit(self, batch_source, epochs=1):
+        """`batch_source()` her çağrıda yeni bir DataFrame parça yineleyicisi döndürmelidir
+
+        İlk geçişte ölçekleyici, sonraki geçişlerde K-Means artımlı olarak eğitilir.
+        """
+        for batch in batch_source():
+            self.scaler.partial_fit(self._matrix(batch))
+            self.rows_seen += len(batch)
+        pending = None
+        for _ in range(epochs):
+            for batch in batch_source():
+                matrix = self._scaled(batch)
+                # Küme sayısından küçük parçalar bir sonrakiyle birleştirilir
+                if pending is not None:
+                    matrix, pending = np.vstack([pending, matrix]), None
+                if len(matrix) < self.n_segments:
+                    pending = matrix
+                    continue
+                self.kmeans.partial_fit(matrix)
+        if pending is not None:
+            self.kmeans.partial_fit(pending)
+
+        # Segmentleri gelir merkezine göre sırala (1 = en yüksek gelir)
+        centers = self.centers()
+        revenue_column = next(column for column in self.features if "gelir" in column)
+        ranking = np.argsort(-centers[revenue_column].to_numpy())
+        self.order = np.empty(self.n_segments, dtype=np.int64)
+        self.order[ranking] = np.arange(self.n_segments)
+        return self
+
+    def predict(self, df):
+        """Segment numaraları (0'dan başlar, sıralı)"""
+        if len(df) == 0:
+            return np.empty(0, dtype=np.int16)
+        raw = self.kmeans.predict(self._scaled(df))
+        return self.order[raw].astype(np.int16)
+
+    def predict_batches(self, batches):
+        """Parçalar halinde tahmin; sonuçlar parça sırasıyla birleştirilir"""
+        labels = [self.predict(batch) for batch in batches]
+        return np.concatenate(labels) if labels else np.empty(0, dtype=np.int16)
+
+    def centers(self):
+        """Küme merkezleri özgün birimlerde (ham K-Means sırasında)"""
+        return pd.DataFrame(self.scaler.inverse_transform(self.kmeans.cluster_centers_), columns=self.features)
+
+    def profiles(self):
+        """Segment merkezleri özgün birimlerde, segment sırasıyla"""
+        centers = self.centers()
+        centers.index = self.order
+        return centers.sort_index().rename_axis("segment")
+
+def model_path(kind, version, n_segments, model_dir=MODEL_DIR):
+    """Model dosyasının yolu; sürüm anahtarı dosya adına uygun hale getirilir"""
+    safe_version = re.sub(r"[^0-9A-Za-z_.-]+", "_", str(version))
+    return Path(model_dir) / f"{kind}-k{n_segments}-{safe_version}.joblib"
+
+def load_or_fit_model(kind, version, features, batch_source, n_segments=SEGMENT_COUNT, model_dir=MODEL_DIR):
+    """Kayıtlı modeli yükle; yoksa eğit ve kaydet"""
+    path = model_path(kind, version, n_segments, model_dir)
+    if path.exists():
+        model = joblib.load(path)
+        if isinstance(model, SegmentModel) and model.features == list(features):
+            return model
+    model = SegmentModel(features, n_segments, version=version).fit(batch_source)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f"{path.stem}.{uuid.uuid4().hex[:8]}.tmp")
+    joblib.dump(model, temporary)
+    temporary.replace(path)
+    return model
+
+def candidate_cells(size_km=SEGMENT_CELL_KM, cutoff_km=DEMAND_CUTOFF_KM):
+    """Aday altıgen hücreler: merkezi bir şehir merkezine `cutoff_km` içinde olan ızgara noktalarının hücreleri
+
+    Yerleşim planlayıcısının talep alanıyla (bkz. placement.demand_points) aynı kapsamdır.
+    """
+    grid_lat, grid_lng = candidate_grid(DEMAND_RESOLUTION_DEG)
+    distances, _ = city_index().nearest(grid_lat, grid_lng, workers=-1)
+    keep = distances <= cutoff_km
+    q, r = hex_cells(grid_lat[keep], grid_lng[keep], size_km)
+    return pd.DataFrame({"q": q, "r": r}).drop_duplicates(ignore_index=True)
+
+def cell_features(stations_df, size_km=SEGMENT_CELL_KM):
+    """Aday altıgen hücre özetleri + hücre merkez koordinatları (aday hücre segmentasyonu için)
+
+    İstasyonsuz aday hücreler de dahildir; sayıları, ortalamaları ve gelirleri 0'dır.
+    """
+    cells = candidate_cells(size_km).merge(aggregate_hex(stations_df, size_km), on=['q', 'r'], how='outer')
+    cells = cells.fillna(0).astype({'istasyon_sayisi': np.int64, 'soket_sayisi': np.int64})
+    cells['lat'], cells['lng'] = hex_centers(cells['q'].to_numpy(), cells['r'].to_numpy(), size_km)
+    return cells
+
+def segment_summary(df, labels, features):
+    """Segment başına satır sayısı ve özellik ortalamaları"""
+    summary = df[features].groupby(labels).mean()
+    summary.insert(0, "adet", np.bincount(labels, minlength=len(summary))[summary.index])
+    return summary.rename_axis("segment")
@@ -0,0 +1,80 @@
+"""Soğuk başlangıç ölçümü
+
+`EVC_PROFILE_STARTUP=1` ile çalıştırılan uygulama kenar çubuğunda alt sistem
+yükleme ve ilk çizim sürelerini gösterir. Komut satırından:
+
+    python -m evc.startup
+
+her alt sistemin içe aktarma süresini ayrı (soğuk) bir süreçte ve her arayüzün
+ilk çizim süresini ölçer.
+"""
+import logging
+import os
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+# Bölüm adı -> süreç içindeki ilk çizim süresi (saniye)
+FIRST_RENDER_TIMINGS = {}
+
+APP_PATH = Path(__file__).resolve().parent.parent / "app.py"
+
+def profiling_enabled():
+    """Başlangıç ölçüm modu açık mı"""
+    return os.environ.get("EVC_PROFILE_STARTUP", "0") == "1"
+
+@contextmanager
+def first_render(name):
+    """Bölümün süreç içindeki ilk çalışma süresini kaydet"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        FIRST_RENDER_TIMINGS.setdefault(name, time.perf_counter() - start)
+
+def measure_import(module):
+    """Modülü yeni bir Python sürecinde içe aktarıp süresini (saniye) ölç"""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"import {module}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=APP_PATH.parent
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+def measure_imports():
+    """Streamlit ve her alt sistem için soğuk içe aktarma süreleri"""
+    from evc import SUBSYSTEMS
+
+    timings = {"streamlit": measure_import("streamlit"), "evc.ui.app": measure_import("evc.ui.app")}
+    for name in SUBSYSTEMS:
+        timings[f"evc.{name}"] = measure_import(f"evc.{name}")
+    return timings
+
+def measure_first_render(timeout=120):
+    """Her kullanıcı modu için uygulamanın ilk çalıştırma süresi (yeni oturum)"""
+    from streamlit.testing.v1 import AppTest
+
+    logging.disable(logging.WARNING)  # Streamlit'in kullanım uyarıları tabloyu bozmasın
+    timings = {}
+    for user_type in ["Genel Kullanıcı", "Yatırımcı"]:
+        start = time.perf_counter()
+        app = AppTest.from_file(str(APP_PATH), default_timeout=timeout).run()
+        if user_type != "Genel Kullanıcı":
+            app.sidebar.selectbox[0].select(user_type).run()
+        timings[user_type] = time.perf_counter() - start
+    return timings
+
+def main():
+    print("Soğuk içe aktarma süreleri (ayrı süreçlerde):")
+    for module, seconds in measure_imports().items():
+        print(f"  {module:<20} {seconds * 1000:8.1f} ms")
+    print("İlk çizim süreleri (aynı süreçte, sırayla):")
+    for user_type, seconds in measure_first_render().items():
+        print(f"  {user_type:<20} {seconds * 1000:8.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,524 @@
+"""Kalıcı sütunsal veri deposu (şehir bazında bölümlenmiş Arrow IPC)
+
+Dosyalar sıkıştırılmadan yazılır; böylece okuma sırasında bellek
+eşlemeli (memory-mapped) tamponlar çözülmeden kullanılabilir. Tüm depo
+okunurken veri sürümü başına tek parça bir kopya (`_snapshots/`) kullanılır;
+sayısal sütunlar bu dosyaya bakan salt okunur dizilerdir ve süreçler ile
+oturumlar arasında işletim sisteminin sayfa önbelleği üzerinden paylaşılır.
+"""
+import json
+import re
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from urllib.parse import quote, unquote
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+
+from evc.config import DEMOGRAPHIC_STORE, STATION_COLUMNS, STATION_STORE, STORE_MANIFEST
+from evc.data import dataset_version, generate_charging_stations, generate_demographic_data
+
+CHANGES_DIR = "_changes"  # Birleştirme sırası başına değişiklik günlüğü (eklenen/güncellenen satırlar ve silinenler)
+STAGING_DIR = "_staging"  # Akış halinde yazılan parçaların geçici bölüm dosyaları
+SNAPSHOT_DIR = "_snapshots"  # Veri sürümü başına tek parça (bellek eşlemeli, sıfır kopyalı okunan) depo kopyası
+# Değişen satırlar deponun bu oranını aşarsa günlük tutulmaz, yeni temel sürüm başlatılır
+CHANGE_LOG_MAX_FRACTION = 0.5
+
+# Ayrı yazılan bölüm dosyalarının ortak şeması
+STATION_SCHEMA = pa.schema([
+    ("istasyon_id", pa.string()),
+    ("isim", pa.dictionary(pa.int32(), pa.string())),
+    ("operatör", pa.dictionary(pa.int32(), pa.string())),
+    ("güç_tipi", pa.dictionary(pa.int32(), pa.string())),
+    ("güç_kw", pa.int32()),
+    ("soket_sayisi", pa.int32()),
+    ("lat", pa.float64()),
+    ("lng", pa.float64()),
+    ("kullanim_orani", pa.float64()),
+    ("gunluk_gelir", pa.float64()),
+    ("kurulum_tarihi", pa.timestamp("ns"))
+])
+
+def _mmap_filesystem():
+    """Dosyaları bellek eşlemeli (memory-mapped) açan yerel dosya sistemi"""
+    return pafs.LocalFileSystem(use_mmap=True)
+
+def write_station_store(stations_df, path=STATION_STORE):
+    """İstasyonları şehir bazında bölümlenmiş Arrow IPC dosyalarına yaz"""
+    path = Path(path)
+    table = pa.Table.from_pandas(stations_df[STATION_COLUMNS], preserve_index=False)
+    # Benzersiz kimlikler sözlüksüz yazılır; aksi halde her bölüm tüm sözlüğü taşır
+    for column in ("istasyon_id", "sehir"):
+        table = table.set_column(
+            table.schema.get_field_index(column), column, table.column(column).cast(pa.string())
+        )
+    ds.write_dataset(
+        table,
+        path,
+        format="ipc",
+        partitioning=ds.partitioning(pa.schema([("sehir", pa.string())]), flavor="hive"),
+        existing_data_behavior="delete_matching"
+    )
+    shutil.rmtree(path / CHANGES_DIR, ignore_errors=True)
+    version = dataset_version(stations_df)
+    _write_manifest(path, {"dataset_version": version, "base_version": version, "sequence": 0, "rows": len(stations_df)})
+
+def _write_manifest(path, manifest):
+    temporary = Path(path) / f"{STORE_MANIFEST}.tmp"
+    temporary.write_text(json.dumps(manifest, ensure_ascii=False), encoding="utf-8")
+    temporary.replace(Path(path) / STORE_MANIFEST)
+
+def read_store_manifest(path=STATION_STORE):
+    """Depo manifesti; eski manifestlerde temel sürüm veri sürümüdür ve günlük sırası 0"""
+    manifest = json.loads((Path(path) / STORE_MANIFEST).read_text(encoding="utf-8"))
+    manifest.setdefault("base_version", manifest["dataset_version"])
+    manifest.setdefault("sequence", 0)
+    return manifest
+
+def open_station_store(path=STATION_STORE):
+    """Depoyu bellek eşlemeli bir pyarrow Dataset olarak aç (veri okunmaz)"""
+    return ds.dataset(
+        Path(path),
+        format="ipc",
+        filesystem=_mmap_filesystem(),
+        partitioning=ds.HivePartitioning.discover(infer_dictionary=True),
+        exclude_invalid_files=True,
+        ignore_prefixes=[".", "_", STORE_MANIFEST]
+    )
+
+def station_store_filter(cities=None, operators=None, power_range=None):
+    """Şehir, operatör ve güç filtrelerini taramaya itilecek Arrow ifadesine çevir"""
+    conditions = []
+    if cities is not None:
+        conditions.append(ds.field("sehir").isin(list(cities)))
+    if operators is not None:
+        conditions.append(ds.field("operatör").isin(list(operators)))
+    if power_range is not None:
+        conditions.append((ds.field("güç_kw") >= power_range[0]) & (ds.field("güç_kw") <= power_range[1]))
+    expression = None
+    for condition in conditions:
+        expression = condition if expression is None else expression & condition
+    return expression
+
+def _read_station_table(path, columns, expression=None):
+    table = open_station_store(path).to_table(columns=columns, filter=expression)
+    if "istasyon_id" in table.column_names:
+        table = table.set_column(
+            table.schema.get_field_index("istasyon_id"), "istasyon_id",
+            table.column("istasyon_id").combine_chunks().dictionary_encode()
+        )
+    return table
+
+def _snapshot_path(path, version):
+    return Path(path) / SNAPSHOT_DIR / f"{re.sub(r'[^0-9A-Za-z_.-]+', '_', version)}.arrow"
+
+def load_station_snapshot(path=STATION_STORE):
+    """Tüm depo, manifest sürümünün tek parça kopyasından bellek eşlemeli olarak
+
+    Kopya yoksa bölümlerden bir kez yazılır ve diğer sürümlerin kopyaları silinir.
+    Boş değer içermeyen sayısal sütunlar dosyadaki tamponları kopyalamadan
+    kullanır (salt okunur); çerçeve yerinde değiştirilemez.
+    """
+    manifest = read_store_manifest(path)
+    version = manifest["dataset_version"]
+    snapshot = _snapshot_path(path, version)
+    if not snapshot.exists():
+        table = _read_station_table(path, STATION_COLUMNS)
+        if read_store_manifest(path)["dataset_version"] != version:
+            # Okuma sırasında yeni bir birleştirme tamamlandı; tablo hangi sürüme ait olduğu bilinmediğinden kaydedilmez
+            return load_station_snapshot(path)
+        _write_ipc(snapshot, table)
+        for stale in snapshot.parent.glob("*.arrow"):
+            if stale != snapshot:
+                stale.unlink(missing_ok=True)
+    stations_df = _read_ipc(snapshot).to_pandas(split_blocks=True)
+    stations_df.attrs["dataset_version"] = version
+    return stations_df
+
+def load_station_store(path=STATION_STORE, cities=None, operators=None, power_range=None, columns=None):
+    """Depodan istasyonları oku; filtreler taramaya itilir, yalnızca gereken bölümler okunur
+
+    Filtresiz tam okuma tek parça sürüm kopyasından yapılır (bkz. load_station_snapshot).
+    """
+    if cities is None and operators is None and power_range is None and columns is None:
+        return load_station_snapshot(path)
+    columns = list(columns) if columns is not None else STATION_COLUMNS
+    table = _read_station_table(path, columns, station_store_filter(cities, operators, power_range))
+    stations_df = table.to_pandas()
+    manifest = read_store_manifest(path)
+    if cities is None and operators is None and power_range is None:
+        stations_df.attrs["dataset_version"] = manifest["dataset_version"]
+    return stations_df
+
+def iter_station_batches(path=STATION_STORE, columns=None, batch_rows=65_536):
+    """Depoyu en fazla `batch_rows` satırlık DataFrame parçaları halinde akıt (sınırlı bellek)"""
+    columns = list(columns) if columns is not None else STATION_COLUMNS
+    for batch in open_station_store(path).to_batches(columns=columns, batch_size=batch_rows):
+        if batch.num_rows:
+            yield batch.to_pandas()
+
+def write_demographic_store(demographic_df, path=DEMOGRAPHIC_STORE):
+    """Demografik verileri tek bir Arrow IPC dosyasına yaz"""
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(demographic_df, preserve_index=False)
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+def load_demographic_store(path=DEMOGRAPHIC_STORE):
+    """Demografik verileri bellek eşlemeli olarak oku (sayısal sütunlar kopyalanmaz)"""
+    with pa.memory_map(str(path), "r") as source:
+        return pa.ipc.open_file(source).read_all().to_pandas(split_blocks=True)
+
+def demographic_store_version(path=DEMOGRAPHIC_STORE):
+    """Demografik dosyanın sürüm anahtarı (değişiklik zamanı ve boyutu); dosya yoksa None"""
+    if not Path(path).exists():
+        return None
+    stat = Path(path).stat()
+    return f"demo-{stat.st_mtime_ns}-{stat.st_size}"
+
+def station_store_version(path=STATION_STORE):
+    """Depo manifestindeki veri sürümü (depo yoksa None)"""
+    if not station_store_exists(path):
+        return None
+    return read_store_manifest(path)["dataset_version"]
+
+def station_store_exists(path=STATION_STORE):
+    """Depo (manifest dosyasıyla birlikte) yazılmış mı"""
+    return (Path(path) / STORE_MANIFEST).exists()
+
+def ensure_station_store(path=STATION_STORE):
+    """Depo yoksa istasyonları bir kez üretip yaz"""
+    if not station_store_exists(path):
+        write_station_store(generate_charging_stations(), path)
+
+def ensure_demographic_store(path=DEMOGRAPHIC_STORE):
+    """Demografik depo yoksa verileri bir kez üretip yaz"""
+    if not Path(path).exists():
+        write_demographic_store(generate_demographic_data(), path)
+
+def _id_hashes(ids):
+    """İstasyon kimliklerinin 64 bit özetleri (kimlik kümeleri bellekte bu haliyle tutulur)"""
+    return pd.util.hash_array(np.asarray(ids, dtype=object))
+
+def _contains(sorted_hashes, hashes):
+    """`hashes` elemanları sıralı özet kümesinde mi (np.isin her çağrıda kümeyi yeniden sıralar)"""
+    if not len(sorted_hashes):
+        return np.zeros(len(hashes), dtype=bool)
+    positions = np.minimum(np.searchsorted(sorted_hashes, hashes), len(sorted_hashes) - 1)
+    return sorted_hashes[positions] == hashes
+
+def _lookup(sorted_hashes, values, hashes, default):
+    """Sıralı özet kümesinde `hashes` elemanlarına karşılık gelen değerler (bulunmayanlar `default`)"""
+    if not len(sorted_hashes):
+        return np.full(len(hashes), default, dtype=np.int64)
+    positions = np.minimum(np.searchsorted(sorted_hashes, hashes), len(sorted_hashes) - 1)
+    return np.where(sorted_hashes[positions] == hashes, values[positions], default)
+
+def _partition_path(path, city):
+    return Path(path) / f"sehir={quote(city, safe='')}" / "part-0.arrow"
+
+def _partition_cities(path):
+    return sorted(unquote(child.name.split("=", 1)[1]) for child in Path(path).glob("sehir=*") if child.is_dir())
+
+def _read_ipc(file_path, columns=None):
+    with pa.memory_map(str(file_path), "r") as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.select(columns) if columns is not None else table
+
+def _station_table(stations_df):
+    """Çerçeveyi ortak bölüm şemasına çevir (eksik sütunlar boş)"""
+    columns = {}
+    for field in STATION_SCHEMA:
+        if field.name in stations_df:
+            values = stations_df[field.name]
+            if pa.types.is_dictionary(field.type):
+                values = values.astype(object).where(values.notna(), None)
+            columns[field.name] = pa.array(values, type=field.type.value_type if pa.types.is_dictionary(field.type) else field.type, from_pandas=True)
+            if pa.types.is_dictionary(field.type):
+                columns[field.name] = columns[field.name].dictionary_encode().cast(field.type)
+        else:
+            columns[field.name] = pa.nulls(len(stations_df), type=field.type)
+    return pa.table(columns, schema=STATION_SCHEMA)
+
+def _write_ipc(file_path, table):
+    """IPC dosyasını geçici dosya üzerinden atomik olarak yaz"""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = file_path.with_name(f"{file_path.stem}.{uuid.uuid4().hex[:8]}.tmp")
+    # IPC dosyası alan başına tek sözlük taşıyabilir; parçalı tablolar birleştirilir
+    table = table.unify_dictionaries().combine_chunks()
+    with pa.OSFile(str(temporary), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    temporary.replace(file_path)
+
+def concat_stations(frames):
+    """İstasyon çerçevelerini birleştir; kategorik sütunların kategorileri birleşimle korunur"""
+    frames = [frame for frame in frames if len(frame)] or frames[:1]
+    categorical = [column for column in frames[0] if isinstance(frames[0][column].dtype, pd.CategoricalDtype)]
+    combined = pd.concat([frame.drop(columns=categorical) for frame in frames], ignore_index=True)
+    for column in categorical:
+        # İlk çerçevenin kategori sırası korunur; yeni değerler sona eklenir (kodlar yeniden eşlenmez)
+        combined[column] = union_categoricals([
+            frame[column] if isinstance(frame[column].dtype, pd.CategoricalDtype) else frame[column].astype("category")
+            for frame in frames
+        ], ignore_order=True)
+    return combined[list(frames[0].columns)]
+
+def read_station_changes(sequence, path=STATION_STORE):
+    """Günlükteki bir birleştirmenin (eklenen/güncellenen satırlar, silinen kimlikler)"""
+    table = _read_ipc(Path(path) / CHANGES_DIR / f"{sequence:08d}.arrow")
+    deleted = table.column("_silindi")
+    upserts = table.filter(pc.invert(deleted)).select([name for name in table.column_names if name != "_silindi"]).to_pandas()
+    return upserts, np.asarray(table.filter(deleted).column("istasyon_id").to_pylist(), dtype=object)
+
+class StationStoreWriter:
+    """Akış halinde gelen istasyon değişikliklerini depoya şehir bölümü bazında uygula
+
+    Eklenen/güncellenen satırlar parça parça geçici bölüm dosyalarına yazılır;
+    `commit()` yalnızca değişikliğe uğrayan şehir bölümlerini yeniden yazar ve
+    değişiklikleri günlüğe ekler. Bellekte yalnızca kimlik özetleri, silme ve
+    durum güncellemeleri tutulur; kullanım parça boyutu ve en büyük bölümle
+    sınırlıdır. `replace=True` ile depo gelen verinin tamamıyla değiştirilir.
+    """
+
+    def __init__(self, path=STATION_STORE, replace=False):
+        self.path = Path(path)
+        self.replace = replace or not station_store_exists(path)
+        self.staging = self.path / STAGING_DIR / uuid.uuid4().hex[:12]
+        self.staged_cities = set()
+        self._chunks = 0
+        self._upserted = []  # parça başına kimlik özetleri (liste sırası parça numarasıdır)
+        self._deleted = {}  # kimlik -> silme anına kadar yazılmış parça sayısı
+        self._patches = []
+
+    def upsert(self, stations_df):
+        """Normalize edilmiş istasyon satırlarını ekle veya güncelle (`sehir` sütunu gerekli)"""
+        if not len(stations_df):
+            return
+        for city, rows in stations_df.groupby('sehir', observed=True, sort=False):
+            _write_ipc(self.staging / quote(city, safe="") / f"{self._chunks:08d}.arrow", _station_table(rows))
+            self.staged_cities.add(city)
+        self._upserted.append(_id_hashes(stations_df['istasyon_id']))
+        self._chunks += 1
+
+    def delete(self, ids):
+        """İstasyonları sil; yalnızca depodaki ve daha önce eklenen parçalardaki satırlar silinir
+
+        Akış sırası korunur: sonraki bir parçada yeniden eklenen istasyon kalır.
+        """
+        for station_id in ids:
+            self._deleted[station_id] = self._chunks
+
+    def patch(self, patch_df):
+        """Var olan istasyonların yalnızca verilen sütunlarını güncelle (ör. kullanım oranı)"""
+        if len(patch_df):
+            self._patches.append(patch_df)
+
+    def _last_upserts(self):
+        """Eklenen kimlik özetleri (sıralı) ve her birinin son eklendiği parça numarası"""
+        if not self._upserted:
+            return np.empty(0, dtype=np.uint64), np.empty(0, dtype=np.int64)
+        hashes = np.concatenate(self._upserted)
+        chunks = np.repeat(np.arange(len(self._upserted)), [len(chunk) for chunk in self._upserted])
+        order = np.lexsort((chunks, hashes))
+        hashes, chunks = hashes[order], chunks[order]
+        last = np.append(hashes[1:] != hashes[:-1], True)
+        return hashes[last], chunks[last]
+
+    def _staged_rows(self, city, upserted, last_chunks, deleted_hashes):
+        """Şehrin geçerli parça satırları: kimliğin son eklendiği parçadakiler (sonradan silinenler hariç)
+
+        Başka bir şehre taşınan veya sonradan silinen istasyonların eski satırları atılır.
+        """
+        files = sorted((self.staging / quote(city, safe="")).glob("*.arrow"))
+        tables = [_read_ipc(file) for file in files]
+        chunks = np.repeat([int(file.stem) for file in files], [table.num_rows for table in tables])
+        rows = pa.concat_tables(tables).to_pandas()
+        hashes = _id_hashes(rows['istasyon_id'])
+        valid = (_lookup(upserted, last_chunks, hashes, -1) == chunks) & ~_contains(deleted_hashes, hashes)
+        rows = rows[valid].drop_duplicates('istasyon_id', keep='last')
+        rows['sehir'] = city
+        return rows
+
+    def commit(self):
+        """Değişiklikleri depoya yaz; özet sözlüğü döndür"""
+        upserted, last_chunks = self._last_upserts()
+        # Silme, kimlik silindikten sonraki bir parçada yeniden eklenmediyse geçerlidir
+        delete_ids = np.array(list(self._deleted), dtype=object)
+        delete_chunks = np.fromiter(self._deleted.values(), dtype=np.int64, count=len(self._deleted))
+        removed = _lookup(upserted, last_chunks, _id_hashes(delete_ids), -1) < delete_chunks
+        removed_ids = sorted(delete_ids[removed])
+        deleted = np.unique(_id_hashes(removed_ids))
+        patches = pd.DataFrame(columns=["istasyon_id"])
+        if self._patches:
+            patches = pd.concat(self._patches, ignore_index=True).drop_duplicates('istasyon_id', keep='last')
+        affected = np.unique(np.concatenate([upserted, deleted, _id_hashes(patches['istasyon_id'])]))
+
+        # Değişen kimlikleri içeren bölümler yalnızca kimlik sütunu okunarak bulunur
+        existing_cities = [] if self.replace else _partition_cities(self.path)
+        touched = set(self.staged_cities)
+        for city in existing_cities:
+            ids = _read_ipc(_partition_path(self.path, city), ["istasyon_id"]).column(0).to_numpy(zero_copy_only=False)
+            if _contains(affected, _id_hashes(ids)).any():
+                touched.add(city)
+
+        replaced = np.union1d(upserted, deleted)
+        changed, counts = [], {"upserted": 0, "deleted": 0, "patched": 0}
+        for city in sorted(touched):
+            parts = []
+            if city in existing_cities:
+                current = _read_ipc(_partition_path(self.path, city)).to_pandas()
+                current_hashes = _id_hashes(current['istasyon_id'])
+                counts["deleted"] += int(_contains(deleted, current_hashes).sum())
+                parts.append(current[~_contains(replaced, current_hashes)])
+            if city in self.staged_cities:
+                staged = self._staged_rows(city, upserted, last_chunks, deleted)
+                counts["upserted"] += len(staged)
+                parts.append(staged)
+            frame = concat_stations(parts) if parts else pd.DataFrame(columns=STATION_SCHEMA.names)
+            frame['sehir'] = city
+
+            # Durum güncellemeleri yalnızca verilen sütunları değiştirir
+            targets = patches[patches['istasyon_id'].isin(frame['istasyon_id'])]
+            if len(targets):
+                frame = frame.set_index('istasyon_id')
+                frame.update(targets.set_index('istasyon_id'))
+                frame = frame.reset_index()
+                counts["patched"] += len(targets)
+
+            if len(frame):
+                _write_ipc(_partition_path(self.path, city), _station_table(frame))
+                changed_rows = _contains(upserted, _id_hashes(frame['istasyon_id'])) | frame['istasyon_id'].isin(targets['istasyon_id']).to_numpy()
+                changed.append(frame[changed_rows])
+            else:
+                shutil.rmtree(_partition_path(self.path, city).parent, ignore_errors=True)
+
+        if self.replace:
+            for city in _partition_cities(self.path):
+                if city not in touched:
+                    shutil.rmtree(_partition_path(self.path, city).parent, ignore_errors=True)
+        shutil.rmtree(self.staging, ignore_errors=True)
+        return self._finish(changed, counts, touched, removed_ids)
+
+    def _finish(self, changed, counts, touched, removed_ids):
+        rows = open_station_store(self.path).count_rows()
+        changed = concat_stations(changed) if changed else pd.DataFrame(columns=STATION_SCHEMA.names + ["sehir"])
+        summary = {**counts, "partitions": len(touched), "rows": rows}
+        manifest = {} if self.replace else read_store_manifest(self.path)
+        if self.replace or len(changed) + len(removed_ids) > CHANGE_LOG_MAX_FRACTION * max(rows, 1):
+            # Büyük değişiklikte (veya tam yüklemede) günlük yerine yeni temel sürüm
+            shutil.rmtree(self.path / CHANGES_DIR, ignore_errors=True)
+            base = f"ingest-{uuid.uuid4().hex[:12]}"
+            manifest = {"dataset_version": base, "base_version": base, "sequence": 0, "rows": rows}
+        else:
+            sequence = manifest["sequence"] + 1
+            log = pa.concat_tables([
+                _station_table(changed).append_column("sehir", pa.array(changed['sehir'].astype(object), pa.string()))
+                .append_column("_silindi", pa.array(np.zeros(len(changed), dtype=bool))),
+                _station_table(pd.DataFrame({"istasyon_id": removed_ids})).append_column("sehir", pa.nulls(len(removed_ids), pa.string()))
+                .append_column("_silindi", pa.array(np.ones(len(removed_ids), dtype=bool)))
+            ])
+            _write_ipc(self.path / CHANGES_DIR / f"{sequence:08d}.arrow", log)
+            manifest = {
+                "dataset_version": f"{manifest['base_version']}+{sequence}",
+                "base_version": manifest["base_version"],
+                "sequence": sequence,
+                "rows": rows
+            }
+        _write_manifest(self.path, manifest)
+        return {**summary, "dataset_version": manifest["dataset_version"]}
+
+class StationDataset:
+    """Depodaki istasyonların süreç içi paylaşılan kopyası
+
+    `refresh()` manifestteki günlük sırasını kontrol eder; yeni birleştirmeler
+    varsa yalnızca değişen satırlar uygulanır (depo yeniden okunmaz); filtre
+    indeksi kaydırılarak, operatör/şehir özetleri değişen satırlarla
+    güncellenir. Temel sürüm değiştiyse tamamı yüklenir. Çerçeve hiçbir zaman
+    yerinde değiştirilmez; eski kopyayı tutan oturumlar etkilenmez.
+    """
+
+    def __init__(self, path=STATION_STORE):
+        self.path = Path(path)
+        self.stations_df = None
+        self.base_version = None
+        self.sequence = 0
+        self._lock = threading.Lock()
+        self._filter_index = None
+        self._station_index = None
+        self._aggregates = None
+
+    @property
+    def version(self):
+        return dataset_version(self.stations_df)
+
+    def refresh(self):
+        """Güncel istasyon çerçevesi"""
+        manifest = read_store_manifest(self.path)
+        with self._lock:
+            stale = self.stations_df is None or manifest["base_version"] != self.base_version or manifest["sequence"] < self.sequence
+            if not stale and manifest["sequence"] > self.sequence:
+                try:
+                    for sequence in range(self.sequence + 1, manifest["sequence"] + 1):
+                        self._apply(*read_station_changes(sequence, self.path))
+                        self.sequence = sequence
+                except FileNotFoundError:
+                    stale = True
+            if stale:
+                self.stations_df = load_station_store(self.path)
+                self.base_version, self.sequence = manifest["base_version"], manifest["sequence"]
+                self._filter_index = self._station_index = self._aggregates = None
+            self.stations_df.attrs["dataset_version"] = manifest["dataset_version"]
+            return self.stations_df
+
+    def _apply(self, upserts, deleted_ids):
+        ids = self.stations_df['istasyon_id']
+        keep = ~ids.isin(np.concatenate([upserts['istasyon_id'].to_numpy(dtype=object), deleted_ids])).to_numpy()
+        stations_df = concat_stations([self.stations_df[keep], upserts[self.stations_df.columns]])
+        stations_df.attrs = dict(self.stations_df.attrs)
+        if self._filter_index is not None:
+            self._filter_index = self._filter_index.apply_changes(keep, stations_df.iloc[int(keep.sum()):])
+        if self._aggregates is not None:
+            # Güncellenen istasyonların eski satırları çıkarılıp yenileri eklenir
+            self._aggregates = self._aggregates.apply_changes(self.stations_df[~keep], upserts)
+        self._station_index = None  # KD-ağacı güncellenemez; ilk kullanımda yeniden kurulur
+        self.stations_df = stations_df
+
+    def filter_index(self, version=None):
+        """Güncel çerçevenin filtre indeksi; `version` verilmiş ve güncel değilse None"""
+        from evc.filters import StationFilterIndex
+
+        with self._lock:
+            if version is not None and version != self.version:
+                return None
+            if self._filter_index is None:
+                self._filter_index = StationFilterIndex(self.stations_df)
+            return self._filter_index
+
+    def aggregates(self, version=None):
+        """Güncel çerçevenin operatör/şehir özetleri; `version` verilmiş ve güncel değilse None"""
+        from evc.aggregates import StationAggregates
+
+        with self._lock:
+            if version is not None and version != self.version:
+                return None
+            if self._aggregates is None:
+                self._aggregates = StationAggregates(self.stations_df)
+            return self._aggregates
+
+    def station_index(self, version=None):
+        """Güncel çerçevenin uzamsal indeksi; `version` verilmiş ve güncel değilse None"""
+        from evc.spatial import GeoIndex
+
+        with self._lock:
+            if version is not None and version != self.version:
+                return None
+            if self._station_index is None:
+                self._station_index = GeoIndex(self.stations_df['lat'].to_numpy(), self.stations_df['lng'].to_numpy())
+            return self._station_index
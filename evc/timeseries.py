@@ -0,0 +1,379 @@
+"""İstasyon başına saatlik doluluk ve enerji zaman serileri
+
+Depo düzeni (temel veri sürümü başına bir klasör):
+
+    manifest.json                 başlangıç günü, gün sayısı, ay başları
+    stations.npy                  sütun sırasındaki istasyon kimlikleri
+    install_day.npy               kurulum günü (başlangıç gününe göre)
+    hourly/occupancy-YYYY-MM.npy  saat x istasyon doluluk (uint8, 1/250 çözünürlük)
+    hourly/energy-YYYY-MM.npy     saat x istasyon enerji (kWh, float32)
+    daily_<metrik>.npy            gün x istasyon günlük toplamlar
+    prefix_<metrik>.npy           günlük toplamların önek toplamları (gün + 1 x istasyon)
+    total_<metrik>.npy            tüm istasyonların önek toplamı (gün + 1)
+    hour_profile.npy              ay x saat x istasyon doluluk toplamları
+
+Bir tarih aralığının toplamı önek toplamlarının iki satırının farkıdır;
+haftalık ve aylık seriler dönem sınırlarındaki farklardır. Böylece yılların
+geçmişi olan binlerce istasyon üzerindeki aralık sorguları saatlik veriye
+dokunmadan milisaniyeler içinde yanıtlanır. Dosyalar bellek eşlemeli açılır.
+
+Henüz gerçek saatlik besleme olmadığından seriler istasyon niteliklerinden
+üretilir: kullanım oranı, kurulumdan sonra kademeli artış, gün içi ve hafta
+içi profiller, mevsimsellik ve pazar büyümesi.
+"""
+import hashlib
+import json
+import re
+import shutil
+import uuid
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from evc.config import TIMESERIES_DIR
+from evc.data import dataset_version
+
+METRICS = ("occupancy", "energy")
+MANIFEST = "manifest.json"
+OCCUPANCY_SCALE = 250  # uint8 doluluk kodu / 250 = doluluk oranı
+HISTORY_DAYS = 3 * 365  # En fazla bu kadar gün geriye üretilir
+OCCUPANCY_FACTOR = 0.5  # Kullanım oranı yoğun saat doluluğu kabul edilir; saatlik ortalama yaklaşık yarısıdır
+CHARGE_POWER_FACTOR = 0.6  # Dolu soketin ortalama çektiği güç / nominal güç
+RAMP_UP_DAYS = 90  # Yeni istasyonun talebe ulaşma süresi (zaman sabiti)
+MARKET_GROWTH = 0.25  # Yıllık talep artışı
+SEASONAL_AMPLITUDE = 0.12  # Yaz aylarında tepe yapan mevsimsel salınım
+DAY_NOISE, HOUR_NOISE = 0.15, 0.10
+FAST_CHARGE_KW = 50
+
+FREQUENCY_LABELS = {"Günlük": "D", "Haftalık": "W", "Aylık": "M"}
+ACTIVITY_LABELS = {
+    "enerji_mwh": "Enerji (MWh)",
+    "doluluk": "Ort. Doluluk",
+    "buyume": "Enerji Büyümesi"
+}
+
+def _normalized(profile):
+    profile = np.asarray(profile, dtype=np.float32)
+    return profile / profile.mean()
+
+# Gün içi doluluk profilleri (ortalama 1): AC işyeri/konut ağırlıklı, DC yol üstü ve akşam tepeli
+AC_PROFILE = _normalized([
+    0.5, 0.45, 0.4, 0.4, 0.4, 0.45, 0.6, 0.9, 1.3, 1.5, 1.5, 1.4,
+    1.3, 1.3, 1.4, 1.4, 1.3, 1.2, 1.1, 1.0, 0.9, 0.8, 0.7, 0.6
+])
+DC_PROFILE = _normalized([
+    0.2, 0.15, 0.1, 0.1, 0.15, 0.3, 0.6, 0.9, 1.1, 1.2, 1.3, 1.5,
+    1.6, 1.5, 1.4, 1.4, 1.5, 1.7, 1.8, 1.6, 1.3, 1.0, 0.6, 0.4
+])
+WEEKDAY_FACTORS = _normalized([1.0, 0.98, 1.0, 1.02, 1.1, 1.0, 0.9])  # Pazartesi..Pazar
+
+def timeseries_store_path(version, root=TIMESERIES_DIR):
+    """Sürümün seri deposu klasörü; sürüm anahtarı klasör adına uygun hale getirilir"""
+    return Path(root) / re.sub(r"[^0-9A-Za-z_.-]+", "_", str(version))
+
+def timeseries_store_exists(path):
+    return (Path(path) / MANIFEST).exists()
+
+def _weekdays(days):
+    """datetime64[D] dizisinin haftanın günü (Pazartesi = 0); 1970-01-01 perşembedir"""
+    return (days.astype(np.int64) + 3) % 7
+
+def _month_ranges(start, end):
+    """[başlangıç, bitiş) aralığını ay parçalarına böl: (etiket, ilk gün, son gün + 1) indeksleri"""
+    months = np.arange(start.astype("datetime64[M]"), (end - 1).astype("datetime64[M]") + 1)
+    ranges = []
+    for month in months:
+        first = max(month.astype("datetime64[D]"), start)
+        last = min((month + 1).astype("datetime64[D]"), end)
+        ranges.append((str(month), int((first - start).astype(np.int64)), int((last - start).astype(np.int64))))
+    return ranges
+
+def build_timeseries_store(stations_df, path, version=None, end=None):
+    """İstasyonların saatlik serilerini ay ay üretip depoya yaz; depo yolunu döndür
+
+    Seri `end` gününe kadar (hariç, varsayılan bugün) ve en eski kurulumdan
+    itibaren en fazla HISTORY_DAYS gün geriye üretilir. Bellekte aynı anda
+    yalnızca bir aylık parça tutulur; aynı sürüm için çıktı birebir aynıdır.
+    Yazım tamamlanınca diğer sürümlerin klasörleri silinir.
+    """
+    path = Path(path)
+    version = version or dataset_version(stations_df)
+    end = np.datetime64(pd.Timestamp(end if end is not None else pd.Timestamp.now()).date(), "D")
+    installed = stations_df['kurulum_tarihi'].to_numpy(dtype="datetime64[D]")
+    known = ~np.isnat(installed)
+    start = end - HISTORY_DAYS
+    if known.any():
+        start = max(start, installed[known].min())
+    start = start.astype("datetime64[M]").astype("datetime64[D]")
+    n_days, n_stations = int((end - start).astype(np.int64)), len(stations_df)
+
+    # Kurulum tarihi bilinmeyen (ör. içe aktarılmış) istasyonlar dönem başından beri açık sayılır
+    install_day = np.where(known, (installed - start).astype(np.int64), 0).astype(np.int32)
+    utilization = stations_df['kullanim_orani'].astype(np.float64)
+    base = utilization.fillna(utilization.mean()).fillna(0.5).to_numpy(dtype=np.float32) * OCCUPANCY_FACTOR
+    power_kw = stations_df['güç_kw'].astype(np.float64).fillna(22).to_numpy(dtype=np.float32)
+    sockets = stations_df['soket_sayisi'].astype(np.float64).fillna(2).to_numpy(dtype=np.float32)
+    profile = np.where(power_kw >= FAST_CHARGE_KW, DC_PROFILE[:, None], AC_PROFILE[:, None])
+    capacity_kw = sockets * power_kw * CHARGE_POWER_FACTOR
+    rng = np.random.default_rng(int.from_bytes(hashlib.blake2b(str(version).encode("utf-8"), digest_size=8).digest(), "little"))
+
+    staging = path.with_name(f"{path.name}.tmp-{uuid.uuid4().hex[:8]}")
+    (staging / "hourly").mkdir(parents=True)
+    months = _month_ranges(start, end)
+    daily = {
+        metric: np.lib.format.open_memmap(staging / f"daily_{metric}.npy", "w+", np.float32, (n_days, n_stations))
+        for metric in METRICS
+    }
+    hour_profile = np.lib.format.open_memmap(staging / "hour_profile.npy", "w+", np.float32, (len(months), 24, n_stations))
+    for month, (label, first, last) in enumerate(months):
+        days = np.arange(first, last)
+        dates = start + days
+        day_of_year = (dates - dates.astype("datetime64[Y]")).astype(np.int64)
+        day_factor = (
+            WEEKDAY_FACTORS[_weekdays(dates)]
+            * (1 + SEASONAL_AMPLITUDE * np.cos(2 * np.pi * (day_of_year - 196) / 365.25))
+            * np.exp(MARKET_GROWTH * (days - n_days) / 365.25)
+        ).astype(np.float32)
+        age = days[:, None] - install_day[None, :]
+        ramp = np.where(age >= 0, 1 - np.exp(-(age + 1) / RAMP_UP_DAYS), 0).astype(np.float32)
+        level = base * day_factor[:, None] * ramp * rng.lognormal(0, DAY_NOISE, ramp.shape).astype(np.float32)
+
+        # gün x saat x istasyon; doluluk uint8 koduna yuvarlanır, toplamlar kodlanmış değerlerden hesaplanır
+        occupancy = level[:, None, :] * profile[None] * rng.normal(1, HOUR_NOISE, (len(days), 24, n_stations)).astype(np.float32)
+        codes = np.rint(np.clip(occupancy, 0, 1) * OCCUPANCY_SCALE).astype(np.uint8)
+        occupancy = codes.astype(np.float32) / OCCUPANCY_SCALE
+        energy = occupancy * capacity_kw
+        np.save(staging / "hourly" / f"occupancy-{label}.npy", codes.reshape(-1, n_stations))
+        np.save(staging / "hourly" / f"energy-{label}.npy", energy.reshape(-1, n_stations))
+        daily["occupancy"][first:last] = occupancy.sum(axis=1)
+        daily["energy"][first:last] = energy.sum(axis=1)
+        hour_profile[month] = occupancy.sum(axis=0)
+
+    for metric in METRICS:
+        prefix = np.lib.format.open_memmap(staging / f"prefix_{metric}.npy", "w+", np.float64, (n_days + 1, n_stations))
+        prefix[0] = 0
+        np.cumsum(daily[metric], axis=0, dtype=np.float64, out=prefix[1:])
+        np.save(staging / f"total_{metric}.npy", prefix.sum(axis=1))
+        prefix.flush()
+        daily[metric].flush()
+    hour_profile.flush()
+    del daily, hour_profile, prefix
+
+    np.save(staging / "stations.npy", stations_df['istasyon_id'].astype(str).to_numpy(dtype=str))
+    np.save(staging / "install_day.npy", install_day)
+    (staging / MANIFEST).write_text(json.dumps({
+        "version": version,
+        "start": str(start),
+        "days": n_days,
+        "months": [label for label, _, _ in months],
+        "month_starts": [first for _, first, _ in months],
+        "stations": n_stations,
+        "occupancy_scale": OCCUPANCY_SCALE
+    }, ensure_ascii=False), encoding="utf-8")
+    shutil.rmtree(path, ignore_errors=True)
+    staging.rename(path)
+    prune_timeseries_stores(path)
+    return path
+
+def prune_timeseries_stores(keep):
+    """`keep` dışındaki tamamlanmış sürüm klasörlerini sil; süren üretimlerin geçici klasörlerine dokunulmaz
+
+    Her yeni temel sürüm ayrı bir klasör açtığından eskiler silinmezse disk
+    kullanımı içe aktarımlarla sınırsız büyür. Açık bellek eşlemeleri
+    silinen dosyalarda da geçerli kalır.
+    """
+    keep = Path(keep)
+    for other in keep.parent.iterdir():
+        if other != keep and other.is_dir() and timeseries_store_exists(other):
+            shutil.rmtree(other, ignore_errors=True)
+
+class TimeSeriesStore:
+    """Bellek eşlemeli seri deposu üzerinde tarih aralığı sorguları
+
+    Tarih aralıkları iki ucu dahil verilir (`None` deponun başı/sonu).
+    `positions` istasyon sütun pozisyonlarıdır (`positions()` ile bulunur;
+    None tüm istasyonlar). Doluluk değerleri kurulu olunan saatler üzerinden
+    ortalamadır.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        manifest = json.loads((self.path / MANIFEST).read_text(encoding="utf-8"))
+        self.version = manifest["version"]
+        self.start = np.datetime64(manifest["start"], "D")
+        self.n_days = manifest["days"]
+        self.months = manifest["months"]
+        self.month_starts = np.asarray(manifest["month_starts"], dtype=np.int64)
+        self.station_ids = np.load(self.path / "stations.npy")
+        self.install_day = np.load(self.path / "install_day.npy")
+        self.daily = {metric: np.load(self.path / f"daily_{metric}.npy", mmap_mode="r") for metric in METRICS}
+        self.prefix = {metric: np.load(self.path / f"prefix_{metric}.npy", mmap_mode="r") for metric in METRICS}
+        self.total = {metric: np.load(self.path / f"total_{metric}.npy") for metric in METRICS}
+        self.hour_profile = np.load(self.path / "hour_profile.npy", mmap_mode="r")
+        self.week_starts = np.flatnonzero(_weekdays(self.start + np.arange(self.n_days)) == 0)
+        self._index = pd.Index(self.station_ids)
+        self._all_active = self._active_prefix(None)
+
+    def __len__(self):
+        return len(self.station_ids)
+
+    @property
+    def first_day(self):
+        return pd.Timestamp(self.start)
+
+    @property
+    def last_day(self):
+        return pd.Timestamp(self.start + self.n_days - 1)
+
+    def positions(self, station_ids):
+        """İstasyon kimliklerinin sütun pozisyonları (depoda olmayanlar -1)"""
+        return self._index.get_indexer(np.asarray(station_ids, dtype=object))
+
+    def day_range(self, start=None, end=None):
+        """İki ucu dahil tarih aralığının [ilk, son + 1) gün indeksleri"""
+        first = 0 if start is None else int((np.datetime64(pd.Timestamp(start).date(), "D") - self.start).astype(np.int64))
+        last = self.n_days - 1 if end is None else int((np.datetime64(pd.Timestamp(end).date(), "D") - self.start).astype(np.int64))
+        return int(np.clip(first, 0, self.n_days)), int(np.clip(last + 1, 0, self.n_days))
+
+    def _active_prefix(self, positions):
+        """Gün başına kurulu istasyon sayısının önek toplamı (aktif istasyon-gün sayımı için)"""
+        install_day = self.install_day if positions is None else self.install_day[positions]
+        active = np.searchsorted(np.sort(install_day), np.arange(self.n_days), side="right")
+        return np.concatenate([[0], np.cumsum(active)])
+
+    def _bounds(self, freq, first, last):
+        if freq == "D":
+            return np.arange(first, last + 1)
+        starts = self.month_starts if freq == "M" else self.week_starts
+        return np.concatenate([[first], starts[(starts > first) & (starts < last)], [last]])
+
+    def _station_totals(self, metric, first, last, positions):
+        if last <= first:
+            return np.zeros(len(self) if positions is None else len(positions))
+        prefix = self.prefix[metric]
+        if positions is None:
+            return prefix[last] - prefix[first]
+        return prefix[last, positions] - prefix[first, positions]
+
+    def _active_hours(self, first, last, positions):
+        install_day = self.install_day if positions is None else self.install_day[positions]
+        return 24.0 * np.clip(last - np.maximum(first, install_day), 0, None)
+
+    def station_totals(self, metric, start=None, end=None, positions=None):
+        """İstasyon başına aralık toplamı (enerji kWh veya doluluk-saat)"""
+        return self._station_totals(metric, *self.day_range(start, end), positions)
+
+    def mean_occupancy(self, start=None, end=None, positions=None):
+        """İstasyon başına aralıktaki ortalama doluluk (kurulu değilse NaN)"""
+        first, last = self.day_range(start, end)
+        hours = self._active_hours(first, last, positions)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(hours > 0, self._station_totals("occupancy", first, last, positions) / hours, np.nan)
+
+    def summary(self, start=None, end=None, positions=None):
+        """Aralığın toplam enerjisi, ortalama doluluğu ve önceki eş uzunluktaki döneme göre enerji değişimi
+
+        Önceki dönem deponun başlangıcından önceye taşıyorsa değişim NaN'dır.
+        """
+        first, last = self.day_range(start, end)
+        energy = self._station_totals("energy", first, last, positions).sum()
+        hours = self._active_hours(first, last, positions).sum()
+        previous_first = 2 * first - last
+        previous = self._station_totals("energy", previous_first, first, positions).sum() if previous_first >= 0 else 0.0
+        return {
+            "enerji_kwh": float(energy),
+            "doluluk": float(self._station_totals("occupancy", first, last, positions).sum() / hours) if hours else np.nan,
+            "degisim": float(energy / previous - 1) if previous > 0 and last > first else np.nan
+        }
+
+    def series(self, metric, freq="D", start=None, end=None, positions=None):
+        """Dönem başına toplam enerji (kWh) veya ortalama doluluk; dönem başı tarihli Series
+
+        `freq`: "D" (günlük), "W" (pazartesi başlangıçlı hafta) veya "M" (ay);
+        aralığın ucundaki yarım dönemler yalnızca aralık içindeki günleri içerir.
+        """
+        first, last = self.day_range(start, end)
+        if last <= first:
+            return pd.Series(dtype=np.float64)
+        bounds = self._bounds(freq, first, last)
+        if positions is None:
+            sums = np.diff(self.total[metric][bounds])
+        elif freq == "D":
+            sums = self.daily[metric][first:last][:, positions].sum(axis=1, dtype=np.float64)
+        else:
+            sums = np.diff(self.prefix[metric][np.ix_(bounds, positions)].sum(axis=1))
+        if metric == "occupancy":
+            active = self._all_active if positions is None else self._active_prefix(positions)
+            sums = sums / np.maximum(24 * np.diff(active[bounds]), 1)
+        return pd.Series(sums, index=pd.DatetimeIndex(self.start + bounds[:-1]))
+
+    def hourly_profile(self, start=None, end=None, positions=None):
+        """Saat başına ortalama doluluk (aralıkla kesişen ayların tamamı üzerinden)"""
+        first, last = self.day_range(start, end)
+        month_first = max(int(np.searchsorted(self.month_starts, first, side="right")) - 1, 0)
+        month_last = int(np.searchsorted(self.month_starts, last, side="left"))
+        block = self.hour_profile[month_first:month_last]
+        sums = block.sum(axis=(0, 2), dtype=np.float64) if positions is None else block[:, :, positions].sum(axis=(0, 2), dtype=np.float64)
+        active = self._all_active if positions is None else self._active_prefix(positions)
+        last_day = self.month_starts[month_last] if month_last < len(self.month_starts) else self.n_days
+        station_days = active[last_day] - active[self.month_starts[month_first]]
+        return pd.Series(sums / max(station_days, 1), index=pd.RangeIndex(24, name="saat"))
+
+    def station_hours(self, station_id, start=None, end=None):
+        """Tek istasyonun saatlik doluluk ve enerji serisi (yalnızca ilgili aylık dosyalar okunur)"""
+        position = int(self.positions([station_id])[0])
+        if position < 0:
+            raise KeyError(station_id)
+        first, last = self.day_range(start, end)
+        frames = []
+        for month, label in enumerate(self.months):
+            month_first = self.month_starts[month]
+            month_last = self.month_starts[month + 1] if month + 1 < len(self.months) else self.n_days
+            if month_last <= first or month_first >= last:
+                continue
+            hours = slice((max(first, month_first) - month_first) * 24, (min(last, month_last) - month_first) * 24)
+            occupancy = np.load(self.path / "hourly" / f"occupancy-{label}.npy", mmap_mode="r")[hours, position]
+            energy = np.load(self.path / "hourly" / f"energy-{label}.npy", mmap_mode="r")[hours, position]
+            frames.append(pd.DataFrame({
+                "zaman": (self.start + max(first, month_first)).astype("datetime64[h]") + np.arange(len(occupancy)),
+                "doluluk": occupancy.astype(np.float32) / OCCUPANCY_SCALE,
+                "enerji_kwh": np.asarray(energy)
+            }))
+        if not frames:
+            return pd.DataFrame(columns=["zaman", "doluluk", "enerji_kwh"])
+        return pd.concat(frames, ignore_index=True)
+
+    def activity(self, stations_df, by, start=None, end=None):
+        """Gruba (ör. operatör) göre aralık enerjisi, ortalama doluluk ve önceki eş döneme göre enerji büyümesi
+
+        Depoda olmayan istasyonlar (ör. sonradan içe aktarılanlar) hesaba katılmaz.
+        """
+        positions = self.positions(stations_df['istasyon_id'])
+        found = positions >= 0
+        positions = positions[found]
+        first, last = self.day_range(start, end)
+        previous_first = first - (last - first)
+        frame = pd.DataFrame({
+            by: stations_df[by].to_numpy()[found],
+            "enerji_kwh": self._station_totals("energy", first, last, positions),
+            "doluluk_saat": self._station_totals("occupancy", first, last, positions),
+            "aktif_saat": self._active_hours(first, last, positions),
+            "onceki_enerji_kwh": self._station_totals("energy", previous_first, first, positions) if previous_first >= 0 else np.nan
+        }).groupby(by, observed=True).sum(min_count=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return pd.DataFrame({
+                "enerji_mwh": frame['enerji_kwh'] / 1000,
+                "doluluk": frame['doluluk_saat'] / frame['aktif_saat'].where(frame['aktif_saat'] > 0),
+                "buyume": frame['enerji_kwh'] / frame['onceki_enerji_kwh'].where(frame['onceki_enerji_kwh'] > 0) - 1
+            })
+
+    def group_series(self, metric, freq, stations_df, by, start=None, end=None):
+        """Grup başına dönem serileri (dönem x grup DataFrame)"""
+        positions = self.positions(stations_df['istasyon_id'])
+        groups = stations_df[by].to_numpy()
+        found = positions >= 0
+        return pd.DataFrame({
+            group: self.series(metric, freq, start, end, positions[found & (groups == group)])
+            for group in pd.unique(groups[found])
+        })
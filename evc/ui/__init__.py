@@ -0,0 +1 @@
+"""Streamlit arayüzü (çekirdek modüller Streamlit'e bağımlı değildir)"""
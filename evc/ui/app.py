@@ -0,0 +1,133 @@
+"""Uygulama giriş noktası: sayfa ayarları, veri yükleme ve kullanıcı modu seçimi"""
+import uuid
+
+import pandas as pd
+import streamlit as st
+
+import evc
+from evc import instrumentation
+from evc.config import DEBUG_PANEL
+from evc.startup import FIRST_RENDER_TIMINGS, first_render, profiling_enabled
+from evc.ui.cache import get_render_cache, load_demographics, load_stations
+
+# Oturumlar paylaşılan çerçevelerden türettikleri dilim ve sütun seçimlerinde tamponları
+# kopyalamadan kullanır; yazma anında kopyalanır (pandas 3'te her zaman açıktır)
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+PAGE_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        color: #1f77b4;
+        text-align: center;
+        margin-bottom: 2rem;
+    }
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #1f77b4;
+    }
+    .success-card {
+        background-color: #d4edda;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #28a745;
+    }
+    .warning-card {
+        background-color: #fff3cd;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #ffc107;
+    }
+    .danger-card {
+        background-color: #f8d7da;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #dc3545;
+    }
+</style>
+"""
+
+def main():
+    # Sayfa konfigürasyonu
+    st.set_page_config(
+        page_title="Elektrikli Şarj İstasyonu Analiz Sistemi",
+        page_icon="⚡",
+        layout="wide",
+        initial_sidebar_state="expanded"
+    )
+
+    # Her çalıştırma aşama aşama ölçülür (ölçüm kapalıysa etkisizdir)
+    session = st.session_state.setdefault("instrumentation_session", uuid.uuid4().hex[:8])
+    with instrumentation.rerun(session):
+        # CSS stilleri
+        st.markdown(PAGE_CSS, unsafe_allow_html=True)
+
+        st.markdown('<h1 class="main-header">⚡ Elektrikli Şarj İstasyonu Analiz Sistemi</h1>', unsafe_allow_html=True)
+
+        # Veri yükleme
+        with first_render("Veri yükleme"), instrumentation.span("data_load"):
+            stations_df = load_stations()
+            demographic_df = load_demographics()
+
+        # Sidebar - Kullanıcı tipi seçimi
+        st.sidebar.title("🎯 Kullanıcı Modu")
+        user_type = st.sidebar.selectbox(
+            "Lütfen kullanıcı tipinizi seçin:",
+            ["Genel Kullanıcı", "Yatırımcı"]
+        )
+
+        # Arayüz modülleri yalnızca seçildiklerinde yüklenir
+        with first_render(user_type), instrumentation.span("general" if user_type == "Genel Kullanıcı" else "investor"):
+            if user_type == "Genel Kullanıcı":
+                from evc.ui.general import show_general_user_interface
+                show_general_user_interface(stations_df, demographic_df)
+            else:
+                from evc.ui.investor import show_investor_interface
+                show_investor_interface(stations_df, demographic_df)
+
+    if profiling_enabled():
+        show_startup_profile()
+
+    if DEBUG_PANEL:
+        show_debug_panel()
+
+def show_startup_profile():
+    """Alt sistem yükleme ve ilk çizim sürelerini kenar çubuğunda göster"""
+    with st.sidebar.expander("⏱️ Başlangıç Ölçümleri", expanded=True):
+        st.markdown("**Alt sistem yükleme (ilk erişim):**")
+        for name, seconds in sorted(evc.IMPORT_TIMINGS.items(), key=lambda item: -item[1]):
+            st.write(f"• evc.{name}: {seconds * 1000:.0f} ms")
+        st.markdown("**İlk çizim:**")
+        for name, seconds in FIRST_RENDER_TIMINGS.items():
+            st.write(f"• {name}: {seconds * 1000:.0f} ms")
+
+def show_debug_panel():
+    """Son çalıştırmanın aşama süreleri ve bellek değişimleri; izleme çıktıları"""
+    record = instrumentation.last_rerun()
+    if record is None:
+        return
+    with st.sidebar.expander("🐞 Performans Ölçümleri", expanded=False):
+        st.metric("Son çalıştırma", f"{record['seconds'] * 1000:.0f} ms", f"RSS {record['rss_delta_bytes'] / 2 ** 20:+.1f} MB", delta_color="off")
+        spans = pd.DataFrame(record['spans'])
+        if not spans.empty:
+            st.dataframe(
+                pd.DataFrame({
+                    "Aşama": ["\u2003" * depth + path.rsplit("/", 1)[-1] for path, depth in zip(spans['span'], spans['depth'])],
+                    "ms": (spans['seconds'] * 1000).round(1),
+                    "RSS Δ (MB)": (spans['rss_delta_bytes'] / 2 ** 20).round(1)
+                }),
+                hide_index=True,
+                use_container_width=True
+            )
+        st.caption(f"Süreçte {instrumentation.RERUN_TOTALS['count']} çalıştırma ölçüldü")
+        render_stats = get_render_cache().stats()
+        st.caption(
+            f"Çizim önbelleği: {render_stats['entries']} girdi, {render_stats['bytes'] / 2 ** 20:.1f} / "
+            f"{render_stats['max_bytes'] / 2 ** 20:.0f} MB, isabet %{render_stats['hit_rate'] * 100:.0f} "
+            f"({render_stats['hits']} isabet, {render_stats['misses']} ıska, {render_stats['evictions']} atılan)"
+        )
+        st.download_button("Prometheus metinleri", instrumentation.to_prometheus(), "evc-metrics.prom", "text/plain")
+        st.download_button("JSON satırları", instrumentation.to_jsonl(), "evc-spans.jsonl", "application/x-ndjson")
@@ -0,0 +1,197 @@
+"""Streamlit önbellek sarmalayıcıları
+
+Alt çizgiyle başlayan parametreler Streamlit tarafından hash'lenmez; önbellek
+anahtarı olarak veri sürümü kullanılır. `st.cache_data` her çağrıda sonucun
+yeni bir kopyasını döndürür; veri setleri ve büyük türetilmiş sonuçlar bu
+yüzden `st.cache_resource` ile süreç başına bir kez tutulur, tüm oturumlara
+aynı nesne verilir ve diziler salt okunur işaretlenir.
+"""
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+import streamlit as st
+
+import evc
+
+DEMAND_MODEL_WAIT_SECONDS = 2  # Kayıtlı modelin diskten yüklenmesi için beklenen süre; eğitim beklenmez
+
+def _read_only(array):
+    """Paylaşılan diziyi salt okunur işaretle (yerinde değişiklik hata verir)"""
+    array.setflags(write=False)
+    return array
+
+@st.cache_resource
+def get_station_dataset():
+    """Tüm oturumların paylaştığı istasyon veri seti; depo yoksa bir kez üretip yaz"""
+    evc.store.ensure_station_store()
+    return evc.store.StationDataset()
+
+def load_stations():
+    """Güncel istasyon çerçevesi; içe aktarılan değişiklikler her çalıştırmada artımlı uygulanır
+
+    Çerçeve oturumlar arasında paylaşılır ve yerinde değiştirilmemelidir.
+    """
+    return get_station_dataset().refresh()
+
+@st.cache_resource(max_entries=2)
+def _shared_demographics(version):
+    return evc.store.load_demographic_store()
+
+def load_demographics():
+    """Tüm oturumların paylaştığı demografik çerçeve; depo yoksa bir kez üretip yaz
+
+    Dosya yeniden yazılırsa (değişiklik zamanı/boyutu) yeniden okunur. Çerçeve
+    yerinde değiştirilmemelidir.
+    """
+    evc.store.ensure_demographic_store()
+    return _shared_demographics(evc.store.demographic_store_version())
+
+@st.cache_resource(max_entries=2)
+def _build_station_index(version, _stations_df):
+    return evc.spatial.GeoIndex(_stations_df['lat'].to_numpy(), _stations_df['lng'].to_numpy())
+
+@st.cache_resource(max_entries=2)
+def _build_filter_index(version, _stations_df):
+    return evc.filters.StationFilterIndex(_stations_df)
+
+@st.cache_resource(max_entries=2)
+def _build_station_aggregates(version, _stations_df):
+    return evc.aggregates.StationAggregates(_stations_df)
+
+def get_station_index(version, _stations_df):
+    """İstasyon koordinatları için uzamsal indeks (paylaşılan veri setininki; sürüm eskiyse ayrıca kurulur)"""
+    station_index = get_station_dataset().station_index(version)
+    return station_index if station_index is not None else _build_station_index(version, _stations_df)
+
+def get_filter_index(version, _stations_df):
+    """Filtre bitmap indeksi (paylaşılan veri setinde artımlı güncellenir; sürüm eskiyse ayrıca kurulur)"""
+    filter_index = get_station_dataset().filter_index(version)
+    return filter_index if filter_index is not None else _build_filter_index(version, _stations_df)
+
+def get_station_aggregates(version, _stations_df):
+    """Operatör/şehir özetleri (paylaşılan veri setinde artımlı güncellenir; sürüm eskiyse ayrıca kurulur)"""
+    aggregates = get_station_dataset().aggregates(version)
+    return aggregates if aggregates is not None else _build_station_aggregates(version, _stations_df)
+
+def _demand_model_job(version, _stations_df, _demographic_df):
+    """Temel veri sürümü başına talep modeli işi (süreçte analiz servisiyle paylaşılır)"""
+    return evc.forecasting.demand_model_job(version, _stations_df, _demographic_df)
+
+def get_demand_model(version, _stations_df, _demographic_df):
+    """Temel veri sürümü başına talep modeli; eğitim sürüyorsa veya eğitilemezse None
+
+    Diskte kayıtlı model kısa bir beklemeyle yüklenir. Yoksa eğitim arka planda
+    yürür ve çalıştırmayı bekletmez; model hazır olunca sonraki etkileşimlerde kullanılır.
+    """
+    try:
+        return _demand_model_job(version, _stations_df, _demographic_df).result(timeout=DEMAND_MODEL_WAIT_SECONDS)
+    except FutureTimeoutError:
+        return None
+
+def demand_model_training(version, _stations_df, _demographic_df):
+    """Talep modelinin eğitimi arka planda sürüyor mu"""
+    return not _demand_model_job(version, _stations_df, _demographic_df).done()
+
+@st.cache_resource(max_entries=4)
+def compute_potential_heatmap(version, resolution_deg, model_version, _stations_df, demographic_df, _demand_model):
+    """Türkiye geneli potansiyel ısı haritası noktalarını ([enlem, boylam, ağırlık]) hesapla
+
+    `model_version`: kullanılan talep modelinin sürümü (model yoksa None); model
+    hazır olduğunda harita yeniden hesaplansın diye anahtara girer.
+    """
+    station_index = get_station_index(version, _stations_df)
+    return evc.scoring.potential_heatmap_points(resolution_deg, _stations_df, demographic_df, station_index, _demand_model)
+
+@st.cache_resource(max_entries=32)
+def compute_hex_aggregates(version, size_km, filter_key, _stations_df):
+    """Altıgen özetlerini veri sürümü, çözünürlük ve filtre kümesi başına önbelleğe al (paylaşılan, yerinde değiştirilmemeli)"""
+    return evc.hexgrid.aggregate_hex(_stations_df, size_km)
+
+@st.cache_resource(max_entries=8)
+def compute_sensitivity_grid(axes_key, years=5):
+    """ROI duyarlılık ızgarasını eksen aralıkları başına bir kez hesapla (paylaşılan, salt okunur)
+
+    `axes_key`: (parametre, değerler demeti) çiftlerinden oluşan demet.
+    """
+    return _read_only(evc.roi.sensitivity_grid({name: list(values) for name, values in axes_key}, years))
+
+@st.cache_data(max_entries=16)
+def compute_socket_sweep(station_type, arrivals_per_day, session_energy_kwh, patience_minutes, price_per_kwh, monthly_cost, years=5):
+    """2-12 soket için kuyruk simülasyonu ve ROI (ROI senaryosuyla aynı tohum, aynı gelişler)"""
+    return evc.analytics.socket_sweep_roi(
+        station_type, range(2, 13), arrivals_per_day, price_per_kwh, monthly_cost, years,
+        session_energy_kwh=session_energy_kwh, patience_minutes=patience_minutes, seed=42
+    )
+
+@st.cache_resource(max_entries=2)
+def get_demand_points(demographic_df):
+    """Çoklu lokasyon planının talep hücreleri (paylaşılan, yerinde değiştirilmemeli)"""
+    return evc.placement.demand_points(demographic_df)
+
+@st.cache_data(max_entries=16)
+def compute_site_plan(version, n_sites, coverage_km, candidate_resolution_deg, _stations_df, demographic_df):
+    """Çoklu lokasyon planını veri sürümü ve plan parametreleri başına önbelleğe al"""
+    demand_df = get_demand_points(demographic_df)
+    candidate_lat, candidate_lng = evc.scoring.candidate_grid(candidate_resolution_deg)
+    return evc.placement.select_sites(
+        n_sites, demand_df, candidate_lat=candidate_lat, candidate_lng=candidate_lng,
+        coverage_km=coverage_km, station_index=get_station_index(version, _stations_df)
+    )
+
+@st.cache_resource
+def get_segment_model(kind, version, n_segments, _stations_df):
+    """Segment modelini veri sürümü başına diskten yükle; yoksa akış halinde eğitip kaydet
+
+    İstasyon modeli, depo aynı sürümdeyse doğrudan depodan parça parça okunarak eğitilir.
+    Çağıranlar sürüm olarak `base_version` verir; içe aktarma günlüğündeki küçük
+    değişiklikler modeli yeniden eğittirmez.
+    """
+    segmentation = evc.segmentation
+    if kind == "stations":
+        features = segmentation.STATION_SEGMENT_FEATURES
+        if evc.data.base_version(evc.store.station_store_version() or "") == version:
+            batch_source = lambda: evc.store.iter_station_batches(columns=features, batch_rows=segmentation.SEGMENT_BATCH_ROWS)
+        else:
+            batch_source = lambda: segmentation.iter_frame_batches(_stations_df)
+    else:
+        features = segmentation.CELL_SEGMENT_FEATURES
+        cells = segmentation.cell_features(_stations_df)
+        batch_source = lambda: iter([cells])
+    return segmentation.load_or_fit_model(kind, version, features, batch_source, n_segments)
+
+@st.cache_resource(max_entries=2)
+def compute_station_segments(version, n_segments, _stations_df):
+    """İstasyon başına segment numaraları (paylaşılan, salt okunur)"""
+    model = get_segment_model("stations", evc.data.base_version(version), n_segments, _stations_df)
+    return _read_only(model.predict_batches(evc.segmentation.iter_frame_batches(_stations_df)))
+
+@st.cache_resource(max_entries=2)
+def compute_cell_segments(version, n_segments, _stations_df):
+    """Segment numarası atanmış altıgen aday hücreleri (paylaşılan, yerinde değiştirilmemeli)"""
+    model = get_segment_model("candidate-cells", evc.data.base_version(version), n_segments, _stations_df)
+    cells = evc.segmentation.cell_features(_stations_df)
+    cells['segment'] = model.predict(cells)
+    return cells
+
+@st.cache_resource(max_entries=2)
+def get_timeseries_store(version, _stations_df):
+    """Saatlik kullanım serilerini temel veri sürümü başına bir kez aç; depo yoksa üret
+
+    Çok büyük ağlarda (TIMESERIES_MAX_STATIONS üstü) seriler üretilmez ve None döner.
+    """
+    timeseries = evc.timeseries
+    path = timeseries.timeseries_store_path(version)
+    if not timeseries.timeseries_store_exists(path):
+        if len(_stations_df) > evc.config.TIMESERIES_MAX_STATIONS:
+            return None
+        timeseries.build_timeseries_store(_stations_df, path, version=version)
+    return timeseries.TimeSeriesStore(path)
+
+@st.cache_resource
+def get_report_service():
+    """Tüm oturumların paylaştığı arka plan rapor servisi (havuz + rapor önbelleği)"""
+    return evc.reporting.ReportService()
+
+@st.cache_resource
+def get_render_cache():
+    """Tüm oturumların paylaştığı çizim önbelleği (harita katmanları ve grafikler)"""
+    return evc.render_cache.RenderCache()
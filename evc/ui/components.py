@@ -0,0 +1,95 @@
+"""Arayüzde ortak kullanılan harita bileşenleri"""
+import pandas as pd
+import streamlit as st
+
+import evc
+from evc.ui.cache import get_render_cache
+
+def get_map_view(key):
+    """Haritanın son bilinen görünümünü (merkez, zoom, sınırlar) döndür"""
+    return st.session_state.get(f"{key}_view", {"center": evc.maps.MAP_CENTER, "zoom": evc.maps.MAP_ZOOM, "bounds": None})
+
+def update_map_view(key, map_data, n_stations, mode, plan, hex_size=None):
+    """Harita görünümünü kaydet; çizim planı değiştiyse sayfayı yeniden çalıştır
+
+    `hex_size` verilirse (otomatik altıgen çözünürlüğü) yeni zoom farklı bir
+    çözünürlük gerektirdiğinde de yeniden çalıştırılır.
+    """
+    if not map_data or not map_data.get('zoom'):
+        return
+    bounds = map_data.get('bounds') or {}
+    south_west, north_east = bounds.get('_southWest') or {}, bounds.get('_northEast') or {}
+    if None in (south_west.get('lat'), south_west.get('lng'), north_east.get('lat'), north_east.get('lng')):
+        view_bounds = None
+    else:
+        view_bounds = (south_west['lat'], south_west['lng'], north_east['lat'], north_east['lng'])
+    center = map_data.get('center') or {}
+    view = {
+        "center": [center.get('lat', evc.maps.MAP_CENTER[0]), center.get('lng', evc.maps.MAP_CENTER[1])],
+        "zoom": map_data['zoom'],
+        "bounds": view_bounds
+    }
+    st.session_state[f"{key}_view"] = view
+
+    new_plan = evc.maps.plan_station_layer(n_stations, mode, view)
+    if hex_size is not None and evc.hexgrid.hex_size_for_zoom(view["zoom"]) != hex_size:
+        st.rerun()
+    if new_plan[0] != plan[0]:
+        st.rerun()
+    if plan[0] == "aggregate" and new_plan[1] != plan[1]:
+        st.rerun()
+    if plan[0] == "viewport" and view_bounds is not None:
+        south, west, north, east = plan[1]
+        if view_bounds[0] < south or view_bounds[1] < west or view_bounds[2] > north or view_bounds[3] > east:
+            st.rerun()
+
+def hex_layer_controls(key):
+    """Altıgen katman seçeneklerini göster; (açık mı, metrik, çözünürlük seçimi) döndür"""
+    enabled = st.checkbox("Altıgen yoğunluk katmanı", False, key=f"{key}_hex")
+    if not enabled:
+        return False, None, None
+    col1, col2 = st.columns(2)
+    with col1:
+        metric = st.selectbox("Katman metriği:", list(evc.maps.HEX_METRICS), key=f"{key}_hex_metric")
+    with col2:
+        resolution = st.selectbox(
+            "Altıgen boyutu:", ["Otomatik"] + [f"{size} km" for size in evc.hexgrid.HEX_SIZES_KM], key=f"{key}_hex_size"
+        )
+    return True, metric, resolution
+
+def resolve_hex_size(view, resolution):
+    """Altıgen boyutu seçimini km'ye çevir; (boyut, otomatikse boyut yoksa None) döndür"""
+    if resolution == "Otomatik":
+        hex_size = evc.hexgrid.hex_size_for_zoom(view['zoom'])
+        return hex_size, hex_size
+    return int(resolution.split()[0]), None
+
+def period_selector(store, key, default_days=365):
+    """Seri deposunun kapsadığı günler içinde tarih aralığı seçimi; (başlangıç, bitiş) günleri döndür
+
+    Kullanıcı aralığın yalnızca ilk gününü seçmişken varsayılan aralık kullanılır.
+    """
+    first, last = store.first_day.date(), store.last_day.date()
+    default = (max(first, last - pd.Timedelta(days=default_days - 1)), last)
+    selected = st.date_input("Dönem:", value=default, min_value=first, max_value=last, key=f"{key}_period")
+    if not isinstance(selected, (tuple, list)) or len(selected) != 2:
+        return default
+    return tuple(selected)
+
+def cached_layer(m, key_parts, view, build):
+    """`build(m)` katmanını çizim önbelleğinden ekle; katmanın dönüş değerini (ör. açıklama) döndür
+
+    `key_parts` katmanı belirleyen her şeyi (veri sürümü, filtre durumu, çizim
+    planı...) içermelidir; isabette katman yeniden şablonlanmaz.
+    """
+    key = evc.render_cache.render_key("layer", *key_parts)
+    frozen = get_render_cache().get_or_render(key, lambda: evc.maps.freeze_layer(build, view))
+    return evc.maps.add_frozen_layer(m, frozen)
+
+def cached_figure(key_parts, build):
+    """`build()` ile üretilen Plotly grafiğini JSON olarak önbelleğe al ve grafiği döndür"""
+    import plotly.io as pio
+
+    key = evc.render_cache.render_key("figure", *key_parts)
+    payload = get_render_cache().get_or_render(key, lambda: pio.to_json(build(), validate=False))
+    return pio.from_json(payload, skip_invalid=True)
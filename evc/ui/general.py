@@ -0,0 +1,217 @@
+"""Genel kullanıcı arayüzü"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit_folium import st_folium
+
+import evc
+from evc.instrumentation import span, timed
+from evc.ui.cache import compute_hex_aggregates, get_filter_index, get_station_aggregates, get_timeseries_store
+from evc.ui.components import (
+    cached_figure, cached_layer, get_map_view, hex_layer_controls, period_selector, resolve_hex_size, update_map_view
+)
+
+def show_general_user_interface(stations_df, demographic_df):
+    """Genel kullanıcı arayüzü"""
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 📊 Genel Kullanıcı Özellikleri")
+
+    tab1, tab2, tab3 = st.tabs(["🗺️ Şarj İstasyonu Haritası", "📈 İstatistikler", "👥 Demografik Analiz"])
+
+    with tab1:
+        show_station_map(stations_df)
+
+    with tab2:
+        show_station_statistics(stations_df)
+
+    with tab3:
+        show_demographic_analysis(demographic_df)
+
+@timed()
+def show_station_map(stations_df):
+    """Filtrelenebilir istasyon haritası"""
+    st.header("🗺️ Türkiye Şarj İstasyonu Haritası")
+
+    # Filtreler
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        selected_cities = st.multiselect(
+            "Şehir Seçin:",
+            options=stations_df['sehir'].unique(),
+            default=stations_df['sehir'].unique()[:3]
+        )
+
+    with col2:
+        selected_operators = st.multiselect(
+            "Operatör Seçin:",
+            options=stations_df['operatör'].unique(),
+            default=stations_df['operatör'].unique()
+        )
+
+    with col3:
+        power_range = st.slider(
+            "Güç Aralığı (kW):",
+            min_value=int(stations_df['güç_kw'].min()),
+            max_value=int(stations_df['güç_kw'].max()),
+            value=(int(stations_df['güç_kw'].min()), int(stations_df['güç_kw'].max()))
+        )
+
+    # Filtreleme (bitmap indeksleriyle, yalnızca eşleşen satırlar seçilir)
+    with span("filter"):
+        version = evc.data.dataset_version(stations_df)
+        filter_index = get_filter_index(version, stations_df)
+        positions = filter_index.query(selected_cities, selected_operators, power_range)
+        filtered_stations = stations_df.iloc[positions]
+        filter_key = (tuple(sorted(selected_cities)), tuple(sorted(selected_operators)), tuple(power_range))
+
+    render_mode = st.radio("Harita görünümü:", evc.maps.MAP_RENDER_MODES, horizontal=True)
+    show_hex, hex_metric, hex_resolution = hex_layer_controls("station_map")
+
+    # Harita oluştur (büyük veri setlerinde zoom seviyesine göre özet veya görünüm bazlı çizim)
+    with span("map_build"):
+        view = get_map_view("station_map")
+        plan = evc.maps.plan_station_layer(len(filtered_stations), render_mode, view)
+        m = evc.maps.base_map(view)
+
+        # Altıgen koroplet katmanı (çözünürlük ve filtre kümesi başına önbellekli)
+        auto_hex_size = None
+        if show_hex:
+            hex_size, auto_hex_size = resolve_hex_size(view, hex_resolution)
+            hex_cells_df = compute_hex_aggregates(version, hex_size, filter_key, filtered_stations)
+            evc.maps.add_hex_layer(m, hex_cells_df, hex_size, hex_metric)
+
+        # İstasyon katmanı filtre ve çizim planı değişmedikçe önbellekten eklenir
+        st.caption(cached_layer(
+            m, (version, filter_key, plan, "icon"), view,
+            lambda layer_map: evc.maps.add_station_layer(layer_map, filtered_stations, plan, marker_style="icon")
+        ))
+
+    with span("st_folium"):
+        map_data = st_folium(m, width=700, height=500, key="station_map")
+    update_map_view("station_map", map_data, len(filtered_stations), render_mode, plan, auto_hex_size)
+
+    # İstatistikler
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Toplam İstasyon", len(filtered_stations))
+    with col2:
+        st.metric("Toplam Soket", filtered_stations['soket_sayisi'].sum())
+    with col3:
+        st.metric("Ortalama Güç", f"{filtered_stations['güç_kw'].mean():.0f} kW")
+    with col4:
+        st.metric("Ortalama Kullanım", f"%{filtered_stations['kullanim_orani'].mean():.0%}")
+
+@timed()
+def show_station_statistics(stations_df):
+    """Operatör, güç, şehir ve kullanım dağılımları; saatlik serilerden dönem eğilimleri"""
+    st.header("📈 Şarj İstasyonu İstatistikleri")
+
+    # Grafikler veri sürümü (ve seçili dönem) başına bir kez üretilir
+    version = evc.data.dataset_version(stations_df)
+    aggregates = get_station_aggregates(version, stations_df)
+    store = get_timeseries_store(evc.data.base_version(version), stations_df)
+    period = period_selector(store, "statistics") if store is not None else None
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Operatör dağılımı
+        fig_operators = cached_figure(
+            (version, "operator_pie"),
+            lambda: evc.charts.distribution_pie(aggregates.counts('operatör'), "Operatör Dağılımı")
+        )
+        st.plotly_chart(fig_operators, use_container_width=True)
+
+        # Güç dağılımı
+        st.plotly_chart(cached_figure((version, "power_histogram"), lambda: evc.charts.power_histogram(stations_df)), use_container_width=True)
+
+    with col2:
+        # Şehir bazında istasyon sayısı
+        fig_cities = cached_figure(
+            (version, "city_station_bar"), lambda: evc.charts.city_station_bar(aggregates.counts('sehir'))
+        )
+        st.plotly_chart(fig_cities, use_container_width=True)
+
+        # Kullanım dağılımı: seri deposu varsa seçili dönemdeki ortalama doluluk
+        if store is None:
+            st.plotly_chart(cached_figure((version, "usage_histogram"), lambda: evc.charts.usage_histogram(stations_df)), use_container_width=True)
+        else:
+            fig_occupancy = cached_figure(
+                (version, "occupancy_histogram", period),
+                lambda: evc.charts.occupancy_histogram(store.mean_occupancy(*period, store.positions(stations_df['istasyon_id'])))
+            )
+            st.plotly_chart(fig_occupancy, use_container_width=True)
+
+    if store is not None:
+        show_usage_trends(stations_df, store, version, period)
+
+@timed()
+def show_usage_trends(stations_df, store, version, period):
+    """Seçili dönemde enerji, doluluk, yoğun saatler ve önceki eş döneme göre değişim"""
+    st.subheader("⏱️ Kullanım Eğilimleri")
+    frequency = st.radio("Dönem aralığı:", list(evc.timeseries.FREQUENCY_LABELS), index=1, horizontal=True, key="statistics_frequency")
+    freq = evc.timeseries.FREQUENCY_LABELS[frequency]
+
+    energy = store.series("energy", freq, *period)
+    occupancy = store.series("occupancy", freq, *period)
+    profile = store.hourly_profile(*period)
+    summary = store.summary(*period)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Toplam Enerji", f"{summary['enerji_kwh'] / 1000:,.0f} MWh")
+    with col2:
+        st.metric("Ortalama Doluluk", f"%{summary['doluluk'] * 100:.1f}")
+    with col3:
+        st.metric("En Yoğun Saat", f"{int(profile.idxmax()):02d}:00")
+    with col4:
+        st.metric("Önceki Eş Döneme Göre", "-" if np.isnan(summary['degisim']) else f"%{summary['degisim'] * 100:+.1f}")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_trend = cached_figure((version, "utilization_trend", period, freq), lambda: evc.charts.utilization_trend(energy, occupancy))
+        st.plotly_chart(fig_trend, use_container_width=True)
+    with col2:
+        st.plotly_chart(cached_figure((version, "hourly_profile", period), lambda: evc.charts.hourly_profile_bar(profile)), use_container_width=True)
+
+@timed()
+def show_demographic_analysis(demographic_df):
+    """Şehir bazında demografik veriler"""
+    st.header("👥 Demografik Analiz")
+
+    # Demografik veriler tablosu
+    st.subheader("Şehir Bazında Demografik Veriler")
+
+    # Verileri formatla
+    # Sığ kopya: biçimlenen sütunlar yenileriyle değiştirilir, paylaşılan çerçeve kopyalanmaz
+    demo_display = demographic_df.copy(deep=False)
+    demo_display['nufus'] = demo_display['nufus'].apply(lambda x: f"{x:,}")
+    demo_display['ortalama_gelir'] = demo_display['ortalama_gelir'].apply(lambda x: f"₺{x:,}")
+    demo_display['ev_sayisi'] = demo_display['ev_sayisi'].apply(lambda x: f"{x:,}")
+    demo_display['trafik_yogunlugu'] = demo_display['trafik_yogunlugu'].apply(lambda x: f"%{x:.0%}")
+    demo_display['elektrikli_arac_orani'] = demo_display['elektrikli_arac_orani'].apply(lambda x: f"%{x:.1%}")
+    demo_display['potansiyel_puan'] = demo_display['potansiyel_puan'].apply(lambda x: f"{x:.1f}/10")
+
+    st.dataframe(
+        demo_display,
+        column_config={
+            "sehir": "Şehir",
+            "nufus": "Nüfus",
+            "ortalama_gelir": "Ortalama Gelir",
+            "ev_sayisi": "Ev Sayısı",
+            "trafik_yogunlugu": "Trafik Yoğunluğu",
+            "elektrikli_arac_orani": "EV Oranı",
+            "potansiyel_puan": "Potansiyel Puanı"
+        },
+        use_container_width=True
+    )
+
+    # Görselleştirmeler
+    col1, col2 = st.columns(2)
+
+    # Demografik tablo küçüktür; anahtar olarak içeriğin tamamının özeti kullanılır
+    version = int(pd.util.hash_pandas_object(demographic_df).sum())
+    with col1:
+        st.plotly_chart(cached_figure((version, "income_vs_ev"), lambda: evc.charts.income_vs_ev_scatter(demographic_df)), use_container_width=True)
+
+    with col2:
+        st.plotly_chart(cached_figure((version, "city_potential"), lambda: evc.charts.city_potential_bar(demographic_df)), use_container_width=True)
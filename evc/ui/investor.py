@@ -0,0 +1,772 @@
+"""Yatırımcı arayüzü"""
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit_folium import st_folium
+
+import evc
+from evc.config import HEATMAP_RESOLUTION_DEG, NEARBY_RADIUS_KM
+from evc.instrumentation import span, timed
+from evc.ui.cache import (
+    compute_cell_segments, compute_hex_aggregates, compute_potential_heatmap, compute_sensitivity_grid, compute_site_plan,
+    compute_socket_sweep, compute_station_segments, demand_model_training, get_demand_model, get_demand_points, get_report_service,
+    get_station_aggregates, get_station_index, get_timeseries_store
+)
+from evc.ui.components import (
+    cached_figure, cached_layer, get_map_view, hex_layer_controls, period_selector, resolve_hex_size, update_map_view
+)
+
+CANDIDATE_GRIDS = {"~1 km (0.01°)": 0.01, "~2 km (0.02°)": 0.02, "~5 km (0.05°)": 0.05}
+
+def show_investor_interface(stations_df, demographic_df):
+    """Yatırımcı arayüzü"""
+    st.sidebar.markdown("---")
+    st.sidebar.markdown("### 💼 Yatırımcı Özellikleri")
+
+    tab1, tab2, tab3, tab4, tab5 = st.tabs(
+        ["🎯 Bölge Analizi", "🧭 Çoklu Lokasyon Planı", "🏆 Rakip Analizi", "💰 Yatırım Getirisi", "📋 Rapor Oluştur"]
+    )
+
+    with tab1:
+        show_location_analysis(stations_df, demographic_df)
+
+    with tab2:
+        show_site_planner(stations_df, demographic_df)
+
+    with tab3:
+        show_competitor_analysis(stations_df)
+
+    with tab4:
+        show_roi_calculator()
+
+    with tab5:
+        show_report_builder(stations_df, demographic_df)
+
+@timed()
+def show_location_analysis(stations_df, demographic_df):
+    """Harita üzerinde seçilen konumun potansiyel analizi"""
+    st.header("🎯 Lokasyon Analizi")
+
+    version = evc.data.dataset_version(stations_df)
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("Harita Üzerinde Konum Seçin")
+
+        show_heatmap = st.checkbox("Türkiye geneli potansiyel ısı haritasını göster", False)
+        show_segments = st.checkbox("Bölge segmentleri katmanı (K-Means)", False)
+        show_hex, hex_metric, hex_resolution = hex_layer_controls("location_map")
+
+        # Harita oluştur
+        with span("map_build"):
+            view = get_map_view("location_map")
+            plan = evc.maps.plan_station_layer(len(stations_df), "Otomatik", view)
+            m = evc.maps.base_map(view)
+
+            auto_hex_size = None
+            if show_hex:
+                hex_size, auto_hex_size = resolve_hex_size(view, hex_resolution)
+                hex_cells_df = compute_hex_aggregates(version, hex_size, (), stations_df)
+                evc.maps.add_hex_layer(m, hex_cells_df, hex_size, hex_metric)
+
+            # Önceden hesaplanmış potansiyel ısı haritası katmanı
+            if show_heatmap:
+                demand_model = get_demand_model(evc.data.base_version(version), stations_df, demographic_df)
+                heat_points = compute_potential_heatmap(
+                    version, HEATMAP_RESOLUTION_DEG, getattr(demand_model, "version", None), stations_df, demographic_df,
+                    demand_model
+                )
+                evc.maps.add_heatmap_layer(m, heat_points)
+                if demand_model is None and demand_model_training(evc.data.base_version(version), stations_df, demographic_df):
+                    st.caption("Talep modeli arka planda eğitiliyor; ısı haritası şimdilik demografik potansiyelle gösteriliyor.")
+
+            # Bölge segmentleri (kayıtlı model varsa yeniden eğitilmez)
+            if show_segments:
+                segment_cells = compute_cell_segments(version, evc.segmentation.SEGMENT_COUNT, stations_df)
+                evc.maps.add_segment_layer(m, segment_cells, evc.segmentation.SEGMENT_CELL_KM)
+
+            # Mevcut istasyonları ekle (çizim planı değişmedikçe önbellekten)
+            layer_caption = cached_layer(
+                m, (version, plan, "circle"), view,
+                lambda layer_map: evc.maps.add_station_layer(layer_map, stations_df, plan, marker_style="circle")
+            )
+
+        # Kullanıcının seçeceği nokta için tıklama eventi
+        with span("st_folium"):
+            map_data = st_folium(m, width=700, height=500, key="location_map")
+        st.caption(layer_caption)
+        update_map_view("location_map", map_data, len(stations_df), "Otomatik", plan, auto_hex_size)
+
+        selected_location = None
+        if map_data['last_object_clicked_popup']:
+            st.info("Mevcut bir istasyonu seçtiniz. Yeni bir nokta seçmek için haritada boş bir alana tıklayın.")
+        elif map_data['last_clicked']:
+            selected_location = map_data['last_clicked']
+            st.success(f"Seçilen konum: {selected_location['lat']:.4f}, {selected_location['lng']:.4f}")
+
+        if show_segments:
+            show_segment_profiles(stations_df, segment_cells, version)
+
+    with col2:
+        st.subheader("Analiz Sonuçları")
+
+        if selected_location:
+            lat, lng = selected_location['lat'], selected_location['lng']
+            with span("analyze_location"):
+                station_index = get_station_index(version, stations_df)
+                demand_model = get_demand_model(evc.data.base_version(version), stations_df, demographic_df)
+                analysis = evc.scoring.analyze_location(lat, lng, stations_df, demographic_df, station_index, demand_model)
+            show_location_result(analysis, demand_model)
+            if demand_model is None and demand_model_training(evc.data.base_version(version), stations_df, demographic_df):
+                st.caption("Talep modeli arka planda eğitiliyor; puan şimdilik demografik potansiyelle hesaplandı.")
+        else:
+            st.info("Analiz için harita üzerinde bir konum seçin.")
+
+def show_segment_profiles(stations_df, segment_cells, version):
+    """Bölge (hücre) ve istasyon segmentlerinin profilleri"""
+    labels = {
+        "adet": "Adet",
+        "lat": "Enlem",
+        "lng": "Boylam",
+        "istasyon_sayisi": "İstasyon",
+        "ort_guc_kw": "Ort. Güç (kW)",
+        "ort_kullanim": "Ort. Kullanım",
+        "toplam_gunluk_gelir": "Günlük Gelir (₺)",
+        "güç_kw": "Güç (kW)",
+        "kullanim_orani": "Kullanım",
+        "gunluk_gelir": "Günlük Gelir (₺)"
+    }
+    with st.expander("📊 Segment profilleri"):
+        st.markdown("**Bölge segmentleri (altıgen hücreler):**")
+        cell_summary = evc.segmentation.segment_summary(
+            segment_cells, segment_cells['segment'].to_numpy(), evc.segmentation.CELL_SEGMENT_FEATURES
+        )
+        cell_summary.index = [f"Segment {segment + 1}" for segment in cell_summary.index]
+        st.dataframe(cell_summary.round(2).rename(columns=labels), use_container_width=True)
+
+        st.markdown("**İstasyon segmentleri:**")
+        station_labels = compute_station_segments(version, evc.segmentation.SEGMENT_COUNT, stations_df)
+        station_summary = evc.segmentation.segment_summary(
+            stations_df, station_labels, evc.segmentation.STATION_SEGMENT_FEATURES
+        )
+        station_summary.index = [f"Segment {segment + 1}" for segment in station_summary.index]
+        st.dataframe(station_summary.round(2).rename(columns=labels), use_container_width=True)
+
+def show_location_result(analysis, demand_model=None):
+    """analyze_location sonucunu puan kartı, detaylar ve önerilerle göster"""
+    # Potansiyel skoru
+    if analysis['potential_score'] >= 7:
+        st.markdown(f'<div class="success-card"><h4>🟢 Yüksek Potansiyel</h4><p>Puan: {analysis["potential_score"]}/10</p></div>', unsafe_allow_html=True)
+    elif analysis['potential_score'] >= 5:
+        st.markdown(f'<div class="warning-card"><h4>🟡 Orta Potansiyel</h4><p>Puan: {analysis["potential_score"]}/10</p></div>', unsafe_allow_html=True)
+    else:
+        st.markdown(f'<div class="danger-card"><h4>🔴 Düşük Potansiyel</h4><p>Puan: {analysis["potential_score"]}/10</p></div>', unsafe_allow_html=True)
+
+    st.markdown("---")
+
+    # Detaylı bilgiler
+    st.markdown("**📍 Konum Bilgileri:**")
+    st.write(f"• İl: {analysis['closest_city']}")
+    if analysis['district'] is not None:
+        st.write(f"• İlçe: {analysis['district']}")
+    st.write(f"• Yakındaki istasyon sayısı: {analysis['nearby_stations']}")
+    st.write(f"• Rekabet seviyesi: {analysis['competition_level']}")
+
+    if analysis['predicted_utilization'] is not None:
+        st.markdown("**🔮 Talep Tahmini:**")
+        st.write(f"• Tahmini kullanım oranı: %{analysis['predicted_utilization'] * 100:.0f}")
+        st.write(f"• Tahmini günlük gelir: ₺{analysis['predicted_daily_revenue']:,.0f}")
+        scores = demand_model.cv_results
+        st.caption(
+            f"{evc.forecasting.SITE_POWER_KW} kW, {evc.forecasting.SITE_SOCKETS} soketli istasyon için; "
+            f"model çapraz doğrulama R²: kullanım {scores['kullanim_orani']['r2']:.2f}, gelir {scores['gunluk_gelir']['r2']:.2f}"
+        )
+
+    if analysis['demographic_data'] is not None:
+        demo = analysis['demographic_data']
+        st.markdown("**👥 Demografik Veriler:**")
+        st.write(f"• Nüfus: {demo['nufus']:,}")
+        st.write(f"• Ortalama gelir: ₺{demo['ortalama_gelir']:,}")
+        st.write(f"• EV oranı: %{demo['elektrikli_arac_orani']:.1%}")
+        st.write(f"• Trafik yoğunluğu: %{demo['trafik_yogunlugu']:.0%}")
+
+    # Öneriler
+    st.markdown("**💡 Öneriler:**")
+    if analysis['potential_score'] >= 7:
+        st.success("✅ Bu lokasyon yatırım için çok uygun!")
+        st.write("• Hemen yatırım planlaması yapabilirsiniz")
+        st.write("• Yüksek DC güçlü istasyon önerilir")
+    elif analysis['potential_score'] >= 5:
+        st.warning("⚠️ Bu lokasyon dikkatli değerlendirme gerektirir")
+        st.write("• Detaylı pazar araştırması yapın")
+        st.write("• Orta güçlü istasyonla başlayın")
+    else:
+        st.error("❌ Bu lokasyon için yatırım önerilmez")
+        st.write("• Alternatif lokasyonları değerlendirin")
+        st.write("• Pazar gelişimini bekleyin")
+
+@timed()
+def show_site_planner(stations_df, demographic_df):
+    """Karşılanmamış talebi en çok artıracak N yeni lokasyonun seçimi"""
+    st.header("🧭 Çoklu Lokasyon Planı")
+    st.write(
+        "Talep; nüfus, elektrikli araç oranı ve trafik yoğunluğundan türetilir. Mevcut istasyonların "
+        "kapsama yarıçapındaki talep karşılanmış sayılır ve yeni lokasyonlar karşılanmamış talebi en çok "
+        "artıracak sırayla seçilir."
+    )
+
+    with st.form("site_plan_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            n_sites = st.slider("Yeni lokasyon sayısı:", 1, 200, 20)
+        with col2:
+            coverage_km = st.slider("Kapsama yarıçapı (km):", 2, 30, NEARBY_RADIUS_KM)
+        with col3:
+            resolution = st.selectbox("Aday ızgarası:", list(CANDIDATE_GRIDS))
+        if st.form_submit_button("🧭 Planı Hesapla", type="primary"):
+            st.session_state["site_plan_params"] = (n_sites, coverage_km, CANDIDATE_GRIDS[resolution])
+
+    params = st.session_state.get("site_plan_params")
+    if params is None:
+        st.info("Parametreleri seçip planı hesaplayın.")
+        return
+
+    n_sites, coverage_km, resolution_deg = params
+    # Kapsama listeleri yarıçapın karesiyle büyür; çift sınırını aşan birleşimlerde ilk uygun kaba ızgara kullanılır
+    demand_count = len(get_demand_points(demographic_df))
+    allowed = [
+        grid for grid in CANDIDATE_GRIDS.values()
+        if grid >= resolution_deg
+        and evc.placement.coverage_pair_estimate(demand_count, coverage_km, grid) <= evc.placement.MAX_COVERAGE_PAIRS
+    ]
+    effective_resolution = allowed[0] if allowed else max(CANDIDATE_GRIDS.values())
+    if effective_resolution != resolution_deg:
+        label = next(label for label, grid in CANDIDATE_GRIDS.items() if grid == effective_resolution)
+        st.info(f"{coverage_km} km kapsama yarıçapında hesaplama süresini ve belleği sınırlamak için {label} aday ızgarası kullanıldı.")
+        resolution_deg = effective_resolution
+    version = evc.data.dataset_version(stations_df)
+    with span("select_sites"):
+        plan_result = compute_site_plan(version, n_sites, coverage_km, resolution_deg, stations_df, demographic_df)
+    sites = plan_result['sites']
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Mevcut Kapsama", f"%{plan_result['initial_coverage'] * 100:.1f}")
+    with col2:
+        st.metric(
+            "Plan Sonrası Kapsama", f"%{plan_result['final_coverage'] * 100:.1f}",
+            f"+{(plan_result['final_coverage'] - plan_result['initial_coverage']) * 100:.1f} puan"
+        )
+    with col3:
+        st.metric("Seçilen Lokasyon", len(sites))
+    with col4:
+        st.metric("Değerlendirilen Aday", f"{plan_result['candidates_considered']:,}")
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        with span("map_build"):
+            view = get_map_view("placement_map")
+            layer_plan = evc.maps.plan_station_layer(len(stations_df), "Otomatik", view)
+            m = evc.maps.base_map(view)
+            layer_caption = cached_layer(
+                m, (version, layer_plan, "circle"), view,
+                lambda layer_map: evc.maps.add_station_layer(layer_map, stations_df, layer_plan, marker_style="circle")
+            )
+            cached_layer(m, (version, "sites", params), view, lambda layer_map: evc.maps.add_site_layer(layer_map, sites, coverage_km))
+        with span("st_folium"):
+            map_data = st_folium(m, width=700, height=500, key="placement_map", returned_objects=["zoom", "bounds", "center"])
+        st.caption(layer_caption)
+        update_map_view("placement_map", map_data, len(stations_df), "Otomatik", layer_plan)
+
+    with col2:
+        fig_coverage = cached_figure(
+            (version, "coverage_curve", params), lambda: evc.charts.coverage_curve(sites, plan_result['initial_coverage'])
+        )
+        st.plotly_chart(fig_coverage, use_container_width=True)
+
+    sites_display = sites.assign(
+        lat=sites['lat'].round(4),
+        lng=sites['lng'].round(4),
+        kazanc=(sites['kazanc'] / plan_result['total_demand'] * 100).round(2),
+        kumulatif_kapsama=(sites['kumulatif_kapsama'] * 100).round(1)
+    )
+    st.dataframe(
+        sites_display,
+        column_config={
+            "sira": "Sıra",
+            "lat": "Enlem",
+            "lng": "Boylam",
+            "kazanc": "Ek Kapsama (puan)",
+            "kumulatif_kapsama": "Kümülatif Kapsama (%)",
+            "sehir": "İl"
+        },
+        use_container_width=True,
+        hide_index=True
+    )
+
+@timed()
+def show_competitor_analysis(stations_df):
+    """Operatör performansı ve pazar fırsatları"""
+    st.header("🏆 Rakip Analizi")
+
+    # Operatör performans analizi; seri deposu varsa seçili dönemin enerji, doluluk ve büyümesi eklenir
+    version = evc.data.dataset_version(stations_df)
+    store = get_timeseries_store(evc.data.base_version(version), stations_df)
+    aggregates = get_station_aggregates(version, stations_df)
+    operator_analysis = aggregates.operator_performance()
+    if store is not None:
+        period = period_selector(store, "competitor", default_days=90)
+        activity = store.activity(stations_df, 'operatör', *period)
+        operator_analysis = operator_analysis.join(activity.round({"enerji_mwh": 1, "doluluk": 3, "buyume": 3}))
+    operator_analysis = operator_analysis.rename(columns={**evc.analytics.OPERATOR_PERFORMANCE_LABELS, **evc.timeseries.ACTIVITY_LABELS})
+
+    st.subheader("Operatör Performans Tablosu")
+    st.dataframe(operator_analysis, use_container_width=True)
+
+    # Görselleştirmeler
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Pazar payı
+        fig_market_share = cached_figure(
+            (version, "market_share_pie"),
+            lambda: evc.charts.distribution_pie(aggregates.counts('operatör'), "Pazar Payı (İstasyon Sayısı)")
+        )
+        st.plotly_chart(fig_market_share, use_container_width=True)
+
+    with col2:
+        # Gelir karşılaştırması
+        fig_revenue = cached_figure((version, "operator_revenue_bar"), lambda: evc.charts.operator_revenue_bar(operator_analysis))
+        st.plotly_chart(fig_revenue, use_container_width=True)
+
+    if store is not None:
+        # Seçili dönemde operatör başına haftalık enerji
+        fig_energy = cached_figure(
+            (version, "operator_energy_trend", period),
+            lambda: evc.charts.operator_energy_trend(store.group_series("energy", "W", stations_df, 'operatör', *period))
+        )
+        st.plotly_chart(fig_energy, use_container_width=True)
+
+    # SWOT Analizi
+    st.subheader("🎯 Pazar Fırsatları")
+
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        st.markdown("""
+        <div class="success-card">
+        <h4>🟢 Güçlü Yönler</h4>
+        <ul>
+        <li>Artan EV satışları</li>
+        <li>Devlet teşvikleri</li>
+        <li>Çevre bilinci</li>
+        <li>Teknoloji gelişimi</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col2:
+        st.markdown("""
+        <div class="warning-card">
+        <h4>🟡 Fırsatlar</h4>
+        <ul>
+        <li>Yeni şehirler</li>
+        <li>Hızlı şarj teknolojisi</li>
+        <li>Mobil uygulamalar</li>
+        <li>Enerji depolama</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+    with col3:
+        st.markdown("""
+        <div class="danger-card">
+        <h4>🔴 Tehditler</h4>
+        <ul>
+        <li>Yoğun rekabet</li>
+        <li>Düzenleyici değişiklikler</li>
+        <li>Teknoloji eskimesi</li>
+        <li>Elektrik maliyetleri</li>
+        </ul>
+        </div>
+        """, unsafe_allow_html=True)
+
+@timed()
+def show_roi_calculator():
+    """Yatırım getirisi hesaplayıcı"""
+    st.header("💰 Yatırım Getirisi Hesaplayıcı")
+
+    col1, col2 = st.columns([1, 2])
+
+    with col1:
+        st.subheader("Yatırım Parametreleri")
+
+        # Yatırım parametreleri
+        station_type = st.selectbox("İstasyon Tipi:", evc.roi.STATION_TYPES)
+
+        num_sockets = st.slider("Soket Sayısı:", 2, 12, 4)
+
+        total_investment = evc.roi.total_investment(station_type, num_sockets)
+
+        st.metric("Toplam Yatırım:", f"₺{total_investment:,}")
+
+        # Gelir parametreleri
+        st.subheader("Gelir Parametreleri")
+
+        revenue_model = st.radio("Gelir modeli:", ["Kuyruk simülasyonu", "Sabit kullanım saati"], horizontal=True)
+        queue_options = {}
+        if revenue_model == "Sabit kullanım saati":
+            daily_usage_hours = st.slider("Günlük Kullanım Saati:", 1, 24, 8)
+        else:
+            daily_usage_hours = None
+            queue_options = {
+                "arrivals_per_day": st.slider("Günlük Araç Talebi:", 5, 300, 40),
+                "session_energy_kwh": st.slider("Oturum Başına Enerji (kWh):", 10, 80, 30),
+                "patience_minutes": st.slider("Bekleme Toleransı (dk):", 0, 30, 10)
+            }
+        price_per_kwh = st.slider("kWh Başına Fiyat (₺):", 3.0, 15.0, 7.5)
+
+        # Maliyetler
+        st.subheader("İşletme Maliyetleri")
+        monthly_electricity_cost = st.number_input("Aylık Elektrik Maliyeti (₺):", 5000, 50000, 15000)
+        monthly_maintenance = st.number_input("Aylık Bakım Maliyeti (₺):", 2000, 20000, 5000)
+        monthly_rent = st.number_input("Aylık Kira/Arsa Maliyeti (₺):", 5000, 50000, 12000)
+
+    with col2:
+        st.subheader("📊 Finansal Projeksiyonlar")
+
+        # Gelir, maliyet ve ROI hesaplama
+        roi_data = evc.analytics.roi_scenario(
+            station_type, num_sockets, daily_usage_hours, price_per_kwh,
+            monthly_electricity_cost, monthly_maintenance, monthly_rent, years=5, **queue_options
+        )
+        power_kw = roi_data['power_kw']
+        # Simülasyonda gerçekleşen enerji, Monte Carlo ve duyarlılık analizine eşdeğer kullanım saati olarak girer
+        daily_usage_hours = roi_data['daily_usage_hours']
+        monthly_revenue = roi_data['monthly_revenue']
+        total_monthly_cost = roi_data['monthly_cost']
+        monthly_profit = roi_data['monthly_profit']
+
+        # Metrikleri göster
+        col2_1, col2_2 = st.columns(2)
+
+        with col2_1:
+            st.metric("Aylık Gelir", f"₺{monthly_revenue:,.0f}")
+            st.metric("Aylık Maliyet", f"₺{total_monthly_cost:,.0f}")
+            st.metric("Aylık Kar", f"₺{monthly_profit:,.0f}")
+
+        with col2_2:
+            st.metric("5 Yıllık ROI", f"%{roi_data['roi']:.1f}")
+            st.metric("Geri Ödeme Süresi", f"{roi_data['payback_period']:.1f} yıl")
+            st.metric("Yıllık Kar", f"₺{roi_data['annual_profit']:,.0f}")
+
+        if queue_options:
+            show_queue_results(roi_data, station_type, num_sockets, queue_options, price_per_kwh, total_monthly_cost)
+
+        # Finansal grafik
+        years = list(range(1, 6))
+        cumulative_profit = [roi_data['annual_profit'] * year - total_investment for year in years]
+        st.plotly_chart(evc.charts.profit_projection(years, cumulative_profit), use_container_width=True)
+
+        # Monte Carlo risk analizi
+        show_roi_simulation(total_investment, power_kw, daily_usage_hours, num_sockets, price_per_kwh, total_monthly_cost)
+
+        # Yatırım önerisi
+        show_investment_recommendation(roi_data['roi'])
+
+    # Tüm parametre kombinasyonları üzerinde duyarlılık analizi
+    show_sensitivity_analysis({
+        "station_type": station_type,
+        "num_sockets": num_sockets,
+        "daily_usage_hours": daily_usage_hours,
+        "price_per_kwh": price_per_kwh,
+        "monthly_electricity_cost": monthly_electricity_cost,
+        "monthly_maintenance": monthly_maintenance,
+        "monthly_rent": monthly_rent
+    })
+
+def show_queue_results(roi_data, station_type, num_sockets, queue_options, price_per_kwh, total_monthly_cost):
+    """Kuyruk simülasyonunun gerçekleşen enerji, doluluk ve kayıp talep sonuçları + soket sayısı taraması"""
+    st.markdown("**🚗 Kuyruk Simülasyonu** (2.000 simüle gün)")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Günlük Enerji", f"{roi_data['daily_energy_kwh']:,.0f} kWh")
+    with col2:
+        st.metric("Soket Doluluğu", f"%{roi_data['utilization'] * 100:.0f}")
+    with col3:
+        st.metric("Geri Çevrilen Araç", f"%{roi_data['turn_away_rate'] * 100:.1f}")
+    with col4:
+        st.metric("Eşdeğer Kullanım", f"{roi_data['daily_usage_hours']:.1f} saat")
+
+    with span("socket_sweep"):
+        sweep = compute_socket_sweep(
+            station_type, queue_options['arrivals_per_day'], queue_options['session_energy_kwh'],
+            queue_options['patience_minutes'], price_per_kwh, total_monthly_cost
+        )
+    st.plotly_chart(evc.charts.socket_sweep_chart(sweep, num_sockets), use_container_width=True)
+    best = int(sweep['roi'].idxmax())
+    if best != num_sockets:
+        st.info(f"💡 Bu talep düzeyinde en yüksek ROI {best} soketle elde ediliyor (%{sweep.loc[best, 'roi']:.1f}).")
+
+@timed()
+def show_roi_simulation(total_investment, power_kw, daily_usage_hours, num_sockets, price_per_kwh, total_monthly_cost):
+    """Kullanım, fiyat ve maliyet belirsizliği altında iskontolu nakit akışı analizi"""
+    st.subheader("🎲 Monte Carlo Risk Analizi")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        discount_rate = st.slider("Yıllık İskonto Oranı (%):", 0, 80, 25) / 100
+    with col2:
+        years = st.slider("Analiz Süresi (yıl):", 1, 15, 5)
+    with col3:
+        n_draws = st.select_slider("Senaryo Sayısı:", [10_000, 50_000, 100_000, 200_000], 100_000)
+
+    with st.expander("Belirsizlik varsayımları"):
+        col1, col2 = st.columns(2)
+        with col1:
+            usage_volatility = st.slider("Kullanım belirsizliği (σ):", 0.0, 1.0, 0.25)
+            monthly_volatility = st.slider("Aylık kullanım dalgalanması (σ):", 0.0, 0.5, 0.10)
+            ramp_up_months = st.slider("Kullanımın oturma süresi (ay):", 0, 24, 0)
+        with col2:
+            price_volatility = st.slider("Fiyat belirsizliği (σ):", 0.0, 0.5, 0.10)
+            cost_volatility = st.slider("Maliyet belirsizliği (σ):", 0.0, 0.5, 0.10)
+
+    simulation = evc.roi.simulate_roi(
+        total_investment, power_kw, daily_usage_hours, num_sockets, price_per_kwh, total_monthly_cost,
+        annual_discount_rate=discount_rate, years=years, n_draws=n_draws,
+        usage_volatility=usage_volatility, price_volatility=price_volatility, cost_volatility=cost_volatility,
+        monthly_volatility=monthly_volatility, ramp_up_months=ramp_up_months, seed=42
+    )
+    summary = evc.roi.simulation_summary(simulation)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Medyan NBD", f"₺{summary.loc['NPV (₺)', 'P50']:,.0f}")
+    with col2:
+        st.metric("NBD > 0 Olasılığı", f"%{(simulation['npv'] > 0).mean() * 100:.0f}")
+    with col3:
+        st.metric("Medyan IRR", format_rate(summary.loc['IRR (yıllık)', 'P50']))
+    with col4:
+        st.metric("Süre İçinde Geri Ödeme", f"%{np.isfinite(simulation['payback_months']).mean() * 100:.0f}")
+
+    st.plotly_chart(evc.charts.cash_flow_fan_chart(simulation['cumulative_bands']), use_container_width=True)
+
+    summary_display = pd.DataFrame({
+        "NBD": summary.loc['NPV (₺)'].map(lambda x: f"₺{x:,.0f}"),
+        "IRR (yıllık)": summary.loc['IRR (yıllık)'].map(format_rate),
+        "Geri Ödeme": summary.loc['Geri Ödeme (ay)'].map(format_months),
+        "İskontolu Geri Ödeme": summary.loc['İskontolu Geri Ödeme (ay)'].map(format_months)
+    })
+    summary_display.index.name = "Yüzdelik"
+    st.dataframe(summary_display, use_container_width=True)
+
+    st.plotly_chart(evc.charts.payback_histogram(simulation['payback_months'], simulation['n_months']), use_container_width=True)
+
+@timed()
+def show_sensitivity_analysis(base):
+    """ROI formülünün tüm parametre ızgarası üzerinde tornado ve ısı haritaları"""
+    st.subheader("📐 Duyarlılık Analizi")
+
+    with st.expander("Izgara çözünürlüğü"):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            price_step = st.select_slider("kWh fiyat adımı (₺):", [0.25, 0.5, 1.0], 0.5)
+        with col2:
+            electricity_points = st.slider("Elektrik maliyeti noktası:", 2, 10, 4)
+        with col3:
+            maintenance_points = st.slider("Bakım maliyeti noktası:", 2, 10, 3)
+        with col4:
+            rent_points = st.slider("Kira maliyeti noktası:", 2, 10, 3)
+
+    axes = evc.roi.sensitivity_axes(price_step, (electricity_points, maintenance_points, rent_points))
+    axes_key = tuple((name, tuple(np.asarray(values).tolist())) for name, values in axes.items())
+    grid = compute_sensitivity_grid(axes_key)
+    st.caption(f"{grid.size:,} parametre kombinasyonu değerlendirildi; tablo değerleri en yakın ızgara noktasındandır.")
+
+    tornado, base_roi = evc.roi.tornado_table(grid, axes, base)
+    st.plotly_chart(evc.charts.tornado_chart(tornado, base_roi), use_container_width=True)
+
+    labels = evc.roi.SENSITIVITY_PARAMETERS
+    names = list(labels)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        x = st.selectbox("Yatay eksen:", names, names.index("daily_usage_hours"), format_func=labels.get)
+    with col2:
+        y_options = [name for name in names if name != x]
+        y_default = y_options.index("price_per_kwh") if "price_per_kwh" in y_options else 0
+        y = st.selectbox("Dikey eksen:", y_options, y_default, format_func=labels.get)
+    with col3:
+        threshold = st.number_input("Hedef ROI (%):", value=20)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        st.plotly_chart(evc.charts.sensitivity_heatmap(
+            evc.roi.grid_slice(grid, axes, base, x, y),
+            "ROI (%) - diğer parametreler mevcut değerlerde", labels[x], labels[y], "ROI (%)"
+        ), use_container_width=True)
+    with col2:
+        st.plotly_chart(evc.charts.sensitivity_heatmap(
+            evc.roi.share_above(grid, axes, x, y, threshold) * 100,
+            f"Tüm kombinasyonlarda ROI > %{threshold} oranı", labels[x], labels[y], "Oran (%)"
+        ), use_container_width=True)
+
+def format_rate(rate):
+    """Yıllık oranı yüzde olarak biçimlendir; aralık dışı değerler için sınırı göster"""
+    low, high = evc.roi.IRR_ANNUAL_RANGE
+    if np.isposinf(rate):
+        return f"> %{high * 100:.0f}"
+    if np.isneginf(rate):
+        return f"< %{low * 100:.0f}"
+    if np.isnan(rate):
+        return "Tanımsız"
+    return f"%{rate * 100:.1f}"
+
+def format_months(months):
+    """Ay sayısını biçimlendir; ufuk içinde gerçekleşmeyen geri ödemeyi belirt"""
+    return f"{months:.0f} ay" if np.isfinite(months) else "Ufuk dışı"
+
+def show_investment_recommendation(roi):
+    """ROI yüzdesine göre yatırım önerisi kartı"""
+    if roi > 50:
+        st.markdown("""
+        <div class="success-card">
+        <h4>🟢 Yatırım Önerisi: ÇOK UYGUN</h4>
+        <p>Yüksek getiri oranı ile çok cazip bir yatırım fırsatı!</p>
+        </div>
+        """, unsafe_allow_html=True)
+    elif roi > 20:
+        st.markdown("""
+        <div class="warning-card">
+        <h4>🟡 Yatırım Önerisi: UYGUN</h4>
+        <p>Makul getiri oranı ile değerlendirilebilir bir yatırım.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="danger-card">
+        <h4>🔴 Yatırım Önerisi: RİSKLİ</h4>
+        <p>Düşük getiri oranı, alternatif lokasyonları değerlendirin.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+@timed()
+def show_report_builder(stations_df, demographic_df):
+    """Şehir bazında detaylı analiz raporu (arka planda üretilir, önbellekten sunulur)"""
+    st.header("📋 Detaylı Analiz Raporu")
+
+    # Rapor parametreleri
+    col1, col2 = st.columns(2)
+
+    with col1:
+        report_city = st.selectbox("Rapor için şehir seçin:", demographic_df['sehir'].unique())
+        report_type = st.selectbox("Rapor tipi:", evc.reporting.REPORT_TYPES)
+
+    with col2:
+        include_maps = st.checkbox("Harita ekle", True)
+        include_financials = st.checkbox("Finansal analiz ekle", True)
+
+    service = get_report_service()
+    version = evc.data.dataset_version(stations_df)
+    if st.button("📊 Rapor Oluştur", type="primary"):
+        st.session_state["report_key"] = service.key(report_city, report_type, include_maps, include_financials, version)
+        service.submit(
+            report_city, report_type, include_maps, include_financials, version, demographic_df, stations_df,
+            aggregates=get_station_aggregates(version, stations_df)
+        )
+
+    # Son istenen rapor yeniden çalıştırmalarda da (ör. indirme sonrası) gösterilir
+    key = st.session_state.get("report_key")
+    future = service.get(key) if key is not None and key[-1] == version else None
+    if future is None:
+        return
+
+    if not future.done():
+        with st.spinner("Rapor hazırlanıyor..."):
+            future.result()
+    report = future.result()
+    show_report(report)
+
+    # Rapor indirme butonları
+    st.markdown("---")
+    file_name = f"{report['city']}-analiz-raporu"
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col1:
+        st.download_button("🌐 HTML Olarak İndir", report['html'], f"{file_name}.html", "text/html")
+    with col2:
+        st.download_button("📄 PDF Olarak İndir", report['pdf'], f"{file_name}.pdf", "application/pdf", type="secondary")
+
+def show_report(report):
+    """Hazırlanmış rapor içeriğini göster"""
+    st.markdown("---")
+
+    # Rapor başlığı
+    st.markdown(f"""
+    # 📋 {report['city']} Elektrikli Şarj İstasyonu Analiz Raporu
+
+    **Rapor Tarihi:** {report['report_date']}  
+    **Rapor Tipi:** {report['report_type']}  
+    **Hazırlayan:** EV Charging Analytics System
+    """)
+
+    # Özet bilgiler
+    st.markdown("## 📊 Özet Bilgiler")
+
+    for column, (label, value) in zip(st.columns(4), report['metrics'].items()):
+        with column:
+            st.metric(label, value)
+
+    # Pazar analizi
+    st.markdown("## 🎯 Pazar Analizi")
+    st.markdown(f"**{report['city']}** şehri elektrikli şarj istasyonu yatırımı için aşağıdaki özelliklere sahiptir:")
+    st.markdown(format_report_items(report['market']))
+
+    # Rekabet analizi
+    if report['competition']:
+        st.markdown("## 🏆 Rekabet Durumu")
+        st.markdown(format_report_items(report['competition']))
+
+        # Operatör dağılımı grafiği
+        operator_dist = pd.Series(report['operator_distribution'])
+        if len(operator_dist) > 1:
+            fig_operators = evc.charts.distribution_pie(operator_dist, f"{report['city']} - Operatör Dağılımı")
+            st.plotly_chart(fig_operators, use_container_width=True)
+
+    # İstasyon haritası (eğer seçildiyse)
+    if 'map' in report['images']:
+        st.markdown("## 🗺️ İstasyon Haritası")
+        st.image(report['images']['map'])
+
+    # SWOT Analizi
+    st.markdown("## 🎯 SWOT Analizi")
+
+    swot = list(report['swot'].items())
+    for column, quadrants in zip(st.columns(2), (swot[:2], swot[2:])):
+        with column:
+            for title, entries in quadrants:
+                st.markdown(f"### {title}")
+                st.markdown("\n".join(f"- {entry}" for entry in entries))
+
+    # Finansal öngörüler (eğer seçildiyse)
+    if report['financials']:
+        st.markdown("## 💰 Finansal Öngörüler")
+        st.markdown("**Örnek Yatırım Senaryosu (DC 50kW, 4 Soket):**")
+        st.markdown(format_report_items(report['financials']))
+
+    # Öneriler
+    st.markdown("## 💡 Öneriler ve Sonuç")
+
+    st.markdown(f"""
+    <div class="{report['recommendation_level']}-card">
+    <h4>🎯 Genel Değerlendirme</h4>
+    <p>{report['recommendation']}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown("### 📋 Eylem Planı:")
+    st.markdown("\n".join(
+        f"{number}. **{action}** {detail}" for number, (action, detail) in enumerate(report['action_plan'], start=1)
+    ))
+
+def format_report_items(items):
+    """(etiket, değer) çiftlerini Markdown madde listesine dönüştür"""
+    return "\n".join(f"- **{label}:** {value}" for label, value in items)